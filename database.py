@@ -1,5 +1,4 @@
 import sqlite3
-import os
 import logging
 from datetime import datetime
 from contextlib import contextmanager
@@ -14,6 +13,26 @@ logger = logging.getLogger("database")
 
 DB_NAME = "animals.db"
 
+# Stay well below SQLite's default limit of 999 bound parameters per statement
+MAX_QUERY_PARAMS = 500
+
+# Tables whose changes are recorded in change_log, with their animal ID column
+CHANGE_TRACKED_TABLES = {
+    'animals': 'id',
+    'weight_history': 'animal_id',
+    'assessments': 'animal_id',
+}
+
+# How long change_log rows are kept at least, as a SQLite datetime modifier
+CHANGE_LOG_RETENTION = '-1 day'
+
+# Tables whose rows appear in the assessments list
+ASSESSMENT_LIST_TABLES = ('assessments', 'animals')
+
+# Condition matching assessment results not yet stored in the compact format
+# (see result_codec); queries must repeat it verbatim to use the partial index
+UNCOMPACTED_RESULT = "substr(result, 1, 1) <> '@'"
+
 
 @contextmanager
 def get_db_connection():
@@ -65,6 +84,40 @@ def execute_query(query, params=(), fetch_mode=None):
         return None if fetch_mode else False
 
 
+def iter_query(query, params=(), batch_size=500):
+    """
+    Stream the rows of a query without loading the whole result into memory.
+
+    Args:
+        query (str): SQL query to execute
+        params (tuple): Parameters for the query
+        batch_size (int): Number of rows fetched from SQLite at a time
+
+    Yields:
+        tuple: One result row at a time
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+
+
+def chunked(values, size=MAX_QUERY_PARAMS):
+    """Split a sequence into lists of at most `size` items, e.g. for IN (...) lists."""
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def placeholders(count):
+    """Return a comma separated list of `count` SQL parameter placeholders."""
+    return ", ".join("?" * count)
+
+
 def create_tables():
     """Create the database tables if they don't exist."""
     try:
@@ -107,6 +160,123 @@ def create_tables():
                     date TEXT NOT NULL,
                     scale_used TEXT NOT NULL,
                     result TEXT NOT NULL,
+                    scale_version INTEGER,
+                    score INTEGER,
+                    interpretation TEXT,
+                    FOREIGN KEY (animal_id) REFERENCES animals(id) ON DELETE CASCADE
+                )
+            ''')
+
+            # Change log feeding incremental exports, filled by triggers
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS change_log (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    table_name TEXT NOT NULL,
+                    row_id INTEGER NOT NULL,
+                    animal_id INTEGER,
+                    operation TEXT NOT NULL CHECK(operation IN ('upsert', 'delete')),
+                    changed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_change_log_table_seq ON change_log(table_name, seq)'
+            )
+
+            # Holds a row only inside transactions that rewrite rows without
+            # changing their content; the change log triggers skip those writes
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS change_log_suspended (
+                    id INTEGER PRIMARY KEY CHECK(id = 1)
+                )
+            ''')
+
+            # Last exported change per incremental export destination
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS export_watermarks (
+                    destination TEXT PRIMARY KEY,
+                    last_seq INTEGER NOT NULL,
+                    exported_at TEXT NOT NULL
+                )
+            ''')
+
+            # Persistent export job queue
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS export_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    format TEXT NOT NULL,
+                    status TEXT NOT NULL
+                        CHECK(status IN ('queued', 'running', 'done', 'failed', 'cancelled')),
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    error TEXT
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS export_job_items (
+                    job_id INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    animal_id INTEGER NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending'
+                        CHECK(status IN ('pending', 'done', 'failed')),
+                    outputs TEXT,
+                    PRIMARY KEY (job_id, position),
+                    FOREIGN KEY (job_id) REFERENCES export_jobs(id) ON DELETE CASCADE
+                )
+            ''')
+
+            # Last rendered PDF per animal, dropped whenever the animal's data changes
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS pdf_render_cache (
+                    animal_id INTEGER PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    rendered_at TEXT NOT NULL
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_change_log_invalidate_render
+                AFTER INSERT ON change_log
+                BEGIN
+                    DELETE FROM pdf_render_cache WHERE animal_id = NEW.animal_id;
+                END
+            ''')
+
+            # Report content prepared at save time, dropped whenever its data changes
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS report_fragments (
+                    kind TEXT NOT NULL CHECK(kind IN ('assessment', 'weight_summary')),
+                    ref_id INTEGER NOT NULL,
+                    animal_id INTEGER NOT NULL,
+                    version INTEGER NOT NULL,
+                    content TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (kind, ref_id)
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_change_log_invalidate_fragments
+                AFTER INSERT ON change_log
+                WHEN NEW.table_name IN ('assessments', 'weight_history')
+                BEGIN
+                    DELETE FROM report_fragments
+                    WHERE (NEW.table_name = 'assessments' AND kind = 'assessment' AND ref_id = NEW.row_id)
+                       OR (NEW.table_name = 'weight_history' AND kind = 'weight_summary'
+                           AND ref_id = NEW.animal_id);
+                END
+            ''')
+
+            # Unfinished assessments, one per animal and scale
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS assessment_drafts (
+                    animal_id INTEGER NOT NULL,
+                    scale_used TEXT NOT NULL,
+                    answers TEXT NOT NULL,
+                    question_index INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (animal_id, scale_used),
                     FOREIGN KEY (animal_id) REFERENCES animals(id) ON DELETE CASCADE
                 )
             ''')
@@ -123,6 +293,79 @@ def create_tables():
                 cursor.execute('ALTER TABLE animals ADD COLUMN target_date TEXT')
                 logger.info("Added target_date column to animals table")
 
+            cursor.execute("PRAGMA table_info(assessments)")
+            assessment_columns = [col[1] for col in cursor.fetchall()]
+
+            # Triggers created before change logging could be suspended are replaced
+            log_trigger = cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_assessments_update_log'"
+            ).fetchone()
+            outdated_triggers = log_trigger is not None and 'change_log_suspended' not in log_trigger[0]
+
+            if outdated_triggers or 'scale_version' not in assessment_columns or 'score' not in assessment_columns:
+                # Backfilling new columns changes no data, so databases that
+                # already have the change log triggers must not log it;
+                # they are created again below, with the current definition
+                for table_name in CHANGE_TRACKED_TABLES:
+                    for event in ('insert', 'update', 'delete'):
+                        cursor.execute(f'DROP TRIGGER IF EXISTS trg_{table_name}_{event}_log')
+
+            if 'scale_version' not in assessment_columns:
+                # Every scale was at version 1 before versions were recorded
+                cursor.execute('ALTER TABLE assessments ADD COLUMN scale_version INTEGER')
+                cursor.execute('UPDATE assessments SET scale_version = 1')
+                logger.info("Added scale_version column to assessments table")
+
+            if 'score' not in assessment_columns:
+                # Score and interpretation as columns so reports can aggregate
+                # them without decoding results
+                cursor.execute('ALTER TABLE assessments ADD COLUMN score INTEGER')
+                cursor.execute('ALTER TABLE assessments ADD COLUMN interpretation TEXT')
+                cursor.execute('''
+                    UPDATE assessments
+                    SET score = json_extract(result, '$.score'),
+                        interpretation = json_extract(result, '$.interpretation')
+                    WHERE json_valid(result) AND json_type(result) = 'object'
+                ''')
+                logger.info("Added score and interpretation columns to assessments table")
+
+            # Change log triggers, created after the migrations above
+            for table_name, animal_column in CHANGE_TRACKED_TABLES.items():
+                for event, operation, ref in (('INSERT', 'upsert', 'NEW'),
+                                              ('UPDATE', 'upsert', 'NEW'),
+                                              ('DELETE', 'delete', 'OLD')):
+                    cursor.execute(f'''
+                        CREATE TRIGGER IF NOT EXISTS trg_{table_name}_{event.lower()}_log
+                        AFTER {event} ON {table_name}
+                        WHEN NOT EXISTS (SELECT 1 FROM change_log_suspended)
+                        BEGIN
+                            INSERT INTO change_log (table_name, row_id, animal_id, operation)
+                            VALUES ('{table_name}', {ref}.id, {ref}.{animal_column}, '{operation}');
+                        END
+                    ''')
+
+            # Index used to reference-count stored images
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_animals_image_path ON animals(image_path)')
+
+            # Indexes for per-animal lookups of history rows
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_weight_history_animal ON weight_history(animal_id, date)'
+            )
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_assessments_animal ON assessments(animal_id, date)'
+            )
+
+            # Newest-first keyset paging of the assessments list
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_assessments_date ON assessments(date, id)'
+            )
+
+            # Results not yet in the compact format, for the result migration
+            cursor.execute(f'''
+                CREATE INDEX IF NOT EXISTS idx_assessments_uncompacted ON assessments(id)
+                WHERE {UNCOMPACTED_RESULT}
+            ''')
+
             conn.commit()
             logger.info("Database tables created or verified successfully")
             return True
@@ -217,34 +460,29 @@ def update_animal(animal_id, name, species, breed, birthday, sex, castrated, wei
 
 
 def delete_animal(animal_id):
-    """Delete an animal and its related records."""
+    """
+    Delete an animal and its related records.
+
+    The image file is left in place; it is removed by the image store's
+    garbage collection once no other animal references it.
+    """
     try:
-        # Get image path to delete file
-        image_path = execute_query(
-            "SELECT image_path FROM animals WHERE id = ?",
+        exists = execute_query(
+            "SELECT id FROM animals WHERE id = ?",
             (animal_id,),
             fetch_mode='one'
         )
 
-        if not image_path:
+        if not exists:
             logger.warning(f"Animal ID {animal_id} not found for deletion")
             return False
 
-        image_path = image_path[0]
-
         # Delete the animal (cascading delete will handle related records)
         success = execute_query(
             "DELETE FROM animals WHERE id = ?",
             (animal_id,)
         )
 
-        if success and image_path and os.path.exists(image_path):
-            try:
-                os.remove(image_path)
-                logger.info(f"Deleted image file: {image_path}")
-            except OSError as e:
-                logger.error(f"Error deleting image file {image_path}: {e}")
-
         logger.info(f"Deleted animal ID {animal_id} successfully")
         return success
     except Exception as e:
@@ -311,11 +549,20 @@ def delete_weight_record(weight_id):
 
 
 # Assessment Operations
-def add_assessment(animal_id, date, scale_used, result):
-    """Add a new assessment for an animal."""
+def add_assessment(animal_id, date, scale_used, result, scale_version=None, score=None, interpretation=None):
+    """
+    Add a new assessment for an animal and return its ID (False on failure).
+
+    scale_version records which version of a registry scale was used; it,
+    score and interpretation are None for free-form assessments that do not
+    use a registry scale.
+    """
     success = execute_query(
-        "INSERT INTO assessments (animal_id, date, scale_used, result) VALUES (?, ?, ?, ?)",
-        (animal_id, date, scale_used, result)
+        """
+        INSERT INTO assessments (animal_id, date, scale_used, result, scale_version, score, interpretation)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (animal_id, date, scale_used, result, scale_version, score, interpretation)
     )
 
     if success:
@@ -324,6 +571,91 @@ def add_assessment(animal_id, date, scale_used, result):
     return success
 
 
+def add_assessment_logged(assessment, table_names):
+    """
+    Add an assessment and return its position in change_log.
+
+    Views showing the result of a query can then add the new row themselves
+    when nothing else they depend on changed since they were loaded.
+
+    Args:
+        assessment: (animal_id, date, scale_used, result, scale_version,
+            score, interpretation) tuple
+        table_names: Tables the view depends on
+
+    Returns:
+        tuple: (assessment ID, newest change to table_names before the
+        insert, change_log sequence number of the insert), or False on failure
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            # Holds the write lock, so no other change can fall in between
+            cursor.execute('BEGIN IMMEDIATE')
+
+            seq_before = cursor.execute(latest_change_seq_query(table_names), tuple(table_names)).fetchone()[0]
+            cursor.execute(
+                """
+                INSERT INTO assessments (animal_id, date, scale_used, result, scale_version, score, interpretation)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                assessment
+            )
+            assessment_id = cursor.lastrowid
+            seq = cursor.execute(latest_change_seq_query()).fetchone()[0]
+
+            conn.commit()
+            logger.info(f"Added assessment for animal ID {assessment[0]} using scale {assessment[2]} on {assessment[1]}")
+            return assessment_id, seq_before, seq
+    except sqlite3.Error as e:
+        logger.error(f"Error adding assessment: {e}")
+        return False
+
+
+def add_assessments(assessments, drafts=()):
+    """
+    Add several assessments in a single transaction.
+
+    Args:
+        assessments: (animal_id, date, scale_used, result, scale_version,
+            score, interpretation) tuples
+        drafts: (animal_id, scale_used) of assessment drafts to delete in the
+            same transaction, so a draft is only gone once its result is saved
+
+    Returns:
+        list: IDs of the new assessments in the given order, or False if
+        the transaction failed and nothing was added
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('BEGIN')
+
+            assessment_ids = []
+            for assessment in assessments:
+                cursor.execute(
+                    """
+                    INSERT INTO assessments
+                        (animal_id, date, scale_used, result, scale_version, score, interpretation)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    assessment
+                )
+                assessment_ids.append(cursor.lastrowid)
+
+            cursor.executemany(
+                "DELETE FROM assessment_drafts WHERE animal_id = ? AND scale_used = ?",
+                drafts
+            )
+
+            conn.commit()
+            logger.info(f"Added {len(assessment_ids)} assessments")
+            return assessment_ids
+    except sqlite3.Error as e:
+        logger.error(f"Error adding assessments: {e}")
+        return False
+
+
 def get_assessments(animal_id):
     """Get assessment history for an animal."""
     return execute_query(
@@ -359,5 +691,324 @@ def delete_assessment(assessment_id):
     return success
 
 
+# Incremental Export Operations
+def get_export_watermark(destination):
+    """Return the last exported change_log sequence for a destination, or None."""
+    result = execute_query(
+        "SELECT last_seq FROM export_watermarks WHERE destination = ?",
+        (destination,),
+        fetch_mode='one'
+    )
+    return result[0] if result else None
+
+
+def set_export_watermark(destination, last_seq):
+    """Record that all changes up to last_seq have been exported to a destination."""
+    success = execute_query(
+        """
+        INSERT INTO export_watermarks (destination, last_seq, exported_at)
+        VALUES (?, ?, ?)
+        ON CONFLICT(destination) DO UPDATE SET
+            last_seq = excluded.last_seq,
+            exported_at = excluded.exported_at
+        """,
+        (destination, last_seq, datetime.now().isoformat(timespec="seconds"))
+    )
+
+    if success:
+        logger.info(f"Export watermark for {destination} set to {last_seq}")
+
+    return success
+
+
+def latest_change_seq_query(table_names=None):
+    """
+    Return the query for the newest change_log sequence number.
+
+    Args:
+        table_names: Only consider changes to these tables, passed as the
+            query's parameters; all tables if None
+    """
+    if not table_names:
+        return "SELECT COALESCE(MAX(seq), 0) FROM change_log"
+    # One indexed lookup per table instead of scanning their log rows
+    per_table = ", ".join(
+        "COALESCE((SELECT MAX(seq) FROM change_log WHERE table_name = ?), 0)" for _ in table_names
+    )
+    return f"SELECT MAX({per_table}, 0)"
+
+
+def get_latest_change_seq(table_names=None):
+    """Return the newest change_log sequence number (0 if nothing changed yet)."""
+    result = execute_query(
+        latest_change_seq_query(table_names), tuple(table_names or ()), fetch_mode='one'
+    )
+    return result[0] if result else 0
+
+
+def prune_change_log(retention=CHANGE_LOG_RETENTION):
+    """
+    Drop change_log rows that nothing needs any more.
+
+    A row is kept until every known export destination has consumed it, and
+    for at least the retention period, as renders and report fragments
+    compare against log positions read while they were built. Without any
+    export destination only the retention period applies.
+
+    Args:
+        retention: SQLite datetime modifier, e.g. '-1 day'
+    """
+    return execute_query(
+        """
+        DELETE FROM change_log
+        WHERE changed_at < datetime('now', ?)
+          AND seq <= COALESCE((SELECT MIN(last_seq) FROM export_watermarks), seq)
+        """,
+        (retention,)
+    )
+
+
+# Export Job Operations
+def create_export_job(format_type, animal_ids):
+    """Create a queued export job with one pending item per animal."""
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('BEGIN')
+
+            now = datetime.now().isoformat(timespec="seconds")
+            cursor.execute(
+                "INSERT INTO export_jobs (format, status, created_at, updated_at) VALUES (?, 'queued', ?, ?)",
+                (format_type, now, now)
+            )
+            job_id = cursor.lastrowid
+
+            cursor.executemany(
+                "INSERT INTO export_job_items (job_id, position, animal_id) VALUES (?, ?, ?)",
+                [(job_id, position, animal_id) for position, animal_id in enumerate(animal_ids)]
+            )
+
+            conn.commit()
+            logger.info(f"Created {format_type} export job {job_id} for {len(animal_ids)} animal(s)")
+            return job_id
+    except sqlite3.Error as e:
+        logger.error(f"Error creating export job: {e}")
+        return None
+
+
+def get_export_job(job_id):
+    """Get an export job with its item counts: (id, format, status, error, total, done, failed)."""
+    return execute_query(
+        """
+        SELECT j.id, j.format, j.status, j.error,
+               COUNT(i.position),
+               COALESCE(SUM(i.status = 'done'), 0),
+               COALESCE(SUM(i.status = 'failed'), 0)
+        FROM export_jobs j
+        LEFT JOIN export_job_items i ON i.job_id = j.id
+        WHERE j.id = ?
+        GROUP BY j.id
+        """,
+        (job_id,),
+        fetch_mode='one'
+    )
+
+
+def get_unfinished_export_jobs():
+    """Get the IDs of export jobs that were queued or running when the app stopped."""
+    rows = execute_query(
+        "SELECT id FROM export_jobs WHERE status IN ('queued', 'running') ORDER BY id",
+        fetch_mode='all'
+    ) or []
+    return [row[0] for row in rows]
+
+
+def get_pending_export_items(job_id):
+    """Get the animal IDs of a job's items that have not been exported yet, in order."""
+    rows = execute_query(
+        "SELECT animal_id FROM export_job_items WHERE job_id = ? AND status = 'pending' ORDER BY position",
+        (job_id,),
+        fetch_mode='all'
+    ) or []
+    return [row[0] for row in rows]
+
+
+def get_export_job_outputs(job_id):
+    """Get the stored output lists (JSON text) of a job's finished items."""
+    rows = execute_query(
+        "SELECT outputs FROM export_job_items WHERE job_id = ? AND outputs IS NOT NULL ORDER BY position",
+        (job_id,),
+        fetch_mode='all'
+    ) or []
+    return [row[0] for row in rows]
+
+
+def update_export_items(job_id, animal_ids, status, outputs=None):
+    """Mark a job's items for the given animals as done or failed."""
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "UPDATE export_job_items SET status = ?, outputs = ? WHERE job_id = ? AND animal_id = ?",
+                [(status, outputs, job_id, animal_id) for animal_id in animal_ids]
+            )
+            conn.commit()
+            return True
+    except sqlite3.Error as e:
+        logger.error(f"Error updating items of export job {job_id}: {e}")
+        return False
+
+
+def set_export_job_status(job_id, status, error=None):
+    """Update the status of an export job."""
+    success = execute_query(
+        "UPDATE export_jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+        (status, error, datetime.now().isoformat(timespec="seconds"), job_id)
+    )
+
+    if success:
+        logger.info(f"Export job {job_id} is now {status}")
+
+    return success
+
+
+# PDF Render Cache Operations
+def get_cached_render(animal_id):
+    """Return (content_hash, path) of an animal's cached PDF render, or None."""
+    return execute_query(
+        "SELECT content_hash, path FROM pdf_render_cache WHERE animal_id = ?",
+        (animal_id,),
+        fetch_mode='one'
+    )
+
+
+def set_cached_render(animal_id, content_hash, path, since_seq):
+    """
+    Record the cached PDF render of an animal.
+
+    The entry is only stored if the animal's data did not change after
+    `since_seq`, the change_log position read before the render started,
+    so a render of stale data is never cached.
+    """
+    return execute_query(
+        """
+        INSERT OR REPLACE INTO pdf_render_cache (animal_id, content_hash, path, rendered_at)
+        SELECT ?, ?, ?, ?
+        WHERE NOT EXISTS (SELECT 1 FROM change_log WHERE animal_id = ? AND seq > ?)
+        """,
+        (animal_id, content_hash, path, datetime.now().isoformat(timespec="seconds"), animal_id, since_seq)
+    )
+
+
+def get_cached_render_paths():
+    """Return the set of file paths referenced by the PDF render cache."""
+    rows = execute_query("SELECT DISTINCT path FROM pdf_render_cache", fetch_mode='all')
+    if rows is None:
+        return None
+    return {row[0] for row in rows}
+
+
+# Report Fragment Operations
+def save_report_fragments(fragments, since_seq=None):
+    """
+    Store pre-rendered report fragments.
+
+    Args:
+        fragments: (kind, ref_id, animal_id, version, content) tuples
+        since_seq: If given, a fragment is only stored when its animal's data
+            did not change after this change_log position, so content built
+            from stale data is never kept
+    """
+    created_at = datetime.now().isoformat(timespec="seconds")
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            if since_seq is None:
+                cursor.executemany(
+                    """
+                    INSERT OR REPLACE INTO report_fragments
+                        (kind, ref_id, animal_id, version, content, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    [(*fragment, created_at) for fragment in fragments]
+                )
+            else:
+                cursor.executemany(
+                    """
+                    INSERT OR REPLACE INTO report_fragments
+                        (kind, ref_id, animal_id, version, content, created_at)
+                    SELECT ?, ?, ?, ?, ?, ?
+                    WHERE NOT EXISTS (SELECT 1 FROM change_log WHERE animal_id = ? AND seq > ?)
+                    """,
+                    [(*fragment, created_at, fragment[2], since_seq) for fragment in fragments]
+                )
+            conn.commit()
+            return True
+    except sqlite3.Error as e:
+        logger.error(f"Error saving report fragments: {e}")
+        return False
+
+
+def get_report_fragments(kind, ref_ids, version):
+    """Return {ref_id: content} for the stored fragments of the given kind and version."""
+    fragments = {}
+    for chunk in chunked(ref_ids):
+        rows = execute_query(
+            f"""
+            SELECT ref_id, content FROM report_fragments
+            WHERE kind = ? AND version = ? AND ref_id IN ({placeholders(len(chunk))})
+            """,
+            (kind, version, *chunk),
+            fetch_mode='all'
+        ) or []
+        fragments.update(rows)
+    return fragments
+
+
+# Assessment Draft Operations
+def save_assessment_draft(animal_id, scale_used, answers, question_index):
+    """
+    Create or update the draft of an unfinished assessment.
+
+    Args:
+        animal_id: Animal being assessed
+        scale_used: Name of the scale
+        answers: Answers so far in the compact result format (see result_codec)
+        question_index: Question the assessment should resume at
+    """
+    return execute_query(
+        """
+        INSERT INTO assessment_drafts (animal_id, scale_used, answers, question_index, updated_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(animal_id, scale_used) DO UPDATE SET
+            answers = excluded.answers,
+            question_index = excluded.question_index,
+            updated_at = excluded.updated_at
+        """,
+        (animal_id, scale_used, answers, question_index, datetime.now().isoformat(timespec="seconds"))
+    )
+
+
+def get_assessment_drafts():
+    """Return (animal_id, name, species, scale_used, answers, question_index, updated_at) of all drafts, newest first."""
+    return execute_query(
+        """
+        SELECT d.animal_id, n.name, n.species, d.scale_used, d.answers, d.question_index, d.updated_at
+        FROM assessment_drafts d
+        JOIN animals n ON d.animal_id = n.id
+        ORDER BY d.updated_at DESC
+        """,
+        fetch_mode='all'
+    ) or []
+
+
+def delete_assessment_draft(animal_id, scale_used):
+    """Delete the draft of an assessment, e.g. once it has been finished."""
+    return execute_query(
+        "DELETE FROM assessment_drafts WHERE animal_id = ? AND scale_used = ?",
+        (animal_id, scale_used)
+    )
+
+
 # Initialize database when module is imported
 create_tables()
\ No newline at end of file
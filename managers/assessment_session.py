@@ -0,0 +1,132 @@
+"""
+Batch assessment sessions.
+
+A session assesses a set of animals, e.g. a cage or cohort, with one scale
+in a row. The compiled scale is loaded once and results are kept in memory
+and written in bulk: one transaction per checkpoint of several animals and
+one for the rest when the session ends, all through the background writer so
+moving on to the next animal never waits for the database. Each animal's
+assessment draft is kept until its result is written, and is deleted in the
+same transaction, so answers survive a crash or a failed write.
+"""
+import logging
+from datetime import datetime
+
+import database
+from managers.report_fragments import report_fragments
+from result_codec import dump_result
+from scoring import resolve_scale, score_compiled
+from utils.async_writer import db_writer
+
+logger = logging.getLogger("assessment_session")
+
+# Results kept in memory before they are written in one transaction
+DEFAULT_CHECKPOINT_SIZE = 10
+
+
+class AssessmentSession:
+    """Scores a list of animals one after the other with the same scale."""
+
+    def __init__(self, animals, species, scale_name, checkpoint_size=DEFAULT_CHECKPOINT_SIZE):
+        """
+        Start a session.
+
+        Args:
+            animals: (animal_id, name) tuples in the order they are assessed
+            species: Species of all animals in the session
+            scale_name: Name of the scale used for every animal
+            checkpoint_size: Number of results written per transaction
+
+        Raises:
+            KeyError: If the species has no such scale
+        """
+        self.animals = list(animals)
+        self.species = species
+        self.scale = resolve_scale(species, scale_name)
+        self.checkpoint_size = checkpoint_size
+
+        self.position = 0
+        self.pending = []
+        self.results = []
+        self.saved = 0
+        self.failed = 0
+
+    @property
+    def current_animal(self):
+        """The (animal_id, name) being assessed, or None once all are done."""
+        return self.animals[self.position] if self.position < len(self.animals) else None
+
+    @property
+    def finished(self):
+        """True once every animal was assessed."""
+        return self.position >= len(self.animals)
+
+    def record(self, answers):
+        """
+        Score the current animal's answers and move on to the next animal.
+
+        Args:
+            answers: One option index per question; None for unanswered questions
+
+        Returns:
+            dict: The scored result, see scoring.score_compiled()
+        """
+        animal_id, name = self.current_animal
+        scored = score_compiled(self.scale, answers)
+        interpretation = scored["interpretation"]["text"]
+
+        self.pending.append((
+            animal_id,
+            datetime.now().strftime("%Y-%m-%d"),
+            self.scale.name,
+            dump_result(self.scale, answers, scored),
+            self.scale.version,
+            scored["total_score"],
+            interpretation
+        ))
+        self.results.append((animal_id, name, scored))
+        self.position += 1
+
+        if len(self.pending) >= self.checkpoint_size:
+            self.checkpoint()
+        return scored
+
+    def checkpoint(self, callback=None):
+        """
+        Write the results recorded since the last checkpoint in one transaction.
+
+        Args:
+            callback: Optional function called on the main thread once the
+                write has finished, with the session as its argument
+        """
+        rows, self.pending = self.pending, []
+
+        def written(assessment_ids):
+            if assessment_ids:
+                self.saved += len(assessment_ids)
+            else:
+                self.failed += len(rows)
+                logger.error(f"Could not save {len(rows)} session results; their drafts are kept")
+            if callback:
+                callback(self)
+
+        if not rows:
+            if callback:
+                callback(self)
+            return
+
+        db_writer.submit(self._write, rows, callback=written)
+
+    def _write(self, rows):
+        """Insert a batch of results, delete their drafts and prepare their report fragments."""
+        assessment_ids = database.add_assessments(rows, drafts=[(row[0], row[2]) for row in rows])
+        if assessment_ids:
+            report_fragments.on_assessments_saved([
+                (assessment_id, row[0], row[1], row[2], row[3])
+                for assessment_id, row in zip(assessment_ids, rows)
+            ])
+        return assessment_ids
+
+    def finish(self, callback=None):
+        """Write the remaining results; see checkpoint() for the callback."""
+        self.checkpoint(callback)
@@ -1,27 +1,87 @@
 import os
+import argparse
 import csv
+import gzip
+import hashlib
+import io
 import json
+import logging
+import math
+import multiprocessing
+import re
+import shutil
+import sqlite3
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from datetime import datetime
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
 from reportlab.graphics.shapes import Drawing
-from reportlab.graphics.charts.linecharts import HorizontalLineChart
+from reportlab.graphics.charts.lineplots import LinePlot
 
 import database
+from managers.report_fragments import report_fragments
+from result_codec import load_result
+from utils.downsample import format_day, time_axis
+
+logger = logging.getLogger("export_manager")
+
+# Suffix of files that are still being written
+PARTIAL_SUFFIX = ".part"
+
+# Rendered PDFs are kept here by content hash and copied for repeat exports
+RENDER_CACHE_DIR = ".render_cache"
+
+# Tables copied into SQLite snapshots, parents first
+SNAPSHOT_TABLES = ("animals", "weight_history", "assessments")
+
+# Assessments per PDF volume; larger histories are split into several files
+ASSESSMENTS_PER_VOLUME = 200
+
+# Bump when the PDF layout changes so cached renders are not reused
+PDF_TEMPLATE_VERSION = 4
+
+# Export manager owned by each worker process of a parallel export
+_worker_manager = None
+
+
+class ExportCancelled(Exception):
+    """Raised inside a running export when its caller asks to cancel it."""
+
+
+def _init_export_worker(export_dir, file_stamp):
+    """Create the export manager used by a worker process."""
+    global _worker_manager
+    _worker_manager = ExportManager(export_dir, file_stamp)
+
+
+def _export_pdf_in_worker(animal_id):
+    """Render one animal's PDF volumes inside a worker process."""
+    return _worker_manager.export_animal_to_pdf_volumes(animal_id)
 
 
 class ExportManager:
     """Manages export operations for the animal tracking app."""
 
-    def __init__(self):
-        """Initialize the export manager."""
-        self.export_dir = "exports"
+    def __init__(self, export_dir="exports", file_stamp=None):
+        """
+        Initialize the export manager.
+
+        Args:
+            export_dir: Directory the export files are written to
+            file_stamp: Fixed prefix for output file names, e.g. per export
+                job, so running an export again replaces its earlier files;
+                defaults to the current time
+        """
+        self.export_dir = export_dir
+        self.file_stamp = file_stamp
 
         # Create exports directory if it doesn't exist
-        if not os.path.exists(self.export_dir):
-            os.makedirs(self.export_dir)
+        os.makedirs(self.export_dir, exist_ok=True)
 
         # Set up PDF styles
         self.styles = getSampleStyleSheet()
@@ -36,16 +96,82 @@ class ExportManager:
             alignment=1
         ))
 
-    def export_animal_to_pdf(self, animal_id):
+    @contextmanager
+    def atomic_output(self, path, mode='w', **kwargs):
+        """
+        Open an export file so it only appears under its final name when complete.
+
+        Data is written to a temporary file next to the target and renamed
+        into place on success; on error the temporary file is removed.
+        """
+        temp_path = f"{path}{PARTIAL_SUFFIX}"
+        try:
+            with open(temp_path, mode, **kwargs) as file:
+                yield file
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def output_stamp(self):
+        """
+        Return the prefix of new output file names.
+
+        Without a fixed file_stamp this is the current time with microsecond
+        resolution, so exports started in the same second, e.g. by parallel
+        workers, never overwrite each other.
+        """
+        return self.file_stamp or datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+
+    def check_cancelled(self, should_cancel):
+        """Raise ExportCancelled if should_cancel is given and returns True."""
+        if should_cancel and should_cancel():
+            raise ExportCancelled()
+
+    def remove_partial_files(self):
+        """Delete temporary files left behind by exports interrupted by a crash."""
+        for name in os.listdir(self.export_dir):
+            if name.endswith(PARTIAL_SUFFIX):
+                try:
+                    os.remove(os.path.join(self.export_dir, name))
+                except OSError as e:
+                    logger.error(f"Error removing partial export {name}: {e}")
+
+    def build_base_filename(self, animal_name, animal_id):
+        """Build the export path (without extension) for an animal."""
+        timestamp = self.output_stamp()
+        safe_name = animal_name.replace(" ", "_").replace(os.sep, "_")
+        return os.path.join(self.export_dir, f"{timestamp}_{safe_name}_ID{animal_id}")
+
+    def export_animal_to_pdf(self, animal_id, output=None, use_cache=True, volume=1):
         """
         Export a single animal's data to PDF.
 
+        Only the most recent weight records are listed, with older ones
+        summarized per month, and assessments are split into volumes of
+        ASSESSMENTS_PER_VOLUME, so the size of a rendered document stays
+        bounded however long the animal's history is. The first volume
+        holds the animal details and weight history.
+
+        Renders are cached by a hash of the animal's data; the cache entry is
+        dropped by a trigger whenever that data changes, so repeat exports of
+        unchanged single-volume animals copy the stored PDF instead of
+        rendering again.
+
         Args:
             animal_id: The ID of the animal to export
+            output: Optional writable binary file object to render into
+                instead of a new file in the export directory
+            use_cache: Reuse and update the render cache
+            volume: Which volume to render, starting at 1
 
         Returns:
-            str: Path to the generated PDF file
+            str: Path to the generated PDF file, or `output` when one was given
         """
+        # Read before the data so changes made during the render are noticed
+        since_seq = database.get_latest_change_seq()
+
         # Get animal details
         animal = database.execute_query(
             """
@@ -61,40 +187,179 @@ class ExportManager:
         if not animal:
             return None
 
-        # Get weight history
-        weight_history = database.execute_query(
-            """
-            SELECT date, weight FROM weight_history
-            WHERE animal_id = ? ORDER BY date ASC
-            """,
-            (animal_id,),
-            fetch_mode='all'
-        ) or []
+        # Only single-volume reports are cached
+        use_cache = use_cache and volume == 1
+        rendered = self.cached_render_path(animal_id) if use_cache else None
+        if rendered:
+            return self.write_rendered_pdf(rendered, animal, animal_id, output)
 
-        # Get assessments
-        assessments = database.execute_query(
+        volume_count = self.pdf_volume_count(animal_id)
+        if volume > volume_count:
+            return None
+
+        weights = self.fetch_weight_history(animal_id) if volume == 1 else ([], [], [])
+
+        # Get this volume's assessments, mostly as fragments prepared at save time
+        assessments = report_fragments.get_assessment_fragments(database.execute_query(
             """
-            SELECT id, date, scale_used, result FROM assessments
-            WHERE animal_id = ? ORDER BY date DESC
+            SELECT id, animal_id, date, scale_used, result FROM assessments
+            WHERE animal_id = ? ORDER BY date DESC, id DESC
+            LIMIT ? OFFSET ?
             """,
-            (animal_id,),
+            (animal_id, ASSESSMENTS_PER_VOLUME, (volume - 1) * ASSESSMENTS_PER_VOLUME),
             fetch_mode='all'
-        ) or []
+        ) or [])
+
+        if use_cache and volume_count == 1:
+            rendered = self.render_to_cache(animal_id, animal, weights, assessments, since_seq)
+            return self.write_rendered_pdf(rendered, animal, animal_id, output)
+
+        story = self.build_animal_story(animal, weights, assessments, volume, volume_count)
+
+        # Build the PDF
+        if output is not None:
+            SimpleDocTemplate(output, pagesize=A4).build(story)
+            return output
 
         # Create filename with timestamp and animal details
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        animal_name = animal[0].replace(" ", "_")
-        filename = f"{self.export_dir}/{timestamp}_{animal_name}_ID{animal_id}.pdf"
+        filename = self.build_base_filename(animal[0], animal_id)
+        if volume_count > 1:
+            filename += f"_vol{volume}of{volume_count}"
+        filename += ".pdf"
+        with self.atomic_output(filename, 'wb') as file:
+            SimpleDocTemplate(file, pagesize=A4).build(story)
+        return filename
+
+    def export_animal_to_pdf_volumes(self, animal_id):
+        """
+        Export every PDF volume of an animal, one document at a time.
+
+        Args:
+            animal_id: The ID of the animal to export
+
+        Returns:
+            list: Paths to the generated PDF files, empty if the animal does not exist
+        """
+        filenames = []
+        for volume in range(1, self.pdf_volume_count(animal_id) + 1):
+            filename = self.export_animal_to_pdf(animal_id, volume=volume)
+            if not filename:
+                break
+            filenames.append(filename)
+        return filenames
+
+    def pdf_volume_count(self, animal_id):
+        """Return how many PDF volumes an animal's assessments need."""
+        result = database.execute_query(
+            "SELECT COUNT(*) FROM assessments WHERE animal_id = ?",
+            (animal_id,),
+            fetch_mode='one'
+        )
+        count = result[0] if result else 0
+        return max(1, math.ceil(count / ASSESSMENTS_PER_VOLUME))
+
+    def fetch_weight_history(self, animal_id):
+        """
+        Fetch the weight history shown in an animal's PDF.
 
-        # Create the PDF
-        doc = SimpleDocTemplate(filename, pagesize=A4)
+        Returns:
+            tuple: (recent, older, series) from the animal's weight summary
+            fragment, see ReportFragments.weight_summary_fragment
+        """
+        summary = report_fragments.get_weight_summary(animal_id)
+        return summary["recent"], summary["older"], summary["series"]
+
+    def cached_render_path(self, animal_id):
+        """Return the cached PDF of an animal whose data is unchanged, or None."""
+        cached = database.get_cached_render(animal_id)
+        if cached and os.path.exists(cached[1]):
+            return cached[1]
+        return None
+
+    def render_to_cache(self, animal_id, animal, weights, assessments, since_seq):
+        """
+        Render an animal's PDF into the render cache.
+
+        Renders are stored under the hash of their input, so data that was
+        changed and changed back is not rendered again either.
+
+        Returns:
+            str: Path of the cached render
+        """
+        content = json.dumps(
+            [PDF_TEMPLATE_VERSION, animal_id, animal, weights, assessments],
+            default=str
+        )
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+        cache_dir = os.path.join(self.export_dir, RENDER_CACHE_DIR)
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, f"{content_hash}.pdf")
+
+        if not os.path.exists(path):
+            story = self.build_animal_story(animal, weights, assessments)
+            with self.atomic_output(path, 'wb') as file:
+                SimpleDocTemplate(file, pagesize=A4).build(story)
+
+        database.set_cached_render(animal_id, content_hash, path, since_seq)
+        return path
+
+    def write_rendered_pdf(self, rendered, animal, animal_id, output=None):
+        """Copy a cached render to `output` or to a new file in the export directory."""
+        with open(rendered, 'rb') as cached:
+            if output is not None:
+                shutil.copyfileobj(cached, output)
+                return output
+
+            filename = f"{self.build_base_filename(animal[0], animal_id)}.pdf"
+            with self.atomic_output(filename, 'wb') as file:
+                shutil.copyfileobj(cached, file)
+            return filename
+
+    def prune_render_cache(self):
+        """Delete cached renders that no animal's cache entry points to any more."""
+        cache_dir = os.path.join(self.export_dir, RENDER_CACHE_DIR)
+        if not os.path.isdir(cache_dir):
+            return 0
+
+        referenced = database.get_cached_render_paths()
+        if referenced is None:
+            return 0
+        referenced = {os.path.normpath(path) for path in referenced}
+
+        removed = 0
+        for name in os.listdir(cache_dir):
+            path = os.path.normpath(os.path.join(cache_dir, name))
+            if path in referenced:
+                continue
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError as e:
+                logger.error(f"Error removing cached render {name}: {e}")
+        return removed
+
+    def build_animal_story(self, animal, weights, assessments, volume=1, volume_count=1):
+        """Build the ReportLab story of one volume of an animal's PDF."""
         story = []
 
         # Add title
         title = f"{animal[0]} ({animal[1]})"
         story.append(Paragraph(title, self.styles['Heading1Center']))
+        if volume_count > 1:
+            story.append(Paragraph(f"Volume {volume} of {volume_count}", self.styles['Normal_CENTER']))
         story.append(Spacer(1, 12))
 
+        if volume == 1:
+            story.extend(self.build_animal_overview(animal, *weights))
+
+        story.extend(self.build_assessment_pages(assessments))
+        return story
+
+    def build_animal_overview(self, animal, weight_history, older_weights, weight_series):
+        """Build the animal details and weight history part of a PDF."""
+        story = []
+
         # Add animal details table
         animal_data = [
             ["Breed:", animal[2] or "Not specified"],
@@ -126,13 +391,9 @@ class ExportManager:
 
             # Add weight history table
             weight_data = [["Date", "Weight (kg)"]]
-            weights_values = []
-            dates = []
 
             for date, weight in weight_history:
                 weight_data.append([date, f"{weight} kg"])
-                dates.append(date)
-                weights_values.append(weight)
 
             weight_table = Table(weight_data, colWidths=[250, 250])
             weight_table.setStyle(TableStyle([
@@ -144,35 +405,63 @@ class ExportManager:
             story.append(weight_table)
             story.append(Spacer(1, 12))
 
+            if older_weights:
+                story.append(Paragraph("Earlier Weight History (monthly summary)", self.styles['Heading3']))
+                story.append(Spacer(1, 12))
+
+                summary_data = [["Month", "Records", "Min (kg)", "Mean (kg)", "Max (kg)"]]
+                for month, records, low, mean, high in older_weights:
+                    summary_data.append([month, records, low, f"{mean:.2f}", high])
+
+                summary_table = Table(summary_data, colWidths=[100, 100, 100, 100, 100], repeatRows=1)
+                summary_table.setStyle(TableStyle([
+                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ]))
+                story.append(summary_table)
+                story.append(Spacer(1, 12))
+
             # Add weight graph if more than one data point
-            if len(weight_history) > 1:
-                # Create a line chart
+            if len(weight_series) > 1:
+                # Create a line chart on a time-scaled axis
                 story.append(Paragraph("Weight Trend", self.styles['Heading3']))
                 story.append(Spacer(1, 12))
 
                 drawing = Drawing(400, 200)
-                chart = HorizontalLineChart()
+                chart = LinePlot()
                 chart.x = 50
                 chart.y = 50
                 chart.width = 300
                 chart.height = 150
 
                 # Format data for the chart
-                chart.data = [weights_values]
+                chart.data = [weight_series]
+                chart.lines[0].strokeColor = colors.HexColor('#4f46e5')
 
-                # Show every 5th label to avoid crowding for large datasets
-                step = max(1, len(dates) // 5)
-                chart.categoryAxis.categoryNames = dates[::step]
-                chart.categoryAxis.labels.boxAnchor = 'ne'
-                chart.categoryAxis.labels.angle = 30
+                xmin, xmax, step = time_axis(weight_series)
+                chart.xValueAxis.valueMin = xmin
+                chart.xValueAxis.valueMax = xmax
+                chart.xValueAxis.valueSteps = list(range(xmin, xmax + 1, step))
+                chart.xValueAxis.labelTextFormat = format_day
+                chart.xValueAxis.labels.boxAnchor = 'ne'
+                chart.xValueAxis.labels.angle = 30
 
-                chart.valueAxis.valueMin = min(weights_values) * 0.9
-                chart.valueAxis.valueMax = max(weights_values) * 1.1
+                weights_values = [weight for _, weight in weight_series]
+                chart.yValueAxis.valueMin = min(weights_values) * 0.9
+                chart.yValueAxis.valueMax = max(weights_values) * 1.1
 
                 drawing.add(chart)
                 story.append(drawing)
                 story.append(Spacer(1, 12))
 
+        return story
+
+    def build_assessment_pages(self, assessments):
+        """Build the assessments overview and detail pages of a PDF from assessment fragments."""
+        story = []
+
         # Add assessments overview section
         if assessments:
             story.append(Paragraph("Assessments Overview", self.styles['Heading2']))
@@ -180,19 +469,8 @@ class ExportManager:
 
             # Create assessments table
             assessment_data = [["Date", "Scale", "Result"]]
-
-            for assessment_id, date, scale, result in assessments:
-                # Try to parse result JSON
-                try:
-                    result_data = json.loads(result)
-                    if "score" in result_data and "interpretation" in result_data:
-                        result_text = f"{result_data['score']} - {result_data['interpretation']}"
-                    else:
-                        result_text = str(result)
-                except (json.JSONDecodeError, TypeError):
-                    result_text = str(result)
-
-                assessment_data.append([date, scale, result_text])
+            for fragment in assessments:
+                assessment_data.append([fragment["date"], fragment["scale"], fragment["summary"]])
 
             assessment_table = Table(assessment_data, colWidths=[100, 200, 200])
             assessment_table.setStyle(TableStyle([
@@ -205,58 +483,39 @@ class ExportManager:
             story.append(Spacer(1, 20))
 
             # Add detailed assessment pages
-            for assessment_id, date, scale, result in assessments:
+            for fragment in assessments:
                 story.append(Paragraph("Assessment Details", self.styles['Heading1Center']))
                 story.append(Spacer(1, 12))
 
-                story.append(Paragraph(f"Scale: {scale}", self.styles['Heading2']))
-                story.append(Paragraph(f"Date: {date}", self.styles['Normal']))
+                story.append(Paragraph(f"Scale: {fragment['scale']}", self.styles['Heading2']))
+                story.append(Paragraph(f"Date: {fragment['date']}", self.styles['Normal']))
                 story.append(Spacer(1, 12))
 
-                # Try to parse result JSON
-                try:
-                    result_data = json.loads(result)
-
-                    if "score" in result_data and "interpretation" in result_data:
-                        story.append(Paragraph(f"Score: {result_data['score']}", self.styles['Heading3']))
-                        story.append(
-                            Paragraph(f"Interpretation: {result_data['interpretation']}", self.styles['Normal']))
-                        story.append(Spacer(1, 12))
-
-                    if "details" in result_data and isinstance(result_data["details"], list):
-                        detail_data = [["Question", "Answer", "Score"]]
-
-                        for detail in result_data["details"]:
-                            if isinstance(detail, dict) and "question" in detail and "answer" in detail:
-                                detail_data.append([
-                                    detail["question"],
-                                    detail["answer"],
-                                    str(detail.get("score", ""))
-                                ])
-
-                        if len(detail_data) > 1:  # If we have details beyond the header
-                            detail_table = Table(detail_data, colWidths=[200, 200, 100])
-                            detail_table.setStyle(TableStyle([
-                                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                            ]))
-                            story.append(detail_table)
-                    else:
-                        story.append(Paragraph(f"Result: {result}", self.styles['Normal']))
-
-                except (json.JSONDecodeError, TypeError):
-                    story.append(Paragraph(f"Result: {result}", self.styles['Normal']))
+                if fragment["interpretation"] is not None:
+                    story.append(Paragraph(f"Score: {fragment['score']}", self.styles['Heading3']))
+                    story.append(
+                        Paragraph(f"Interpretation: {fragment['interpretation']}", self.styles['Normal']))
+                    story.append(Spacer(1, 12))
+
+                if fragment["details"] is None:
+                    story.append(Paragraph(f"Result: {fragment['raw']}", self.styles['Normal']))
+                elif fragment["details"]:
+                    detail_table = Table([["Question", "Answer", "Score"]] + fragment["details"],
+                                         colWidths=[200, 200, 100])
+                    detail_table.setStyle(TableStyle([
+                        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                    ]))
+                    story.append(detail_table)
 
                 # Add page break between assessments
                 story.append(Spacer(1, 20))
                 story.append(Paragraph("", self.styles['Normal']))
                 story.append(Paragraph("", self.styles['Normal']))
 
-        # Build the PDF
-        doc.build(story)
-        return filename
+        return story
 
     def export_animal_to_csv(self, animal_id):
         """
@@ -283,16 +542,12 @@ class ExportManager:
         if not animal:
             return None
 
-        # Create timestamp for filenames
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        animal_name = animal[0].replace(" ", "_")
-
         # Create base filename
-        base_filename = f"{timestamp}_{animal_name}_ID{animal_id}"
+        base_filename = self.build_base_filename(animal[0], animal_id)
 
         # Export animal details
-        details_filename = f"{self.export_dir}/{base_filename}_details.csv"
-        with open(details_filename, 'w', newline='') as file:
+        details_filename = f"{base_filename}_details.csv"
+        with self.atomic_output(details_filename, newline='') as file:
             writer = csv.writer(file)
             writer.writerow(["Field", "Value"])
             writer.writerow(["Name", animal[0]])
@@ -320,8 +575,8 @@ class ExportManager:
         filenames = [details_filename]
 
         if weight_history:
-            weights_filename = f"{self.export_dir}/{base_filename}_weights.csv"
-            with open(weights_filename, 'w', newline='') as file:
+            weights_filename = f"{base_filename}_weights.csv"
+            with self.atomic_output(weights_filename, newline='') as file:
                 writer = csv.writer(file)
                 writer.writerow(["Date", "Weight (kg)"])
                 for date, weight in weight_history:
@@ -339,63 +594,990 @@ class ExportManager:
         )
 
         if assessments:
-            assessments_filename = f"{self.export_dir}/{base_filename}_assessments.csv"
-            with open(assessments_filename, 'w', newline='') as file:
+            assessments_filename = f"{base_filename}_assessments.csv"
+            with self.atomic_output(assessments_filename, newline='') as file:
                 writer = csv.writer(file)
                 writer.writerow(["ID", "Date", "Scale", "Score", "Interpretation", "Details"])
 
                 for assessment_id, date, scale, result in assessments:
-                    # Try to parse result JSON
-                    score = ""
-                    interpretation = ""
-                    details = ""
-
-                    try:
-                        result_data = json.loads(result)
-                        if "score" in result_data:
-                            score = result_data["score"]
-                        if "interpretation" in result_data:
-                            interpretation = result_data["interpretation"]
-                        if "details" in result_data:
-                            details = json.dumps(result_data["details"])
-                    except (json.JSONDecodeError, TypeError):
-                        details = result
-
+                    score, interpretation, details = self.parse_result_for_csv(result)
                     writer.writerow([assessment_id, date, scale, score, interpretation, details])
             filenames.append(assessments_filename)
 
         return filenames
 
-    def export_multiple_animals_to_pdf(self, animal_ids):
+    def export_multiple_animals_to_pdf(self, animal_ids, parallel=False, max_workers=None,
+                                       progress_callback=None, item_callback=None, should_cancel=None):
         """
         Export multiple animals to PDF files.
 
         Args:
             animal_ids: List of animal IDs to export
+            parallel: Render the animals in a process pool instead of one by one
+            max_workers: Size of the process pool, defaults to the CPU count;
+                with 1 the animals are exported in this process
+            progress_callback: Optional function called as (done, total) after
+                each animal; it runs on the calling thread
+            item_callback: Optional function called as (animal_id, filenames)
+                when an animal is finished; filenames lists the animal's PDF
+                volumes and is empty on failure
+            should_cancel: Optional function; when it returns True no further
+                animals are started
 
         Returns:
-            list: Paths to the generated PDF files
+            list: Paths to the generated PDF files, in the order of animal_ids
         """
-        filenames = []
+        animal_ids = list(dict.fromkeys(animal_ids))
+        # Animal ID -> its PDF volumes, filled as animals finish
+        results = {}
+
+        if parallel and len(animal_ids) > 1 and max_workers != 1:
+            try:
+                self._export_pdfs_in_pool(animal_ids, results, max_workers, progress_callback,
+                                          item_callback, should_cancel)
+                return [filename for animal_id in animal_ids for filename in results.get(animal_id, [])]
+            except (OSError, ImportError, NotImplementedError, BrokenProcessPool) as e:
+                # Some platforms (e.g. Android) cannot start worker processes, and
+                # a worker may crash; animals it finished are not exported again
+                logger.warning(f"Parallel PDF export unavailable, exporting sequentially: {e}")
+
         for animal_id in animal_ids:
-            filename = self.export_animal_to_pdf(animal_id)
-            if filename:
-                filenames.append(filename)
-        return filenames
+            if animal_id in results:
+                continue
+            if should_cancel and should_cancel():
+                break
+            try:
+                volumes = self.export_animal_to_pdf_volumes(animal_id)
+            except Exception as e:
+                logger.error(f"Error exporting animal ID {animal_id} to PDF: {e}")
+                volumes = []
+            results[animal_id] = volumes
+            if item_callback:
+                item_callback(animal_id, volumes)
+            if progress_callback:
+                progress_callback(len(results), len(animal_ids))
+        return [filename for animal_id in animal_ids for filename in results.get(animal_id, [])]
+
+    def _export_pdfs_in_pool(self, animal_ids, results, max_workers, progress_callback, item_callback,
+                             should_cancel):
+        """
+        Render PDFs in worker processes, each with its own DB connections.
+
+        Finished animals are added to results as they complete.
 
-    def export_multiple_animals_to_csv(self, animal_ids):
+        Raises:
+            BrokenProcessPool: If a worker process died; results holds the
+                animals finished before that
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(animal_ids))
+
+        # Spawn rather than fork so workers don't inherit the UI's threads;
+        # they re-import main.py, which imports no UI modules (see app.py)
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_export_worker,
+                initargs=(self.export_dir, self.file_stamp)) as pool:
+            futures = {pool.submit(_export_pdf_in_worker, animal_id): animal_id for animal_id in animal_ids}
+
+            for future in as_completed(futures):
+                animal_id = futures[future]
+                try:
+                    results[animal_id] = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error exporting animal ID {animal_id} to PDF: {e}")
+                    results[animal_id] = []
+
+                if item_callback:
+                    item_callback(animal_id, results[animal_id])
+                if progress_callback:
+                    progress_callback(len(results), len(animal_ids))
+
+                if should_cancel and should_cancel():
+                    # Drop animals that have not started; running ones finish
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    for pending, pending_id in futures.items():
+                        if pending_id not in results and pending.done() and not pending.cancelled():
+                            results[pending_id] = [] if pending.exception() else pending.result()
+                            if item_callback:
+                                item_callback(pending_id, results[pending_id])
+                    break
+
+    def parse_result_for_csv(self, result):
+        """
+        Split a stored assessment result into CSV columns.
+
+        Returns:
+            tuple: (score, interpretation, details) where details is JSON text
+        """
+        score = ""
+        interpretation = ""
+        details = ""
+
+        try:
+            result_data = load_result(result)
+            if "score" in result_data:
+                score = result_data["score"]
+            if "interpretation" in result_data:
+                interpretation = result_data["interpretation"]
+            if "details" in result_data:
+                details = json.dumps(result_data["details"])
+        except (ValueError, TypeError):
+            details = result
+
+        return score, interpretation, details
+
+    def export_multiple_animals_to_csv(self, animal_ids, consolidated=False):
         """
         Export multiple animals to CSV files.
 
         Args:
             animal_ids: List of animal IDs to export
+            consolidated: Write one file per table for all animals instead of
+                three files per animal
 
         Returns:
             list: Paths to the generated CSV files
         """
+        if consolidated:
+            return self.export_animals_to_consolidated_csv(animal_ids)
+
         all_filenames = []
         for animal_id in animal_ids:
             filenames = self.export_animal_to_csv(animal_id)
             if filenames:
                 all_filenames.extend(filenames)
-        return all_filenames
\ No newline at end of file
+        return all_filenames
+
+    def iter_selected_rows(self, query, animal_ids, should_cancel=None):
+        """
+        Stream the rows of a per-animal query for a selection of animals.
+
+        The query must contain a single `{ids}` placeholder inside an IN (...)
+        clause and order its rows by animal ID first. IDs are sorted and sent
+        in chunks, so rows come out ordered across chunks while only one
+        fetch batch is held in memory at a time.
+
+        Args:
+            query: SQL text with an `{ids}` placeholder
+            animal_ids: Selected animal IDs
+            should_cancel: Optional function checked before every chunk
+
+        Yields:
+            tuple: Result rows ordered by animal ID
+
+        Raises:
+            ExportCancelled: If should_cancel returned True
+        """
+        for chunk in database.chunked(sorted(set(animal_ids))):
+            self.check_cancelled(should_cancel)
+            yield from database.iter_query(query.format(ids=database.placeholders(len(chunk))), chunk)
+
+    def consolidated_csv_tables(self):
+        """
+        Describe the tables written by consolidated CSV exports.
+
+        Returns:
+            list: (suffix, header, query, convert) tuples, where query has an
+            `{ids}` placeholder and convert optionally maps a row to CSV fields
+        """
+        return [
+            (
+                "details",
+                ["Animal ID", "Name", "Species", "Breed", "Birthday", "Sex", "Castrated",
+                 "Current Weight (kg)", "Target Weight (kg)", "Target Date"],
+                """
+                SELECT id, name, species, breed, birthday, sex, castrated, current_weight,
+                       target_weight, target_date
+                FROM animals
+                WHERE id IN ({ids})
+                ORDER BY id
+                """,
+                None
+            ),
+            (
+                "weights",
+                ["Animal ID", "Name", "Date", "Weight (kg)"],
+                """
+                SELECT w.animal_id, a.name, w.date, w.weight
+                FROM weight_history w
+                JOIN animals a ON a.id = w.animal_id
+                WHERE w.animal_id IN ({ids})
+                ORDER BY w.animal_id, w.date
+                """,
+                None
+            ),
+            (
+                "assessments",
+                ["Animal ID", "Name", "Assessment ID", "Date", "Scale", "Score", "Interpretation", "Details"],
+                """
+                SELECT s.animal_id, a.name, s.id, s.date, s.scale_used, s.result
+                FROM assessments s
+                JOIN animals a ON a.id = s.animal_id
+                WHERE s.animal_id IN ({ids})
+                ORDER BY s.animal_id, s.date DESC
+                """,
+                lambda row: [*row[:5], *self.parse_result_for_csv(row[5])]
+            ),
+        ]
+
+    def write_consolidated_table(self, file, table, animal_ids, should_cancel=None):
+        """Stream one consolidated table for the selected animals into a text file."""
+        suffix, header, query, convert = table
+        writer = csv.writer(file)
+        writer.writerow(header)
+        for row in self.iter_selected_rows(query, animal_ids, should_cancel):
+            writer.writerow(convert(row) if convert else row)
+
+    def export_animals_to_consolidated_csv(self, animal_ids, should_cancel=None):
+        """
+        Export a selection of animals into one CSV file per table.
+
+        Each table is streamed straight from the database in animal ID order,
+        so memory use does not depend on the number of selected animals.
+
+        Args:
+            animal_ids: List of animal IDs to export
+            should_cancel: Optional function; when it returns True the export
+                stops and the files written so far are removed
+
+        Returns:
+            list: Paths to the generated CSV files
+
+        Raises:
+            ExportCancelled: If should_cancel returned True
+        """
+        if not animal_ids:
+            return []
+
+        timestamp = self.output_stamp()
+        base_filename = os.path.join(self.export_dir, f"{timestamp}_{len(set(animal_ids))}_animals")
+
+        filenames = []
+        try:
+            for table in self.consolidated_csv_tables():
+                filename = f"{base_filename}_{table[0]}.csv"
+                with self.atomic_output(filename, newline='') as file:
+                    self.write_consolidated_table(file, table, animal_ids, should_cancel)
+                filenames.append(filename)
+        except ExportCancelled:
+            # Don't leave an incomplete set of tables behind
+            for filename in filenames:
+                os.remove(filename)
+            raise
+
+        return filenames
+
+    def ndjson_record_queries(self):
+        """
+        Describe the queries merged into NDJSON records.
+
+        Returns:
+            tuple: (animals, weights, assessments) queries with an `{ids}`
+            placeholder, each ordered by animal ID first
+        """
+        return (
+            """
+            SELECT id, name, species, breed, birthday, sex, castrated, current_weight,
+                   target_weight, target_date
+            FROM animals
+            WHERE id IN ({ids})
+            ORDER BY id
+            """,
+            """
+            SELECT animal_id, date, weight
+            FROM weight_history
+            WHERE animal_id IN ({ids})
+            ORDER BY animal_id, date, id
+            """,
+            """
+            SELECT animal_id, id, date, scale_used, result
+            FROM assessments
+            WHERE animal_id IN ({ids})
+            ORDER BY animal_id, date, id
+            """,
+        )
+
+    def iter_animal_records(self, animal_ids, should_cancel=None):
+        """
+        Stream one nested record per animal with its weights and assessments.
+
+        The three tables are read through cursors ordered by animal ID and
+        merge-joined, so only the record being built is held in memory.
+
+        Args:
+            animal_ids: Selected animal IDs
+            should_cancel: Optional function checked before every record
+
+        Yields:
+            dict: JSON-serializable record for one animal
+        """
+        animal_query, weight_query, assessment_query = self.ndjson_record_queries()
+        weights = self.iter_selected_rows(weight_query, animal_ids)
+        assessments = self.iter_selected_rows(assessment_query, animal_ids)
+        next_weight = next(weights, None)
+        next_assessment = next(assessments, None)
+
+        for row in self.iter_selected_rows(animal_query, animal_ids):
+            self.check_cancelled(should_cancel)
+            animal_id = row[0]
+            record = {
+                "id": animal_id,
+                "name": row[1],
+                "species": row[2],
+                "breed": row[3],
+                "birthday": row[4],
+                "sex": row[5],
+                "castrated": row[6] == "Yes" if row[6] else None,
+                "current_weight": row[7],
+                "target_weight": row[8],
+                "target_date": row[9],
+                "weights": [],
+                "assessments": [],
+            }
+
+            # Child rows of animals that no longer exist are skipped
+            while next_weight is not None and next_weight[0] <= animal_id:
+                if next_weight[0] == animal_id:
+                    record["weights"].append({"date": next_weight[1], "weight": next_weight[2]})
+                next_weight = next(weights, None)
+
+            while next_assessment is not None and next_assessment[0] <= animal_id:
+                if next_assessment[0] == animal_id:
+                    record["assessments"].append(self.assessment_record(*next_assessment[1:]))
+                next_assessment = next(assessments, None)
+
+            yield record
+
+    def assessment_record(self, assessment_id, date, scale, result):
+        """Turn a stored assessment into a record with its details as native JSON."""
+        record = {"id": assessment_id, "date": date, "scale": scale}
+        try:
+            result_data = load_result(result)
+        except (ValueError, TypeError):
+            result_data = None
+
+        if isinstance(result_data, dict):
+            record["score"] = result_data.get("score")
+            record["interpretation"] = result_data.get("interpretation")
+            record["details"] = result_data.get("details")
+        else:
+            record["result"] = result
+        return record
+
+    def export_animals_to_ndjson(self, animal_ids, compress=False, should_cancel=None):
+        """
+        Export a selection of animals as newline-delimited JSON.
+
+        Every line is one animal with its weight history and assessments
+        nested; assessment details are emitted as JSON rather than escaped
+        text. Records are written as they are read.
+
+        Args:
+            animal_ids: List of animal IDs to export
+            compress: Write a gzip-compressed .ndjson.gz file
+            should_cancel: Optional function; when it returns True the export
+                stops and the partial file is removed
+
+        Returns:
+            str: Path to the generated file, or None if nothing was selected
+
+        Raises:
+            ExportCancelled: If should_cancel returned True
+        """
+        if not animal_ids:
+            return None
+
+        timestamp = self.output_stamp()
+        filename = os.path.join(
+            self.export_dir,
+            f"{timestamp}_{len(set(animal_ids))}_animals.ndjson" + (".gz" if compress else "")
+        )
+
+        with self.atomic_output(filename, 'wb') as raw:
+            # Closing the GzipFile writes the trailer but leaves raw open
+            stream = gzip.GzipFile(fileobj=raw, mode='wb') if compress else raw
+            for record in self.iter_animal_records(animal_ids, should_cancel):
+                line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+                stream.write(line.encode("utf-8"))
+            if compress:
+                stream.close()
+
+        return filename
+
+    def export_animals_to_sqlite(self, animal_ids, include_images=False, should_cancel=None):
+        """
+        Export a selection of animals into a standalone SQLite database.
+
+        The snapshot is attached to the app database and filled with
+        INSERT ... SELECT statements in a single transaction, so rows never
+        pass through Python. Tables and indexes are created from the app's
+        own schema, which keeps the snapshot readable by this app.
+
+        Args:
+            animal_ids: List of animal IDs to export
+            include_images: Also store the animals' image files in an
+                images(path, data) table
+            should_cancel: Optional function checked between tables; when it
+                returns True the snapshot is rolled back and removed
+
+        Returns:
+            str: Path to the generated database file, or None on failure
+
+        Raises:
+            ExportCancelled: If should_cancel returned True
+        """
+        if not animal_ids:
+            return None
+
+        timestamp = self.output_stamp()
+        filename = os.path.join(self.export_dir, f"{timestamp}_{len(set(animal_ids))}_animals.sqlite")
+        temp_path = f"{filename}{PARTIAL_SUFFIX}"
+
+        try:
+            with database.get_db_connection() as conn:
+                # Manage the transaction explicitly instead of sqlite3's implicit one
+                conn.isolation_level = None
+                cursor = conn.cursor()
+                cursor.execute("ATTACH DATABASE ? AS snapshot", (temp_path,))
+
+                try:
+                    cursor.execute("BEGIN")
+                    cursor.execute("CREATE TEMP TABLE selection (animal_id INTEGER PRIMARY KEY)")
+                    cursor.executemany(
+                        "INSERT OR IGNORE INTO temp.selection VALUES (?)",
+                        ((animal_id,) for animal_id in animal_ids)
+                    )
+
+                    schema = cursor.execute(
+                        f"""
+                        SELECT type, tbl_name, sql FROM main.sqlite_master
+                        WHERE tbl_name IN ({database.placeholders(len(SNAPSHOT_TABLES))})
+                          AND type IN ('table', 'index') AND sql IS NOT NULL
+                        """,
+                        SNAPSHOT_TABLES
+                    ).fetchall()
+
+                    # Tables before indexes, parents before children
+                    schema.sort(key=lambda row: (row[0] != 'table', SNAPSHOT_TABLES.index(row[1])))
+                    for object_type, table_name, sql in schema:
+                        cursor.execute(self.snapshot_schema_sql(object_type, sql))
+
+                    cursor.execute("""
+                        INSERT INTO snapshot.animals
+                        SELECT * FROM main.animals WHERE id IN (SELECT animal_id FROM temp.selection)
+                    """)
+                    for table_name in SNAPSHOT_TABLES[1:]:
+                        self.check_cancelled(should_cancel)
+                        cursor.execute(f"""
+                            INSERT INTO snapshot.{table_name}
+                            SELECT * FROM main.{table_name}
+                            WHERE animal_id IN (SELECT animal_id FROM temp.selection)
+                        """)
+
+                    if include_images:
+                        self.check_cancelled(should_cancel)
+                        cursor.execute(
+                            "CREATE TABLE snapshot.images (path TEXT PRIMARY KEY, data BLOB NOT NULL)"
+                        )
+                        image_paths = cursor.execute("""
+                            SELECT DISTINCT image_path FROM snapshot.animals
+                            WHERE image_path IS NOT NULL AND image_path != ''
+                        """).fetchall()
+                        cursor.executemany(
+                            "INSERT INTO snapshot.images (path, data) VALUES (?, ?)",
+                            self.iter_image_blobs(row[0] for row in image_paths)
+                        )
+
+                    cursor.execute("COMMIT")
+                except BaseException:
+                    cursor.execute("ROLLBACK")
+                    raise
+                finally:
+                    cursor.execute("DETACH DATABASE snapshot")
+
+            os.replace(temp_path, filename)
+        except ExportCancelled:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Error exporting SQLite snapshot: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+
+        return filename
+
+    def snapshot_schema_sql(self, object_type, sql):
+        """Rewrite a CREATE TABLE/INDEX statement to target the attached snapshot."""
+        if object_type == 'table':
+            pattern = r'^\s*CREATE\s+TABLE\s+(IF\s+NOT\s+EXISTS\s+)?'
+        else:
+            pattern = r'^\s*CREATE\s+(UNIQUE\s+)?INDEX\s+(IF\s+NOT\s+EXISTS\s+)?'
+        return re.sub(pattern, lambda match: f"{match.group(0)}snapshot.", sql, count=1, flags=re.IGNORECASE)
+
+    def iter_image_blobs(self, image_paths):
+        """Yield (path, data) for every image file that exists, one at a time."""
+        for path in image_paths:
+            try:
+                with open(path, 'rb') as file:
+                    yield path, file.read()
+            except OSError as e:
+                logger.warning(f"Skipping image {path} in snapshot: {e}")
+
+    def export_animals_to_zip(self, animal_ids, include_pdf=True, include_csv=True, progress_callback=None,
+                              should_cancel=None):
+        """
+        Export a selection of animals into a single compressed ZIP bundle.
+
+        Every file is written directly into its compressed ZIP entry, so no
+        uncompressed copy is staged on disk. PDFs are rendered one animal at
+        a time and CSV tables are streamed in chunks. A manifest.json with the
+        size and SHA-256 of every entry is added last.
+
+        Args:
+            animal_ids: List of animal IDs to export
+            include_pdf: Add one PDF per animal
+            include_csv: Add consolidated CSV tables
+            progress_callback: Optional function called as (done, total)
+            should_cancel: Optional function; when it returns True the export
+                stops and the partial bundle is removed
+
+        Returns:
+            str: Path to the generated ZIP file
+
+        Raises:
+            ExportCancelled: If should_cancel returned True
+        """
+        animal_ids = sorted(set(animal_ids))
+        if not animal_ids:
+            return None
+
+        timestamp = self.output_stamp()
+        filename = os.path.join(self.export_dir, f"{timestamp}_{len(animal_ids)}_animals.zip")
+        manifest = []
+        total = (len(animal_ids) if include_pdf else 0) + (1 if include_csv else 0)
+        done = 0
+
+        with self.atomic_output(filename, 'wb') as zip_file, \
+                zipfile.ZipFile(zip_file, 'w', compression=zipfile.ZIP_DEFLATED) as bundle:
+            if include_csv:
+                for table in self.consolidated_csv_tables():
+                    entry_name = f"csv/{table[0]}.csv"
+                    with HashingWriter(bundle.open(entry_name, 'w', force_zip64=True)) as raw:
+                        with io.TextIOWrapper(raw, encoding='utf-8', newline='') as text:
+                            self.write_consolidated_table(text, table, animal_ids, should_cancel)
+                    manifest.append(raw.manifest_entry(entry_name))
+
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+
+            if include_pdf:
+                animals = self.iter_selected_rows(
+                    "SELECT id, name FROM animals WHERE id IN ({ids}) ORDER BY id",
+                    animal_ids
+                )
+                for animal_id, name in animals:
+                    self.check_cancelled(should_cancel)
+                    base_name = f"pdf/{name.replace(' ', '_').replace('/', '_')}_ID{animal_id}"
+                    volume_count = self.pdf_volume_count(animal_id)
+                    for volume in range(1, volume_count + 1):
+                        if volume_count > 1:
+                            entry_name = f"{base_name}_vol{volume}of{volume_count}.pdf"
+                        else:
+                            entry_name = f"{base_name}.pdf"
+                        with HashingWriter(bundle.open(entry_name, 'w', force_zip64=True)) as raw:
+                            self.export_animal_to_pdf(animal_id, output=raw, volume=volume)
+                        manifest.append(raw.manifest_entry(entry_name))
+
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, total)
+
+            bundle.writestr("manifest.json", json.dumps({
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "animal_count": len(animal_ids),
+                "files": manifest
+            }, indent=2))
+
+        return filename
+
+    def incremental_csv_tables(self):
+        """
+        Describe the tables written by incremental CSV exports.
+
+        Returns:
+            list: (table_name, header, columns, convert) tuples
+        """
+        return [
+            (
+                "animals",
+                ["Animal ID", "Name", "Species", "Breed", "Birthday", "Sex", "Castrated",
+                 "Current Weight (kg)", "Target Weight (kg)", "Target Date"],
+                "t.name, t.species, t.breed, t.birthday, t.sex, t.castrated, t.current_weight, "
+                "t.target_weight, t.target_date",
+                None
+            ),
+            (
+                "weight_history",
+                ["Weight ID", "Animal ID", "Date", "Weight (kg)"],
+                "t.animal_id, t.date, t.weight",
+                None
+            ),
+            (
+                "assessments",
+                ["Assessment ID", "Animal ID", "Date", "Scale", "Score", "Interpretation", "Details"],
+                "t.animal_id, t.date, t.scale_used, t.result",
+                lambda row: [*row[:4], *self.parse_result_for_csv(row[4])]
+            ),
+        ]
+
+    def export_incremental_csv(self, destination):
+        """
+        Export only what changed since the last export to a destination.
+
+        Changes are read from the trigger-maintained change_log between the
+        destination's watermark and the newest change, so the work depends on
+        the amount of activity rather than the size of the colony. Each table
+        gets one file whose first column is 'upsert' or 'delete'; deleted rows
+        appear as tombstones carrying only their IDs. A destination without a
+        watermark receives a full snapshot. The watermark only advances after
+        all files have been written.
+
+        Args:
+            destination: Name of the downstream consumer, e.g. "lims"
+
+        Returns:
+            list: Paths to the generated CSV files
+        """
+        watermark = database.get_export_watermark(destination)
+        high_seq = database.get_latest_change_seq()
+
+        timestamp = self.output_stamp()
+        safe_destination = "".join(c if c.isalnum() else "_" for c in destination)
+        base_filename = os.path.join(self.export_dir, f"{timestamp}_{safe_destination}_incremental")
+
+        filenames = []
+        for table_name, header, columns, convert in self.incremental_csv_tables():
+            if watermark is None:
+                # First export to this destination: everything is an upsert
+                query = f"""
+                    SELECT 'upsert', t.id, {columns}
+                    FROM {table_name} t
+                    ORDER BY t.id
+                """
+                params = ()
+            else:
+                # Latest change per row in (watermark, high_seq]
+                query = f"""
+                    SELECT c.operation, c.row_id, {columns}
+                    FROM (
+                        SELECT row_id, MAX(seq) AS seq
+                        FROM change_log
+                        WHERE table_name = ? AND seq > ? AND seq <= ?
+                        GROUP BY row_id
+                    ) latest
+                    JOIN change_log c ON c.seq = latest.seq
+                    LEFT JOIN {table_name} t ON t.id = c.row_id
+                    ORDER BY c.row_id
+                """
+                params = (table_name, watermark, high_seq)
+
+            filename = f"{base_filename}_{table_name}.csv"
+            with self.atomic_output(filename, newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(["Change"] + header)
+
+                for row in database.iter_query(query, params):
+                    operation, row_id, values = row[0], row[1], row[2:]
+                    if operation == 'delete':
+                        writer.writerow([operation, row_id])
+                    elif values[0] is not None:
+                        # Rows deleted after high_seq are tombstoned next time
+                        fields = [row_id, *values]
+                        writer.writerow([operation] + (convert(fields) if convert else fields))
+
+            filenames.append(filename)
+
+        database.set_export_watermark(destination, high_seq)
+        database.prune_change_log()
+        return filenames
+
+    def compute_cohort_statistics(self, animal_ids=None, species=None):
+        """
+        Aggregate assessment and weight statistics for a cohort in SQL.
+
+        The cohort is loaded into a temporary table once and every statistic
+        is a set-based query joined against it, so the cost is a handful of
+        queries regardless of the number of animals.
+
+        Args:
+            animal_ids: Animals in the cohort
+            species: Alternatively, use every animal of this species
+
+        Returns:
+            dict: Cohort statistics, see export_cohort_report
+        """
+        with database.get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("CREATE TEMP TABLE cohort (animal_id INTEGER PRIMARY KEY)")
+
+            if species is not None:
+                cursor.execute("INSERT INTO temp.cohort SELECT id FROM animals WHERE species = ?", (species,))
+            else:
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO temp.cohort VALUES (?)",
+                    ((animal_id,) for animal_id in animal_ids or [])
+                )
+
+            animal_count, assessed_count, assessment_count = cursor.execute("""
+                SELECT (SELECT COUNT(*) FROM temp.cohort),
+                       COUNT(DISTINCT s.animal_id),
+                       COUNT(s.id)
+                FROM assessments s
+                JOIN temp.cohort c ON c.animal_id = s.animal_id
+            """).fetchone()
+
+            # Per-scale score summary and distribution over all assessments
+            scale_summary = cursor.execute("""
+                SELECT s.scale_used, COUNT(*), COUNT(DISTINCT s.animal_id),
+                       AVG(s.score), MIN(s.score), MAX(s.score)
+                FROM assessments s
+                JOIN temp.cohort c ON c.animal_id = s.animal_id
+                WHERE s.score IS NOT NULL
+                GROUP BY s.scale_used
+                ORDER BY s.scale_used
+            """).fetchall()
+
+            score_distribution = cursor.execute("""
+                SELECT s.scale_used, s.score, COUNT(*)
+                FROM assessments s
+                JOIN temp.cohort c ON c.animal_id = s.animal_id
+                WHERE s.score IS NOT NULL
+                GROUP BY s.scale_used, s.score
+                ORDER BY s.scale_used, s.score
+            """).fetchall()
+
+            # Share of animals per interpretation band, by each animal's latest result
+            interpretation_shares = cursor.execute("""
+                WITH latest AS (
+                    SELECT s.scale_used,
+                           s.interpretation AS band,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY s.animal_id, s.scale_used
+                               ORDER BY s.date DESC, s.id DESC
+                           ) AS rn
+                    FROM assessments s
+                    JOIN temp.cohort c ON c.animal_id = s.animal_id
+                    WHERE s.score IS NOT NULL
+                )
+                SELECT scale_used, band, COUNT(*),
+                       100.0 * COUNT(*) / SUM(COUNT(*)) OVER (PARTITION BY scale_used)
+                FROM latest
+                WHERE rn = 1
+                GROUP BY scale_used, band
+                ORDER BY scale_used, COUNT(*) DESC
+            """).fetchall()
+
+            # Relative weight change between each animal's first and last record
+            cursor.execute("""
+                CREATE TEMP TABLE weight_change AS
+                WITH ordered AS (
+                    SELECT w.animal_id,
+                           COUNT(*) OVER (PARTITION BY w.animal_id) AS records,
+                           FIRST_VALUE(w.weight) OVER (
+                               PARTITION BY w.animal_id ORDER BY w.date, w.id
+                           ) AS first_weight,
+                           FIRST_VALUE(w.weight) OVER (
+                               PARTITION BY w.animal_id ORDER BY w.date DESC, w.id DESC
+                           ) AS last_weight
+                    FROM weight_history w
+                    JOIN temp.cohort c ON c.animal_id = w.animal_id
+                )
+                SELECT animal_id, MAX(first_weight) AS first_weight, MAX(last_weight) AS last_weight,
+                       100.0 * (MAX(last_weight) - MAX(first_weight)) / MAX(first_weight) AS change_pct
+                FROM ordered
+                WHERE records > 1 AND first_weight > 0
+                GROUP BY animal_id
+            """)
+
+            weighed_count, mean_change, min_change, max_change, mean_square = cursor.execute("""
+                SELECT COUNT(*), AVG(change_pct), MIN(change_pct), MAX(change_pct),
+                       AVG(change_pct * change_pct)
+                FROM temp.weight_change
+            """).fetchone()
+
+            std_change = None
+            outliers = []
+            if weighed_count:
+                std_change = max(mean_square - mean_change * mean_change, 0) ** 0.5
+
+                # Animals more than two standard deviations from the mean change
+                if std_change > 0:
+                    outliers = cursor.execute("""
+                        SELECT a.id, a.name, wc.first_weight, wc.last_weight, wc.change_pct
+                        FROM temp.weight_change wc
+                        JOIN animals a ON a.id = wc.animal_id
+                        WHERE ABS(wc.change_pct - ?) > 2 * ?
+                        ORDER BY ABS(wc.change_pct - ?) DESC
+                    """, (mean_change, std_change, mean_change)).fetchall()
+
+        return {
+            "animal_count": animal_count,
+            "assessed_count": assessed_count,
+            "assessment_count": assessment_count,
+            "scale_summary": scale_summary,
+            "score_distribution": score_distribution,
+            "interpretation_shares": interpretation_shares,
+            "weight_change": {
+                "animals": weighed_count,
+                "mean": mean_change,
+                "std": std_change,
+                "min": min_change,
+                "max": max_change,
+            },
+            "weight_outliers": outliers,
+        }
+
+    def export_cohort_report(self, animal_ids=None, species=None):
+        """
+        Export a summary report for a cohort of animals to PDF.
+
+        Args:
+            animal_ids: Animals in the cohort
+            species: Alternatively, report on every animal of this species
+
+        Returns:
+            str: Path to the generated PDF file
+        """
+        stats = self.compute_cohort_statistics(animal_ids, species)
+        cohort_name = species or f"{stats['animal_count']} animals"
+
+        table_style = TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ])
+
+        def fmt(value, suffix=""):
+            return "-" if value is None else f"{value:.1f}{suffix}"
+
+        story = [
+            Paragraph(f"Cohort Report: {cohort_name}", self.styles['Heading1Center']),
+            Paragraph(f"Generated {datetime.now().strftime('%Y-%m-%d %H:%M')}", self.styles['Normal_CENTER']),
+            Spacer(1, 12),
+        ]
+
+        overview = Table([
+            ["Animals", "Assessed animals", "Assessments"],
+            [stats["animal_count"], stats["assessed_count"], stats["assessment_count"]],
+        ], colWidths=[160, 160, 160])
+        overview.setStyle(table_style)
+        story += [overview, Spacer(1, 20)]
+
+        if stats["scale_summary"]:
+            story += [Paragraph("Scores per Scale", self.styles['Heading2']), Spacer(1, 12)]
+            summary_data = [["Scale", "Assessments", "Animals", "Mean", "Min", "Max"]]
+            for scale, count, animals, mean, low, high in stats["scale_summary"]:
+                summary_data.append([scale, count, animals, fmt(mean), low, high])
+            summary_table = Table(summary_data, colWidths=[160, 70, 60, 60, 60, 60])
+            summary_table.setStyle(table_style)
+            story += [summary_table, Spacer(1, 20)]
+
+            story += [Paragraph("Score Distribution", self.styles['Heading2']), Spacer(1, 12)]
+            distribution_data = [["Scale", "Score", "Assessments"]]
+            distribution_data += [list(row) for row in stats["score_distribution"]]
+            distribution_table = Table(distribution_data, colWidths=[240, 120, 120], repeatRows=1)
+            distribution_table.setStyle(table_style)
+            story += [distribution_table, Spacer(1, 20)]
+
+            story += [Paragraph("Interpretation Bands (latest result per animal)", self.styles['Heading2']),
+                      Spacer(1, 12)]
+            band_data = [["Scale", "Interpretation", "Animals", "Share"]]
+            for scale, band, animals, share in stats["interpretation_shares"]:
+                band_data.append([scale, band or "-", animals, fmt(share, " %")])
+            band_table = Table(band_data, colWidths=[160, 180, 70, 70], repeatRows=1)
+            band_table.setStyle(table_style)
+            story += [band_table, Spacer(1, 20)]
+
+        weight = stats["weight_change"]
+        if weight["animals"]:
+            story += [Paragraph("Weight Change (first to last record)", self.styles['Heading2']), Spacer(1, 12)]
+            weight_table = Table([
+                ["Animals", "Mean", "Std. dev.", "Min", "Max"],
+                [weight["animals"], fmt(weight["mean"], " %"), fmt(weight["std"], " %"),
+                 fmt(weight["min"], " %"), fmt(weight["max"], " %")],
+            ], colWidths=[96, 96, 96, 96, 96])
+            weight_table.setStyle(table_style)
+            story += [weight_table, Spacer(1, 20)]
+
+            if stats["weight_outliers"]:
+                story += [Paragraph("Weight Outliers (more than 2 std. dev. from the mean)",
+                                    self.styles['Heading3']), Spacer(1, 12)]
+                outlier_data = [["ID", "Name", "First (kg)", "Last (kg)", "Change"]]
+                for animal_id, name, first, last, change in stats["weight_outliers"]:
+                    outlier_data.append([animal_id, name, first, last, fmt(change, " %")])
+                outlier_table = Table(outlier_data, colWidths=[60, 160, 90, 90, 80], repeatRows=1)
+                outlier_table.setStyle(table_style)
+                story.append(outlier_table)
+
+        timestamp = self.output_stamp()
+        safe_name = cohort_name.replace(" ", "_").replace(os.sep, "_")
+        filename = os.path.join(self.export_dir, f"{timestamp}_cohort_{safe_name}.pdf")
+        with self.atomic_output(filename, 'wb') as file:
+            SimpleDocTemplate(file, pagesize=A4).build(story)
+        return filename
+
+
+class HashingWriter(io.BufferedIOBase):
+    """Write-through wrapper that records the size and SHA-256 of everything written."""
+
+    def __init__(self, target):
+        super().__init__()
+        self.target = target
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.digest.update(data)
+        self.size += len(data)
+        return self.target.write(data)
+
+    def flush(self):
+        if not self.target.closed:
+            self.target.flush()
+
+    def close(self):
+        if not self.closed:
+            super().close()
+            self.target.close()
+
+    def manifest_entry(self, name):
+        """Return the manifest record for the data written so far."""
+        return {"name": name, "size": self.size, "sha256": self.digest.hexdigest()}
+
+
+def main(argv=None):
+    """
+    Command line entry point for incremental exports, e.g. from a scheduled job:
+        python -m managers.export_manager lims
+    """
+    parser = argparse.ArgumentParser(description="Export what changed since the last export to a destination.")
+    parser.add_argument("destination", help="name of the downstream consumer, e.g. lims")
+    parser.add_argument("--export-dir", default="exports", help="directory the CSV files are written to")
+    args = parser.parse_args(argv)
+
+    for filename in ExportManager(args.export_dir).export_incremental_csv(args.destination):
+        print(filename)
+
+
+if __name__ == '__main__':
+    main()
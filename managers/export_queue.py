@@ -0,0 +1,233 @@
+"""
+Persistent export job queue.
+
+Exports are recorded as jobs with one item per animal in the database, run
+by a bounded pool of worker threads and report progress per item. Jobs can
+be cancelled, and jobs interrupted by an app exit resume with the items that
+were not finished yet. Output file names are stamped with the job ID, so
+items that are run again replace the files of the interrupted attempt.
+"""
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+
+import database
+from managers.export_manager import ExportCancelled, ExportManager
+
+logger = logging.getLogger("export_queue")
+
+# Formats that produce one output per animal and can resume item by item
+PER_ANIMAL_FORMATS = ("pdf", "csv")
+
+# Formats that produce a single bundle for the whole selection
+BUNDLE_FORMATS = ("csv_combined", "zip", "ndjson", "sqlite", "cohort")
+
+
+class ExportQueue:
+    """Runs export jobs in the background with progress and cancellation."""
+
+    def __init__(self, max_workers=2, parallel_pdf=True):
+        """
+        Initialize the export queue.
+
+        Args:
+            max_workers: Maximum number of jobs running at the same time
+            parallel_pdf: Render PDF jobs in a process pool
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="export-job")
+        self.parallel_pdf = parallel_pdf
+        # The CPUs are split between the jobs that may run at once, so
+        # concurrent PDF jobs never start more processes than there are CPUs
+        self.pdf_workers = max(1, (os.cpu_count() or 1) // max_workers)
+        self.cancel_events = {}
+        self.listeners = {}
+        self.lock = Lock()
+
+    def submit(self, format_type, animal_ids, listener=None):
+        """
+        Queue an export job.
+
+        Args:
+            format_type: One of PER_ANIMAL_FORMATS or BUNDLE_FORMATS
+            animal_ids: Animals to export
+            listener: Optional function called with a progress dict after
+                every item and when the job ends; it runs on a worker thread
+
+        Returns:
+            int: The job ID, or None if the job could not be created
+        """
+        if format_type not in PER_ANIMAL_FORMATS + BUNDLE_FORMATS:
+            raise ValueError(f"Unknown export format: {format_type}")
+
+        job_id = database.create_export_job(format_type, list(dict.fromkeys(animal_ids)))
+        if job_id is None:
+            return None
+
+        self._start(job_id, listener)
+        return job_id
+
+    def resume_pending(self):
+        """
+        Clean up after the last run and restart its unfinished jobs in the background.
+
+        Returns:
+            Future: Resolves to the IDs of the resumed jobs
+        """
+        return self.executor.submit(self._resume_pending)
+
+    def _resume_pending(self):
+        """Restart jobs that were queued or running when the app last stopped."""
+        export_manager = ExportManager()
+        export_manager.remove_partial_files()
+        export_manager.prune_render_cache()
+        database.prune_change_log()
+
+        job_ids = database.get_unfinished_export_jobs()
+        for job_id in job_ids:
+            logger.info(f"Resuming export job {job_id}")
+            self._start(job_id, None)
+        return job_ids
+
+    def cancel(self, job_id):
+        """Request cancellation; finished items are kept, unstarted ones are skipped."""
+        with self.lock:
+            event = self.cancel_events.get(job_id)
+        if event:
+            event.set()
+
+    def set_listener(self, job_id, listener):
+        """Attach or replace the progress listener of a job."""
+        with self.lock:
+            self.listeners[job_id] = listener
+
+    def progress(self, job_id):
+        """
+        Return a snapshot of a job's progress.
+
+        Returns:
+            dict: id, format, status, error, total, done, failed and outputs
+        """
+        job = database.get_export_job(job_id)
+        if not job:
+            return None
+
+        # Bundle formats store the same output on every item, so deduplicate
+        outputs = {}
+        if job[2] in ('done', 'failed', 'cancelled'):
+            for item_outputs in database.get_export_job_outputs(job_id):
+                outputs.update(dict.fromkeys(json.loads(item_outputs)))
+
+        return {
+            "id": job[0],
+            "format": job[1],
+            "status": job[2],
+            "error": job[3],
+            "total": job[4],
+            "done": job[5],
+            "failed": job[6],
+            "outputs": list(outputs)
+        }
+
+    def _start(self, job_id, listener):
+        with self.lock:
+            self.cancel_events[job_id] = Event()
+            if listener:
+                self.listeners[job_id] = listener
+        self.executor.submit(self._run, job_id)
+
+    def _notify(self, job_id):
+        with self.lock:
+            listener = self.listeners.get(job_id)
+        if listener:
+            try:
+                listener(self.progress(job_id))
+            except Exception as e:
+                logger.error(f"Error in export job {job_id} listener: {e}")
+
+    def _complete_items(self, job_id, animal_ids, outputs):
+        """Record finished items and report progress."""
+        if outputs:
+            database.update_export_items(job_id, animal_ids, 'done', json.dumps(outputs))
+        else:
+            database.update_export_items(job_id, animal_ids, 'failed')
+        self._notify(job_id)
+
+    def _run(self, job_id):
+        """Process the pending items of a job."""
+        cancel_event = self.cancel_events[job_id]
+        job = database.get_export_job(job_id)
+        if not job:
+            return
+
+        format_type = job[1]
+        pending = database.get_pending_export_items(job_id)
+
+        if cancel_event.is_set():
+            database.set_export_job_status(job_id, 'cancelled')
+            self._finish(job_id)
+            return
+
+        database.set_export_job_status(job_id, 'running')
+        self._notify(job_id)
+
+        try:
+            export_manager = ExportManager(file_stamp=f"job{job_id}")
+            should_cancel = cancel_event.is_set
+
+            if format_type == "pdf":
+                export_manager.export_multiple_animals_to_pdf(
+                    pending,
+                    parallel=self.parallel_pdf,
+                    max_workers=self.pdf_workers,
+                    item_callback=lambda animal_id, filenames: self._complete_items(
+                        job_id, [animal_id], filenames),
+                    should_cancel=should_cancel
+                )
+            elif format_type == "csv":
+                for animal_id in pending:
+                    if cancel_event.is_set():
+                        break
+                    self._complete_items(job_id, [animal_id], export_manager.export_animal_to_csv(animal_id))
+            elif format_type == "csv_combined":
+                self._complete_items(job_id, pending, export_manager.export_animals_to_consolidated_csv(
+                    pending, should_cancel=should_cancel))
+            elif format_type == "zip":
+                filename = export_manager.export_animals_to_zip(pending, should_cancel=should_cancel)
+                self._complete_items(job_id, pending, [filename] if filename else None)
+            elif format_type == "ndjson":
+                filename = export_manager.export_animals_to_ndjson(pending, compress=True, should_cancel=should_cancel)
+                self._complete_items(job_id, pending, [filename] if filename else None)
+            elif format_type == "sqlite":
+                filename = export_manager.export_animals_to_sqlite(
+                    pending, include_images=True, should_cancel=should_cancel)
+                self._complete_items(job_id, pending, [filename] if filename else None)
+            elif format_type == "cohort":
+                filename = export_manager.export_cohort_report(pending)
+                self._complete_items(job_id, pending, [filename] if filename else None)
+
+            if cancel_event.is_set():
+                database.set_export_job_status(job_id, 'cancelled')
+            else:
+                job = database.get_export_job(job_id)
+                all_failed = job[4] > 0 and job[6] == job[4]
+                database.set_export_job_status(job_id, 'failed' if all_failed else 'done')
+        except ExportCancelled:
+            # The bundle's partial files are already removed; items stay pending
+            database.set_export_job_status(job_id, 'cancelled')
+        except Exception as e:
+            logger.error(f"Export job {job_id} failed: {e}")
+            database.set_export_job_status(job_id, 'failed', str(e))
+
+        self._finish(job_id)
+
+    def _finish(self, job_id):
+        self._notify(job_id)
+        with self.lock:
+            self.cancel_events.pop(job_id, None)
+            self.listeners.pop(job_id, None)
+
+
+# Shared queue used by the screens
+export_queue = ExportQueue()
@@ -0,0 +1,205 @@
+"""
+Content-addressed image store for animal photos.
+
+Images are stored once per unique content under a SHA-256 digest and sharded
+into two levels of subdirectories (animal_images/ab/cd/abcd....png) so no
+single directory grows large. The animals table is the source of truth for
+references: a stored file is kept while at least one animal points to it and
+is removed by garbage collection once nothing does.
+"""
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+from threading import Lock, Thread
+
+import database
+
+logger = logging.getLogger("image_store")
+
+IMAGE_ROOT = "animal_images"
+CHUNK_SIZE = 64 * 1024
+
+# Files younger than this are never collected, so an image that was just
+# added but whose animal row is not committed yet survives a concurrent GC.
+GC_GRACE_SECONDS = 300
+
+# Names of stored images and their temporary copies; anything else under the
+# root, e.g. a camera capture not saved to an animal yet, is never collected
+STORED_NAME = re.compile(r"^([0-9a-f]{64})\.")
+
+
+class ImageStore:
+    """Stores animal images by content hash in a sharded directory tree."""
+
+    _gc_lock = Lock()
+
+    def __init__(self, root=IMAGE_ROOT):
+        """
+        Initialize the image store.
+
+        Args:
+            root: Directory that holds the sharded image tree
+        """
+        self.root = root
+        self.collectors = []
+
+    def register_collector(self, collector):
+        """
+        Register a function run after each garbage collection.
+
+        Args:
+            collector: Function called with the set of referenced image paths
+                and the grace period, e.g. to drop files derived from images
+        """
+        self.collectors.append(collector)
+
+    def hash_file(self, path):
+        """Return the SHA-256 hex digest of a file, read in chunks."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def path_for_digest(self, digest, extension):
+        """Return the sharded storage path for a digest."""
+        return os.path.join(self.root, digest[:2], digest[2:4], f"{digest}{extension}")
+
+    def add(self, source_path):
+        """
+        Add an image to the store.
+
+        Identical content is stored only once; adding a file that is already
+        present just returns the existing path.
+
+        Args:
+            source_path: Path of the image to import
+
+        Returns:
+            str: Path of the stored image, suitable for animals.image_path
+        """
+        digest = self.hash_file(source_path)
+        extension = os.path.splitext(source_path)[1].lower() or ".png"
+        stored_path = self.path_for_digest(digest, extension)
+
+        if os.path.exists(stored_path):
+            # Refresh the timestamp so a pending GC does not race this reuse
+            os.utime(stored_path)
+            logger.info(f"Reusing stored image {stored_path}")
+            return stored_path
+
+        os.makedirs(os.path.dirname(stored_path), exist_ok=True)
+
+        # Copy to a unique temporary name first so readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(prefix=f"{digest}.", suffix=".tmp", dir=os.path.dirname(stored_path))
+        os.close(fd)
+        try:
+            shutil.copyfile(source_path, temp_path)
+            os.replace(temp_path, stored_path)
+        except OSError:
+            os.remove(temp_path)
+            raise
+
+        logger.info(f"Stored image {source_path} as {stored_path}")
+        return stored_path
+
+    def is_stored(self, path):
+        """Check whether a path lives inside this store."""
+        if not path:
+            return False
+        root = os.path.abspath(self.root)
+        return os.path.commonpath([root, os.path.abspath(path)]) == root
+
+    def is_store_file(self, dirpath, filename):
+        """Check whether a file is a stored image (or its temporary copy) in its shard directory."""
+        match = STORED_NAME.match(filename)
+        if not match:
+            return False
+        digest = match.group(1)
+        shard = os.path.normpath(os.path.join(self.root, digest[:2], digest[2:4]))
+        return os.path.normpath(dirpath) == shard
+
+    def referenced_paths(self):
+        """Return the normalized set of image paths referenced by animals."""
+        rows = database.execute_query(
+            "SELECT DISTINCT image_path FROM animals WHERE image_path IS NOT NULL AND image_path != ''",
+            fetch_mode='all'
+        )
+        if rows is None:
+            return None
+        return {os.path.normpath(row[0]) for row in rows}
+
+    def collect_garbage(self, grace_seconds=GC_GRACE_SECONDS):
+        """
+        Remove stored images that no animal references any more.
+
+        Only content-addressed files are considered; other files under the
+        root are left alone.
+
+        Args:
+            grace_seconds: Minimum file age before a file may be removed
+
+        Returns:
+            int: Number of files removed
+        """
+        if not os.path.isdir(self.root):
+            return 0
+
+        with self._gc_lock:
+            referenced = self.referenced_paths()
+            if referenced is None:
+                # Never delete anything if we could not read the references
+                logger.error("Skipping image garbage collection: could not read references")
+                return 0
+
+            cutoff = time.time() - grace_seconds
+            removed = 0
+
+            for dirpath, dirnames, filenames in os.walk(self.root):
+                for filename in filenames:
+                    path = os.path.normpath(os.path.join(dirpath, filename))
+                    if path in referenced or not self.is_store_file(dirpath, filename):
+                        continue
+
+                    try:
+                        if os.path.getmtime(path) > cutoff:
+                            continue
+                        os.remove(path)
+                        removed += 1
+                    except OSError as e:
+                        logger.error(f"Error removing orphaned image {path}: {e}")
+
+            # Drop shard directories that became empty
+            for dirpath, dirnames, filenames in os.walk(self.root, topdown=False):
+                relative = os.path.relpath(dirpath, self.root).split(os.sep)
+                is_shard = dirpath != self.root and all(len(part) == 2 for part in relative)
+                if is_shard and not os.listdir(dirpath):
+                    try:
+                        os.rmdir(dirpath)
+                    except OSError:
+                        pass
+
+            for collector in self.collectors:
+                try:
+                    collector(referenced, grace_seconds)
+                except Exception as e:
+                    logger.error(f"Error in image garbage collector {collector}: {e}")
+
+        if removed:
+            logger.info(f"Removed {removed} orphaned image(s)")
+        return removed
+
+    def collect_garbage_async(self, grace_seconds=GC_GRACE_SECONDS):
+        """Run garbage collection in a background thread."""
+        thread = Thread(target=self.collect_garbage, args=(grace_seconds,))
+        thread.daemon = True
+        thread.start()
+        return thread
+
+
+# Shared store used by the screens
+image_store = ImageStore()
@@ -0,0 +1,221 @@
+"""
+Pre-rendered report fragments.
+
+The content of each assessment's PDF detail block and of each animal's
+weight summary is prepared when the data is saved and stored as JSON in the
+report_fragments table. PDF exports then only lay out ready-made rows
+instead of re-parsing every stored result and re-aggregating the weight
+history. Fragments are dropped by a trigger when their data changes and
+rebuilt on demand, so a missing fragment only costs the work it saved.
+"""
+import json
+import logging
+from threading import Thread
+
+import database
+from result_codec import load_result
+from utils.downsample import downsample_series
+
+logger = logging.getLogger("report_fragments")
+
+# Bump when the fragment content changes so stored fragments are rebuilt
+FRAGMENT_VERSION = 1
+
+# Most recent weight records listed individually; older ones are summarized per month
+MAX_WEIGHT_TABLE_ROWS = 100
+
+
+class ReportFragments:
+    """Builds, stores and loads the pre-rendered parts of animal reports."""
+
+    def assessment_fragment(self, date, scale, result):
+        """
+        Prepare the report content of one assessment.
+
+        Args:
+            date: Assessment date
+            scale: Name of the scale used
+            result: Stored result, compact or JSON
+
+        Returns:
+            dict: date, scale, summary (overview text), score and
+            interpretation (None if not available), details as
+            [question, answer, score] rows, or None with the raw result text
+            when the result has no detail list
+        """
+        fragment = {
+            "date": date,
+            "scale": scale,
+            "summary": str(result),
+            "score": None,
+            "interpretation": None,
+            "details": None,
+        }
+
+        try:
+            result_data = load_result(result)
+        except (ValueError, TypeError):
+            result_data = None
+
+        if isinstance(result_data, dict):
+            if "score" in result_data and "interpretation" in result_data:
+                fragment["score"] = result_data["score"]
+                fragment["interpretation"] = result_data["interpretation"]
+                fragment["summary"] = f"{result_data['score']} - {result_data['interpretation']}"
+
+            if isinstance(result_data.get("details"), list):
+                fragment["details"] = [
+                    [detail["question"], detail["answer"], str(detail.get("score", ""))]
+                    for detail in result_data["details"]
+                    if isinstance(detail, dict) and "question" in detail and "answer" in detail
+                ]
+
+        if fragment["details"] is None:
+            fragment["raw"] = str(result)
+
+        return fragment
+
+    def weight_summary_fragment(self, animal_id):
+        """
+        Prepare the weight history shown in an animal's report.
+
+        Returns:
+            dict: recent holds the last MAX_WEIGHT_TABLE_ROWS [date, weight]
+            records in date order, older holds [month, records, min, mean,
+            max] summaries of everything before them and series is the
+            downsampled full history for the chart
+        """
+        recent = database.execute_query(
+            """
+            SELECT id, date, weight FROM weight_history
+            WHERE animal_id = ? ORDER BY date DESC, id DESC
+            LIMIT ?
+            """,
+            (animal_id, MAX_WEIGHT_TABLE_ROWS),
+            fetch_mode='all'
+        ) or []
+        recent.reverse()
+
+        older = []
+        if len(recent) == MAX_WEIGHT_TABLE_ROWS:
+            first_id, first_date = recent[0][0], recent[0][1]
+            older = database.execute_query(
+                """
+                SELECT substr(date, 1, 7) AS month, COUNT(*), MIN(weight), AVG(weight), MAX(weight)
+                FROM weight_history
+                WHERE animal_id = ? AND (date < ? OR (date = ? AND id < ?))
+                GROUP BY month
+                ORDER BY month
+                """,
+                (animal_id, first_date, first_date, first_id),
+                fetch_mode='all'
+            ) or []
+
+        # Streamed into the downsampler so only the chart's points are kept
+        series = downsample_series(database.iter_query(
+            "SELECT date, weight FROM weight_history WHERE animal_id = ? ORDER BY date, id",
+            (animal_id,)
+        ))
+
+        return {
+            "recent": [[date, weight] for _, date, weight in recent],
+            "older": [list(row) for row in older],
+            "series": [list(point) for point in series],
+        }
+
+    def store_assessments(self, assessments, since_seq=None):
+        """Build and store the fragments of saved (id, animal_id, date, scale_used, result) rows."""
+        database.save_report_fragments([
+            ("assessment", assessment_id, animal_id, FRAGMENT_VERSION,
+             json.dumps(self.assessment_fragment(date, scale, result)))
+            for assessment_id, animal_id, date, scale, result in assessments
+        ], since_seq)
+
+    def store_weight_summary(self, animal_id, since_seq=None):
+        """Build and store an animal's weight summary fragment."""
+        since_seq = database.get_latest_change_seq() if since_seq is None else since_seq
+        content = json.dumps(self.weight_summary_fragment(animal_id))
+        database.save_report_fragments(
+            [("weight_summary", animal_id, animal_id, FRAGMENT_VERSION, content)],
+            since_seq
+        )
+        return content
+
+    def on_assessment_saved(self, assessment_id, animal_id, date, scale, result):
+        """
+        Prepare the fragments affected by a newly saved assessment.
+
+        Runs in a background thread so saving stays responsive; a fragment
+        that is not ready in time is simply built at export.
+        """
+        return self.on_assessments_saved([(assessment_id, animal_id, date, scale, result)])
+
+    def on_assessments_saved(self, assessments):
+        """
+        Prepare the fragments affected by a batch of newly saved assessments.
+
+        Args:
+            assessments: (id, animal_id, date, scale_used, result) rows
+        """
+        since_seq = database.get_latest_change_seq()
+
+        def build():
+            try:
+                self.store_assessments(assessments, since_seq)
+
+                animal_ids = list(dict.fromkeys(row[1] for row in assessments))
+                stored = database.get_report_fragments("weight_summary", animal_ids, FRAGMENT_VERSION)
+                for animal_id in animal_ids:
+                    if animal_id not in stored:
+                        self.store_weight_summary(animal_id, since_seq)
+            except Exception as e:
+                logger.error(f"Error preparing report fragments for {len(assessments)} assessments: {e}")
+
+        thread = Thread(target=build)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def get_weight_summary(self, animal_id):
+        """Return an animal's weight summary fragment, building it if needed."""
+        stored = database.get_report_fragments("weight_summary", [animal_id], FRAGMENT_VERSION)
+        content = stored.get(animal_id) or self.store_weight_summary(animal_id)
+        return json.loads(content)
+
+    def get_assessment_fragments(self, assessments):
+        """
+        Return the fragments of a batch of assessments.
+
+        Fragments that are missing, e.g. for assessments saved before
+        fragments existed, are built and stored in one go.
+
+        Args:
+            assessments: (id, animal_id, date, scale_used, result) rows
+
+        Returns:
+            list: Fragments in the order of the given rows
+        """
+        since_seq = database.get_latest_change_seq()
+        stored = database.get_report_fragments(
+            "assessment", [row[0] for row in assessments], FRAGMENT_VERSION
+        )
+
+        fragments = []
+        missing = []
+        for assessment_id, animal_id, date, scale, result in assessments:
+            content = stored.get(assessment_id)
+            if content is None:
+                fragment = self.assessment_fragment(date, scale, result)
+                missing.append(("assessment", assessment_id, animal_id, FRAGMENT_VERSION, json.dumps(fragment)))
+                fragments.append(fragment)
+            else:
+                fragments.append(json.loads(content))
+
+        if missing:
+            database.save_report_fragments(missing, since_seq)
+
+        return fragments
+
+
+# Shared fragment store used by the screens and exports
+report_fragments = ReportFragments()
@@ -0,0 +1,260 @@
+"""
+Bulk rescoring of stored assessments.
+
+When a new version of a scale is published, stored results keep the scores
+and interpretation texts of the version they were saved with. The rescoring
+job walks all assessments in keyset-paged batches, reads every result with
+the scale version it was saved with (see result_codec.load_result), maps its
+answer texts to option indices of the current version, rescores the batch
+and writes changed results back, in the compact format and together with
+that version, one transaction per batch. Every change is listed in a CSV
+diff report, and a dry run produces the report without writing anything.
+
+Usage:
+    python -m managers.rescore_manager --dry-run
+    python -m managers.rescore_manager --species Rat --scale "Activity Score"
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import sqlite3
+from collections import defaultdict
+from datetime import datetime
+
+import database
+from result_codec import answers_from_details, encode_result, load_result
+from scale_registry import get_compiled_scale
+from scoring import score_batch, score_compiled
+
+logger = logging.getLogger("rescore_manager")
+
+DEFAULT_BATCH_SIZE = 5000
+
+REPORT_HEADER = ["Assessment ID", "Animal ID", "Species", "Scale", "Old Score", "New Score",
+                 "Old Interpretation", "New Interpretation", "Status"]
+
+
+class RescoreManager:
+    """Recomputes stored assessment results from their answers."""
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Initialize the rescoring job.
+
+        Args:
+            batch_size: Assessments read, scored and written per transaction
+        """
+        self.batch_size = batch_size
+
+    def iter_batches(self, species=None, scale_name=None):
+        """
+        Yield batches of (id, animal_id, species, scale_used, result) rows.
+
+        Batches are keyset-paged on the assessment ID, so each query is an
+        index range scan and no read cursor stays open while a batch is written.
+        """
+        conditions = ["s.id > ?"]
+        filters = []
+        if species is not None:
+            conditions.append("a.species = ?")
+            filters.append(species)
+        if scale_name is not None:
+            conditions.append("s.scale_used = ?")
+            filters.append(scale_name)
+
+        query = f"""
+            SELECT s.id, s.animal_id, a.species, s.scale_used, s.result
+            FROM assessments s
+            JOIN animals a ON a.id = s.animal_id
+            WHERE {" AND ".join(conditions)}
+            ORDER BY s.id
+            LIMIT ?
+        """
+
+        last_id = 0
+        while True:
+            rows = database.execute_query(query, (last_id, *filters, self.batch_size), fetch_mode='all')
+            if rows is None:
+                raise RuntimeError("Could not read assessments")
+            if not rows:
+                return
+            yield rows
+            last_id = rows[-1][0]
+
+    def rescore_rows(self, rows):
+        """
+        Rescore one batch of assessments.
+
+        Complete answer vectors of the same scale are scored together with
+        score_batch(); partially answered ones are scored individually.
+
+        Returns:
+            tuple: (changes, skipped) where changes holds (row, old_data,
+            new_result_json, new_data, scale_version) for results that differ and skipped
+            holds (row, reason) for results that could not be rescored
+        """
+        changes = []
+        skipped = []
+        groups = defaultdict(list)
+
+        for row in rows:
+            assessment_id, animal_id, species, scale_name, result = row
+            scale = get_compiled_scale(species, scale_name)
+            if scale is None:
+                skipped.append((row, "unknown scale"))
+                continue
+
+            try:
+                result_data = load_result(result)
+            except (ValueError, TypeError):
+                skipped.append((row, "unreadable result"))
+                continue
+
+            # Option indices may differ between versions, so answers are
+            # matched by text, also for compact results
+            details = result_data.get("details") if isinstance(result_data, dict) else None
+            answers = answers_from_details(scale, details)
+            if answers is None:
+                skipped.append((row, "answers do not match scale"))
+                continue
+
+            groups[scale].append((row, result_data, answers))
+
+        for scale, entries in groups.items():
+            complete = [entry for entry in entries if None not in entry[2]]
+            partial = [entry for entry in entries if None in entry[2]]
+
+            if complete:
+                totals, interpretation_indices = score_batch(scale, [entry[2] for entry in complete])
+                for entry, total, index in zip(complete, totals, interpretation_indices):
+                    interpretation = scale.interpretations[int(index)]
+                    self._collect_change(changes, scale, entry, int(total), interpretation.text)
+
+            for entry in partial:
+                scored = score_compiled(scale, entry[2])
+                self._collect_change(changes, scale, entry, scored["total_score"],
+                                     scored["interpretation"]["text"])
+
+        return changes, skipped
+
+    def _collect_change(self, changes, scale, entry, total, interpretation_text):
+        """Build the new stored result and keep it if it differs from the old one."""
+        row, old_data, answers = entry
+        new_data = {
+            "score": total,
+            "interpretation": interpretation_text,
+            "details": [
+                {
+                    "question": question.question,
+                    "answer": question.option_texts[answer],
+                    "score": question.option_scores[answer]
+                }
+                for question, answer in zip(scale.questions, answers) if answer is not None
+            ]
+        }
+
+        if new_data != {key: old_data.get(key) for key in new_data}:
+            new_result = encode_result(scale, answers) or json.dumps(new_data)
+            changes.append((row, old_data, new_result, new_data, scale.version))
+
+    def write_changes(self, changes):
+        """
+        Write one batch of changed results in a single transaction.
+
+        A row is only updated if its result is still the one that was read,
+        so edits made while the job runs are never overwritten.
+
+        Returns:
+            int: Number of rows updated
+        """
+        with database.get_db_connection() as conn:
+            cursor = conn.cursor()
+            updated = 0
+            for row, _, new_result, new_data, scale_version in changes:
+                cursor.execute(
+                    """
+                    UPDATE assessments SET result = ?, scale_version = ?, score = ?, interpretation = ?
+                    WHERE id = ? AND result = ?
+                    """,
+                    (new_result, scale_version, new_data["score"], new_data["interpretation"], row[0], row[4])
+                )
+                updated += cursor.rowcount
+            conn.commit()
+            return updated
+
+    def run(self, dry_run=False, report_path=None, species=None, scale_name=None):
+        """
+        Rescore stored assessments.
+
+        Args:
+            dry_run: Only write the diff report, leave the database unchanged
+            report_path: Where to write the CSV diff report; defaults to a
+                timestamped file in the exports directory
+            species: Only rescore assessments of animals of this species
+            scale_name: Only rescore assessments using this scale
+
+        Returns:
+            dict: scanned, changed, updated and skipped counts and the report path
+        """
+        if report_path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            os.makedirs("exports", exist_ok=True)
+            report_path = os.path.join("exports", f"{timestamp}_rescore{'_dry_run' if dry_run else ''}.csv")
+
+        stats = {"scanned": 0, "changed": 0, "updated": 0, "skipped": 0, "report": report_path}
+
+        with open(report_path, 'w', newline='', encoding='utf-8') as report:
+            writer = csv.writer(report)
+            writer.writerow(REPORT_HEADER)
+
+            for rows in self.iter_batches(species, scale_name):
+                changes, skipped = self.rescore_rows(rows)
+                stats["scanned"] += len(rows)
+                stats["changed"] += len(changes)
+                stats["skipped"] += len(skipped)
+
+                if changes and not dry_run:
+                    try:
+                        stats["updated"] += self.write_changes(changes)
+                    except sqlite3.Error as e:
+                        logger.error(f"Error writing rescored batch ending at ID {rows[-1][0]}: {e}")
+                        raise
+
+                status = "would update" if dry_run else "updated"
+                for row, old_data, _, new_data, _ in changes:
+                    writer.writerow([row[0], row[1], row[2], row[3],
+                                     old_data.get("score"), new_data["score"],
+                                     old_data.get("interpretation"), new_data["interpretation"], status])
+                for row, reason in skipped:
+                    writer.writerow([row[0], row[1], row[2], row[3], "", "", "", "", f"skipped: {reason}"])
+
+                logger.info(f"Rescored {stats['scanned']} assessments, {stats['changed']} changed")
+
+        return stats
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Recompute stored assessment results from their answers.")
+    parser.add_argument("--dry-run", action="store_true", help="write the diff report without updating the database")
+    parser.add_argument("--report", help="path of the CSV diff report")
+    parser.add_argument("--species", help="only rescore animals of this species")
+    parser.add_argument("--scale", help="only rescore assessments using this scale")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="assessments per batch and transaction")
+    args = parser.parse_args(argv)
+
+    stats = RescoreManager(batch_size=args.batch_size).run(
+        dry_run=args.dry_run,
+        report_path=args.report,
+        species=args.species,
+        scale_name=args.scale
+    )
+    print(f"Scanned {stats['scanned']}, changed {stats['changed']}, updated {stats['updated']}, "
+          f"skipped {stats['skipped']}. Report: {stats['report']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""
+Migration of stored assessment results to the compact format.
+
+Results saved before the compact format existed hold every question and
+answer as JSON. The migration walks those rows in keyset-paged batches,
+maps each answer back to its option index in the scale version the result
+was saved with and replaces the JSON with the compact text. A row is only
+rewritten if the compact result reads back exactly as the JSON did, so
+results that no longer match their scale, and free-text results, are kept
+as they are.
+
+Rewriting a result does not change its content, so change logging is
+suspended inside each batch's transaction (see the change_log_suspended
+table); cached renders, report fragments and incremental exports stay valid.
+
+The migration runs in the background when the app starts and can also be
+run from the command line:
+    python -m managers.result_migration --vacuum
+"""
+import argparse
+import json
+import logging
+import sqlite3
+from threading import Thread
+
+import database
+from result_codec import answers_from_details, encode_result, load_result
+from scale_registry import get_compiled_scale
+
+logger = logging.getLogger("result_migration")
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+class ResultMigration:
+    """Rewrites JSON assessment results in the compact format."""
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Initialize the migration.
+
+        Args:
+            batch_size: Assessments read and written per transaction
+        """
+        self.batch_size = batch_size
+
+    def iter_batches(self):
+        """
+        Yield batches of (id, species, scale_used, scale_version, result) rows
+        whose result is not yet compact.
+
+        Batches are keyset-paged on the assessment ID over a partial index, so
+        rows that were kept as they are do not slow down later runs.
+        """
+        query = f"""
+            SELECT s.id, a.species, s.scale_used, s.scale_version, s.result
+            FROM assessments s
+            JOIN animals a ON a.id = s.animal_id
+            WHERE s.id > ? AND {database.UNCOMPACTED_RESULT}
+            ORDER BY s.id
+            LIMIT ?
+        """
+
+        last_id = 0
+        while True:
+            rows = database.execute_query(query, (last_id, self.batch_size), fetch_mode='all')
+            if rows is None:
+                raise RuntimeError("Could not read assessments")
+            if not rows:
+                return
+            yield rows
+            last_id = rows[-1][0]
+
+    def compact_row(self, row):
+        """
+        Encode one stored JSON result in the compact format.
+
+        Returns:
+            tuple: (compact result, score, interpretation), or None if the
+            result cannot be stored compactly without changing it
+        """
+        _, species, scale_name, scale_version, result = row
+        scale = get_compiled_scale(species, scale_name, scale_version or 1)
+        if scale is None:
+            return None
+
+        try:
+            result_data = json.loads(result)
+        except (json.JSONDecodeError, TypeError):
+            return None
+        if not isinstance(result_data, dict):
+            return None
+
+        answers = answers_from_details(scale, result_data.get("details"))
+        compact = encode_result(scale, answers) if answers is not None else None
+        if compact is None:
+            return None
+
+        decoded = load_result(compact)
+        if decoded != {key: result_data.get(key) for key in decoded}:
+            return None
+        return compact, decoded["score"], decoded["interpretation"]
+
+    def write_batch(self, updates):
+        """
+        Write one batch of compacted results in a single transaction.
+
+        A row is only updated if its result is still the one that was read.
+
+        Args:
+            updates: (compact result, score, interpretation, id, old result) tuples
+
+        Returns:
+            int: Number of rows updated
+        """
+        with database.get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                # Only visible to this transaction, so other writes are still logged
+                cursor.execute("INSERT INTO change_log_suspended (id) VALUES (1)")
+
+                updated = 0
+                for update in updates:
+                    cursor.execute(
+                        """
+                        UPDATE assessments SET result = ?, score = ?, interpretation = ?
+                        WHERE id = ? AND result = ?
+                        """,
+                        update
+                    )
+                    updated += cursor.rowcount
+
+                cursor.execute("DELETE FROM change_log_suspended")
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            return updated
+
+    def run(self, vacuum=False):
+        """
+        Migrate all results that are not compact yet.
+
+        Args:
+            vacuum: Rebuild the database file afterwards so the freed pages
+                are returned to the file system
+
+        Returns:
+            dict: scanned, compacted and kept counts
+        """
+        stats = {"scanned": 0, "compacted": 0, "kept": 0}
+
+        for rows in self.iter_batches():
+            updates = []
+            for row in rows:
+                compacted = self.compact_row(row)
+                if compacted is None:
+                    stats["kept"] += 1
+                else:
+                    updates.append((*compacted, row[0], row[4]))
+
+            stats["scanned"] += len(rows)
+            if updates:
+                stats["compacted"] += self.write_batch(updates)
+            logger.info(f"Migrated {stats['compacted']} of {stats['scanned']} assessment results")
+
+        if vacuum and stats["compacted"]:
+            database.execute_query("VACUUM")
+
+        return stats
+
+    def start(self):
+        """Run the migration in a background thread."""
+        def migrate():
+            try:
+                stats = self.run()
+                if stats["compacted"]:
+                    logger.info(f"Compacted {stats['compacted']} assessment results")
+            except (RuntimeError, sqlite3.Error) as e:
+                logger.error(f"Error migrating assessment results: {e}")
+
+        thread = Thread(target=migrate)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Store assessment results in the compact format.")
+    parser.add_argument("--vacuum", action="store_true", help="shrink the database file afterwards")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="assessments per batch and transaction")
+    args = parser.parse_args(argv)
+
+    stats = ResultMigration(batch_size=args.batch_size).run(vacuum=args.vacuum)
+    print(f"Scanned {stats['scanned']}, compacted {stats['compacted']}, kept {stats['kept']}.")
+
+
+# Shared migration started by the app
+result_migration = ResultMigration()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+"""
+Thumbnail pyramid for animal images.
+
+Every stored image gets a small set of fixed-size renditions so screens can
+decode an image that matches the size they actually draw instead of the
+full-resolution camera photo. Renditions are cached on disk and built in a
+background worker.
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock
+
+from PIL import Image as PILImage
+
+from managers.image_store import image_store
+
+logger = logging.getLogger("thumbnail_manager")
+
+THUMBNAIL_ROOT = "image_cache"
+
+# Longest edge in pixels for each rendition; None means the original image
+THUMBNAIL_SIZES = {
+    "icon": 96,
+    "detail": 512,
+    "full": None,
+}
+
+
+class ThumbnailManager:
+    """Builds and caches fixed-size renditions of animal images."""
+
+    def __init__(self, root=THUMBNAIL_ROOT, max_workers=1):
+        """
+        Initialize the thumbnail manager.
+
+        Args:
+            root: Directory that holds the cached renditions
+            max_workers: Number of background threads used for resizing
+        """
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="thumbnails")
+        self.pending = {}
+        self.pending_lock = RLock()
+
+    def cache_key(self, image_path):
+        """
+        Return the cache key for an image.
+
+        Images in the content-addressed store are keyed by their digest;
+        anything else by its path, size and modification time.
+        """
+        if image_store.is_stored(image_path):
+            return os.path.splitext(os.path.basename(image_path))[0]
+
+        stat = os.stat(image_path)
+        source = f"{os.path.abspath(image_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    def cache_path(self, image_path, size):
+        """Return where the rendition of an image at the given size is cached."""
+        key = self.cache_key(image_path)
+        return os.path.join(self.root, size, key[:2], f"{key}.png")
+
+    def thumbnail_path(self, image_path, size):
+        """
+        Return the path of a ready rendition, or None if it is not built yet.
+
+        Args:
+            image_path: Path of the original image
+            size: One of THUMBNAIL_SIZES
+        """
+        if size not in THUMBNAIL_SIZES:
+            raise ValueError(f"Unknown thumbnail size: {size}")
+
+        if not image_path or not os.path.exists(image_path):
+            return None
+
+        if THUMBNAIL_SIZES[size] is None:
+            return image_path
+
+        path = self.cache_path(image_path, size)
+        return path if os.path.exists(path) else None
+
+    def build(self, image_path, size):
+        """
+        Build a single rendition synchronously.
+
+        Returns:
+            str: Path of the rendition, or None if the image could not be read
+        """
+        max_edge = THUMBNAIL_SIZES[size]
+        if max_edge is None:
+            return image_path
+
+        path = self.cache_path(image_path, size)
+        if os.path.exists(path):
+            return path
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with PILImage.open(image_path) as img:
+                # draft() lets JPEG decode at reduced resolution directly
+                img.draft("RGB", (max_edge, max_edge))
+                img.thumbnail((max_edge, max_edge))
+                if img.mode not in ("RGB", "RGBA"):
+                    img = img.convert("RGBA")
+
+                fd, temp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp",
+                                                 dir=os.path.dirname(path))
+                os.close(fd)
+                try:
+                    img.save(temp_path, format="PNG", optimize=True)
+                    os.replace(temp_path, path)
+                except BaseException:
+                    os.remove(temp_path)
+                    raise
+        except (OSError, ValueError) as e:
+            logger.error(f"Error building {size} thumbnail for {image_path}: {e}")
+            return None
+
+        return path
+
+    def build_all(self, image_path):
+        """Build every rendition of an image synchronously."""
+        return {size: self.build(image_path, size) for size in THUMBNAIL_SIZES}
+
+    def generate_async(self, image_path):
+        """Queue every rendition of a freshly saved image for background building."""
+        if image_path:
+            for size, max_edge in THUMBNAIL_SIZES.items():
+                if max_edge is not None:
+                    self._submit(image_path, size)
+
+    def request(self, image_path, size, on_ready):
+        """
+        Request an image at the given size.
+
+        If the rendition is cached its path is returned straight away.
+        Otherwise None is returned, the rendition is built in the background
+        and on_ready(path) is called on the main thread once it exists.
+
+        Args:
+            image_path: Path of the original image
+            size: One of THUMBNAIL_SIZES
+            on_ready: Callback receiving the rendition path
+
+        Returns:
+            str: Path of the cached rendition, or None while it is being built
+        """
+        path = self.thumbnail_path(image_path, size)
+        if path or not image_path or not os.path.exists(image_path):
+            return path
+
+        future = self._submit(image_path, size)
+
+        def deliver(done_future):
+            result = done_future.result()
+            if result:
+                from kivy.clock import Clock
+                Clock.schedule_once(lambda dt: on_ready(result), 0)
+
+        future.add_done_callback(deliver)
+        return None
+
+    def collect_garbage(self, referenced, grace_seconds):
+        """
+        Remove cached renditions of images no animal references any more.
+
+        Registered with the image store, which calls it after collecting
+        unreferenced images.
+
+        Args:
+            referenced: Set of image paths referenced by animals
+            grace_seconds: Minimum file age before a file may be removed
+
+        Returns:
+            int: Number of files removed
+        """
+        if not os.path.isdir(self.root):
+            return 0
+
+        keys = set()
+        for image_path in referenced:
+            try:
+                keys.add(self.cache_key(image_path))
+            except OSError:
+                # Missing originals have nothing left to show
+                continue
+
+        cutoff = time.time() - grace_seconds
+        removed = 0
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.split(".", 1)[0] in keys:
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    if os.path.getmtime(path) > cutoff:
+                        continue
+                    os.remove(path)
+                    removed += 1
+                except OSError as e:
+                    logger.error(f"Error removing cached thumbnail {path}: {e}")
+
+        if removed:
+            logger.info(f"Removed {removed} cached thumbnail(s)")
+        return removed
+
+    def _submit(self, image_path, size):
+        """Submit a build job, sharing the future with identical pending jobs."""
+        key = (os.path.abspath(image_path), size)
+        with self.pending_lock:
+            future = self.pending.get(key)
+            if future is None:
+                future = self.executor.submit(self.build, image_path, size)
+                self.pending[key] = future
+                future.add_done_callback(lambda f: self._forget(key))
+            return future
+
+    def _forget(self, key):
+        with self.pending_lock:
+            self.pending.pop(key, None)
+
+
+# Shared manager used by the screens
+thumbnail_manager = ThumbnailManager()
+image_store.register_collector(thumbnail_manager.collect_garbage)
@@ -0,0 +1,157 @@
+"""
+Compact storage format for assessment results.
+
+Results of registry scales are stored as a short text instead of JSON with
+every question and answer spelled out:
+
+    @rat.grimace:1:0120
+
+that is the scale ID, the scale version and one character per question with
+the chosen option index (base 36, "-" for an unanswered question). Question
+and answer texts, scores and the interpretation are resolved from the
+registry when the result is read, using the version it was saved with.
+
+Older results stored as JSON, and free-text results, are still read as
+before; load_result() returns the same dict shape for both formats.
+"""
+import json
+from functools import lru_cache
+
+from scale_registry import registry
+from scoring import score_compiled
+
+COMPACT_PREFIX = "@"
+UNANSWERED = "-"
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def is_compact(result):
+    """Return True if a stored result uses the compact format."""
+    return isinstance(result, str) and result.startswith(COMPACT_PREFIX)
+
+
+def encode_result(scale, answers):
+    """
+    Encode an answer vector in the compact format.
+
+    Args:
+        scale: CompiledScale the answers belong to
+        answers: One option index per question; None for unanswered questions
+
+    Returns:
+        str: The compact result, or None if the scale has no registry ID or
+        more options per question than the format can hold
+    """
+    if scale.scale_id is None or any(len(scores) > len(DIGITS) for scores in scale.option_scores):
+        return None
+    indices = "".join(UNANSWERED if answer is None else DIGITS[answer] for answer in answers)
+    return f"{COMPACT_PREFIX}{scale.scale_id}:{scale.version}:{indices}"
+
+
+def dump_result(scale, answers, scored):
+    """
+    Return the text stored for a scored answer vector.
+
+    Args:
+        scale: CompiledScale the answers belong to
+        answers: One option index per question; None for unanswered questions
+        scored: The answers' result from scoring.score_compiled()
+
+    Returns:
+        str: The compact result, or JSON if the scale cannot be encoded compactly
+    """
+    return encode_result(scale, answers) or json.dumps({
+        "score": scored["total_score"],
+        "interpretation": scored["interpretation"]["text"],
+        "details": scored["details"]
+    })
+
+
+def parse_compact(result):
+    """
+    Split a compact result into its parts.
+
+    Returns:
+        tuple: (scale ID, version, answers) with None for unanswered questions
+
+    Raises:
+        ValueError: If the text is not a valid compact result
+    """
+    if not is_compact(result):
+        raise ValueError("Not a compact result")
+    scale_id, version, indices = result[len(COMPACT_PREFIX):].split(":")
+    answers = [None if char == UNANSWERED else DIGITS.index(char) for char in indices]
+    return scale_id, int(version), answers
+
+
+@lru_cache(maxsize=4096)
+def _decode_compact(result):
+    """Resolve a compact result to (score, interpretation, details) against its scale version."""
+    scale_id, version, answers = parse_compact(result)
+    scale = registry.get_scale_by_id(scale_id, version)
+    if scale is None:
+        raise ValueError(f"Unknown scale {scale_id} version {version}")
+    if len(answers) != len(scale.questions) or any(
+            answer is not None and answer >= len(scores)
+            for answer, scores in zip(answers, scale.option_scores)):
+        raise ValueError(f"Answers do not match scale {scale_id} version {version}")
+
+    scored = score_compiled(scale, answers)
+    details = tuple((detail["question"], detail["answer"], detail["score"]) for detail in scored["details"])
+    return scored["total_score"], scored["interpretation"]["text"], details
+
+
+def load_result(result):
+    """
+    Parse a stored result, like json.loads() does for JSON results.
+
+    Compact results are returned as a dict with score, interpretation and
+    details (question, answer and score per answered question), the shape
+    results used to be stored in.
+
+    Raises:
+        ValueError: If the result is neither JSON nor a resolvable compact result
+        TypeError: If the result is not text
+    """
+    if not is_compact(result):
+        return json.loads(result)
+
+    score, interpretation, details = _decode_compact(result)
+    return {
+        "score": score,
+        "interpretation": interpretation,
+        "details": [{"question": question, "answer": answer, "score": option_score}
+                    for question, answer, option_score in details]
+    }
+
+
+def answers_from_details(scale, details):
+    """
+    Map the details of a JSON result back to option indices of a scale.
+
+    Returns:
+        list: One option index (or None if unanswered) per question, or None
+        if an answer does not match the scale definition
+    """
+    if not isinstance(details, list):
+        return None
+
+    lookup = _option_lookup(scale)
+    answers = [None] * len(scale.questions)
+    for detail in details:
+        if not isinstance(detail, dict):
+            return None
+        position, options = lookup.get(detail.get("question"), (None, None))
+        if position is None or detail.get("answer") not in options:
+            return None
+        answers[position] = options[detail["answer"]]
+    return answers
+
+
+@lru_cache(maxsize=None)
+def _option_lookup(scale):
+    """Return question text -> (question position, {answer text: option index})."""
+    return {
+        question.question: (position, {text: index for index, text in enumerate(question.option_texts)})
+        for position, question in enumerate(scale.questions)
+    }
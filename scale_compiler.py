@@ -0,0 +1,170 @@
+"""
+Compiler for assessment scales.
+
+Turns the scale definitions loaded by the scale registry into immutable
+lookup structures: per-question option score tuples, the lowest
+and highest achievable total score, and a dense table mapping every
+achievable total to its interpretation. Interpreting a score is then a
+single index operation. Scales whose interpretation ranges overlap or leave
+achievable scores uncovered are rejected with a ScaleCompileError.
+"""
+
+
+class ScaleCompileError(ValueError):
+    """Raised when a scale definition is inconsistent."""
+
+
+class _Frozen:
+    """Base for slotted objects whose attributes cannot change after creation."""
+
+    __slots__ = ()
+
+    def __init__(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        # Pickled by field values, since unpickling cannot set slots directly
+        return _rebuild, (type(self), {name: getattr(self, name) for name in self.__slots__})
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+def _rebuild(cls, values):
+    return cls(**values)
+
+
+class Interpretation(_Frozen):
+    """Interpretation of a range of total scores."""
+
+    __slots__ = ("low", "high", "text", "color")
+
+    def as_dict(self):
+        """Return the interpretation in the shape used by the scale definitions."""
+        return {"range": [self.low, self.high], "text": self.text, "color": self.color}
+
+
+class CompiledQuestion(_Frozen):
+    """A question with its option texts and scores as parallel tuples."""
+
+    __slots__ = ("question", "guidance", "option_texts", "option_scores")
+
+
+class CompiledScale(_Frozen):
+    """An assessment scale prepared for constant-time scoring."""
+
+    __slots__ = ("scale_id", "species", "name", "version", "title", "description", "questions",
+                 "option_scores", "min_score", "max_score", "interpretations", "score_table")
+
+    def interpret(self, total_score):
+        """
+        Return the Interpretation of a total score.
+
+        Returns:
+            Interpretation: The matching interpretation, or None if no range
+            contains the score
+        """
+        if self.min_score <= total_score <= self.max_score and total_score == int(total_score):
+            return self.score_table[int(total_score) - self.min_score]
+
+        # Only reachable with skipped questions; ranges may extend past the table
+        for interpretation in self.interpretations:
+            if interpretation.low <= total_score <= interpretation.high:
+                return interpretation
+        return None
+
+
+def _require_int(value, where):
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ScaleCompileError(f"{where}: expected an integer score, got {value!r}")
+    return value
+
+
+def compile_scale(species, name, definition, version=1, scale_id=None):
+    """
+    Compile one scale definition.
+
+    Args:
+        species: Species the scale belongs to
+        name: Name of the scale
+        definition: Scale dict as stored in the scale data files
+        version: Version of the scale definition
+        scale_id: Short registry ID of the scale, used in stored results
+
+    Returns:
+        CompiledScale: The compiled scale
+
+    Raises:
+        ScaleCompileError: If the definition has no questions, a question
+            without options, non-integer scores, or interpretation ranges
+            that overlap or leave an achievable score uncovered
+    """
+    label = f"{species} / {name}"
+
+    if not definition.get("questions"):
+        raise ScaleCompileError(f"{label}: scale has no questions")
+
+    questions = []
+    for number, question in enumerate(definition["questions"], start=1):
+        options = question.get("options") or []
+        if not options:
+            raise ScaleCompileError(f"{label}: question {number} has no options")
+
+        questions.append(CompiledQuestion(
+            question=question["question"],
+            guidance=question.get("guidance"),
+            option_texts=tuple(option["text"] for option in options),
+            option_scores=tuple(
+                _require_int(option["score"], f"{label}: question {number}") for option in options
+            ),
+        ))
+
+    min_score = sum(min(question.option_scores) for question in questions)
+    max_score = sum(max(question.option_scores) for question in questions)
+
+    interpretations = []
+    for entry in definition.get("interpretation", []):
+        low, high = (_require_int(bound, f"{label}: interpretation range") for bound in entry["range"])
+        if low > high:
+            raise ScaleCompileError(f"{label}: interpretation range [{low}, {high}] is reversed")
+        interpretations.append(Interpretation(low=low, high=high, text=entry["text"], color=entry["color"]))
+
+    interpretations.sort(key=lambda interpretation: interpretation.low)
+    for previous, current in zip(interpretations, interpretations[1:]):
+        if current.low <= previous.high:
+            raise ScaleCompileError(
+                f"{label}: interpretation ranges [{previous.low}, {previous.high}] and "
+                f"[{current.low}, {current.high}] overlap"
+            )
+
+    score_table = [None] * (max_score - min_score + 1)
+    for interpretation in interpretations:
+        for score in range(max(interpretation.low, min_score), min(interpretation.high, max_score) + 1):
+            score_table[score - min_score] = interpretation
+
+    gaps = [min_score + offset for offset, entry in enumerate(score_table) if entry is None]
+    if gaps:
+        raise ScaleCompileError(f"{label}: no interpretation for achievable scores {gaps}")
+
+    return CompiledScale(
+        scale_id=scale_id,
+        species=species,
+        name=name,
+        version=version,
+        title=definition.get("title", name),
+        description=definition.get("description", ""),
+        questions=tuple(questions),
+        option_scores=tuple(question.option_scores for question in questions),
+        min_score=min_score,
+        max_score=max_score,
+        interpretations=tuple(interpretations),
+        score_table=tuple(score_table),
+    )
@@ -0,0 +1,214 @@
+"""
+Registry of species and their assessment scales.
+
+Definitions live in versioned JSON data files under scales/. index.json lists
+every species with its data file, image, manuals and videos; each species
+file holds that species' scales with all of their published versions:
+
+    {
+      "species": "Rat",
+      "scales": {
+        "Grimace Scale": {"id": "rat.grimace", "current": 2, "versions": {"1": {...}, "2": {...}}}
+      }
+    }
+
+A scale ID is the species file's name followed by a short scale key. It
+never changes, so stored results can refer to a scale by it.
+
+A version's definition has a title, a description, questions (question text,
+options with text and score, optional guidance) and interpretation ranges.
+A scale is changed by adding a new version and pointing "current" at it; old
+versions are kept so stored assessments can be reproduced with the definition
+they were made with.
+
+Only the small index is read at startup. A species file is parsed and
+compiled the first time one of its scales is needed, and the compiled scales
+are pickled into a cache that is reused for as long as the data file's
+content is unchanged. The app keeps the cache in its user data directory
+(see set_cache_dir()); command line tools fall back to scales/.cache.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+from threading import Lock
+
+from scale_compiler import ScaleCompileError, compile_scale
+
+logger = logging.getLogger("scale_registry")
+
+SCALES_DIR = "scales"
+INDEX_FILE = "index.json"
+CACHE_DIR = ".cache"
+
+# Bump when the compiled structures change so cached pickles are rebuilt
+CACHE_VERSION = 2
+
+
+class ScaleRegistry:
+    """Loads species and scale definitions on demand."""
+
+    def __init__(self, scales_dir=SCALES_DIR, cache_dir=None):
+        """
+        Initialize the registry.
+
+        Args:
+            scales_dir: Directory holding index.json and the species data files
+            cache_dir: Directory for the compiled scale cache; defaults to
+                .cache inside scales_dir
+        """
+        self.scales_dir = scales_dir
+        self.cache_dir = cache_dir or os.path.join(scales_dir, CACHE_DIR)
+        self._index = None
+        self._species = {}
+        self._lock = Lock()
+
+    def index(self):
+        """
+        Return the species index.
+
+        Returns:
+            dict: species name -> dict with file, image, manuals and videos
+        """
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    with open(os.path.join(self.scales_dir, INDEX_FILE), encoding="utf-8") as f:
+                        entries = json.load(f)["species"]
+                    self._index = {entry["name"]: entry for entry in entries}
+        return self._index
+
+    def species_names(self):
+        """Return the names of all species, in index order."""
+        return list(self.index())
+
+    def species_info(self, species):
+        """Return the index entry of a species, or None if it is unknown."""
+        return self.index().get(species)
+
+    def scale_names(self, species):
+        """Return the names of a species' scales, or an empty list if it is unknown."""
+        return list(self._load_species(species))
+
+    def current_version(self, species, name):
+        """Return the current version of a scale, or None if it does not exist."""
+        entry = self._load_species(species).get(name)
+        return entry["current"] if entry else None
+
+    def get_scale(self, species, name, version=None):
+        """
+        Return a compiled scale.
+
+        Args:
+            species: Species the scale belongs to
+            name: Name of the scale
+            version: Version to return; the current version if None
+
+        Returns:
+            CompiledScale: The compiled scale, or None if the species has no
+            such scale or version
+        """
+        entry = self._load_species(species).get(name)
+        if entry is None:
+            return None
+        return entry["versions"].get(entry["current"] if version is None else int(version))
+
+    def get_scale_by_id(self, scale_id, version=None):
+        """
+        Return a compiled scale by its registry ID.
+
+        Only the species file named by the ID's prefix is loaded.
+
+        Returns:
+            CompiledScale: The compiled scale, or None if no scale has this ID
+            or version
+        """
+        file_key = scale_id.split(".", 1)[0]
+        for species, info in self.index().items():
+            if os.path.splitext(info["file"])[0] == file_key:
+                for name, entry in self._load_species(species).items():
+                    if entry["id"] == scale_id:
+                        return self.get_scale(species, name, version)
+        return None
+
+    def _load_species(self, species):
+        """Return a species' compiled scales, loading them on first use."""
+        loaded = self._species.get(species)
+        if loaded is not None:
+            return loaded
+
+        info = self.species_info(species)
+        if info is None:
+            return {}
+
+        with self._lock:
+            if species not in self._species:
+                self._species[species] = self._load_species_file(species, info["file"])
+            return self._species[species]
+
+    def set_cache_dir(self, cache_dir):
+        """Keep the compiled scale cache in cache_dir, e.g. the app's user data directory."""
+        self.cache_dir = cache_dir
+
+    def _load_species_file(self, species, file_name):
+        """
+        Compile a species data file, using the pickled cache when it is current.
+
+        Returns:
+            dict: scale name -> {"id": scale ID, "current": version,
+            "versions": {version: CompiledScale}}
+
+        Raises:
+            ScaleCompileError: If a scale definition is inconsistent or the
+                current version of a scale is missing
+        """
+        path = os.path.join(self.scales_dir, file_name)
+        with open(path, "rb") as f:
+            content = f.read()
+        # Keyed on the content, as packaging and copying don't keep timestamps
+        source = (CACHE_VERSION, hashlib.sha256(content).hexdigest())
+        cache_path = os.path.join(self.cache_dir, f"{os.path.splitext(file_name)[0]}.pickle")
+
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if cached["source"] == source:
+                return cached["scales"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable scale cache {cache_path}: {e}")
+
+        data = json.loads(content.decode("utf-8"))
+
+        scales = {}
+        for name, entry in data["scales"].items():
+            versions = {
+                int(version): compile_scale(species, name, definition, int(version), entry["id"])
+                for version, definition in entry["versions"].items()
+            }
+            if entry["current"] not in versions:
+                raise ScaleCompileError(f"{species} / {name}: current version {entry['current']} is not defined")
+            scales[name] = {"id": entry["id"], "current": entry["current"], "versions": versions}
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{cache_path}.tmp"
+            with open(temp_path, "wb") as f:
+                pickle.dump({"source": source, "scales": scales}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write scale cache {cache_path}: {e}")
+
+        logger.info(f"Compiled {len(scales)} scales for {species}")
+        return scales
+
+
+# Shared registry used by the screens, scoring and rescoring
+registry = ScaleRegistry()
+
+
+def get_compiled_scale(species, name, version=None):
+    """Return the compiled scale, or None if the species has no such scale or version."""
+    return registry.get_scale(species, name, version)
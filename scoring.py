@@ -0,0 +1,164 @@
+"""
+Headless scoring of assessments.
+
+Scores answer vectors (one option index per question) against compiled
+scales without any UI. score_answers() produces the result stored for a
+single assessment; score_batch() scores many complete answer vectors at once
+and uses NumPy when it is installed, falling back to plain Python otherwise.
+"""
+from functools import lru_cache
+
+from scale_registry import get_compiled_scale
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch scoring falls back to Python
+    np = None
+
+NO_INTERPRETATION = {"text": "No interpretation available", "color": "blue"}
+
+
+def resolve_scale(species, scale_name):
+    """
+    Return the compiled scale for a species and scale name.
+
+    Raises:
+        KeyError: If the species has no such scale
+    """
+    scale = get_compiled_scale(species, scale_name)
+    if scale is None:
+        raise KeyError(f"Scale '{scale_name}' not found for {species}")
+    return scale
+
+
+def score_compiled(scale, answers):
+    """
+    Score one answer vector against a compiled scale.
+
+    Args:
+        scale: CompiledScale to score against
+        answers: One option index per question; None for unanswered questions
+
+    Returns:
+        dict: total_score, details (question, answer, score per answered
+        question) and interpretation (dict with text and color)
+    """
+    total_score = 0
+    details = []
+
+    for question, answer_idx in zip(scale.questions, answers):
+        if answer_idx is not None:
+            score = question.option_scores[answer_idx]
+            total_score += score
+            details.append({
+                "question": question.question,
+                "answer": question.option_texts[answer_idx],
+                "score": score
+            })
+
+    interpretation = scale.interpret(total_score)
+    return {
+        "total_score": total_score,
+        "details": details,
+        "interpretation": interpretation.as_dict() if interpretation else dict(NO_INTERPRETATION)
+    }
+
+
+def score_answers(species, scale_name, answers):
+    """
+    Score one answer vector.
+
+    Args:
+        species: Species the scale belongs to
+        scale_name: Name of the scale
+        answers: One option index per question; None for unanswered questions
+
+    Returns:
+        dict: See score_compiled()
+    """
+    return score_compiled(resolve_scale(species, scale_name), answers)
+
+
+@lru_cache(maxsize=None)
+def _interpretation_indices(scale):
+    """Return the index into scale.interpretations of every achievable total."""
+    return tuple(scale.interpretations.index(entry) for entry in scale.score_table)
+
+
+@lru_cache(maxsize=None)
+def _score_arrays(scale):
+    """
+    Build the NumPy lookup arrays of a scale once.
+
+    Returns:
+        tuple: (option score matrix padded with zeros, questions x options;
+        option count per question; interpretation index per achievable total)
+    """
+    width = max(len(scores) for scores in scale.option_scores)
+    matrix = np.zeros((len(scale.option_scores), width), dtype=np.int64)
+    for row, scores in enumerate(scale.option_scores):
+        matrix[row, :len(scores)] = scores
+
+    option_counts = np.array([len(scores) for scores in scale.option_scores], dtype=np.int64)
+    table = np.array(_interpretation_indices(scale), dtype=np.int64)
+    return matrix, option_counts, table
+
+
+def score_batch(scale, answer_matrix):
+    """
+    Score many complete answer vectors at once.
+
+    Args:
+        scale: CompiledScale, or a (species, scale_name) tuple
+        answer_matrix: Sequence (or 2-D array) of answer vectors, each with
+            one option index per question
+
+    Returns:
+        tuple: (totals, interpretation_indices) with one entry per vector;
+        interpretation_indices index scale.interpretations. NumPy arrays
+        when NumPy is available, lists otherwise.
+
+    Raises:
+        ValueError: If a vector has the wrong length or an invalid option index
+    """
+    if isinstance(scale, tuple):
+        scale = resolve_scale(*scale)
+
+    if np is None:
+        return _score_batch_python(scale, answer_matrix)
+
+    matrix, option_counts, table = _score_arrays(scale)
+    answers = np.asarray(answer_matrix, dtype=np.int64)
+    if answers.size == 0:
+        answers = answers.reshape(0, len(option_counts))
+
+    if answers.ndim != 2 or answers.shape[1] != len(option_counts):
+        raise ValueError(f"Expected answer vectors of length {len(option_counts)}")
+    if (answers < 0).any() or (answers >= option_counts).any():
+        raise ValueError("Answer index out of range")
+
+    totals = matrix[np.arange(len(option_counts)), answers].sum(axis=1)
+    return totals, table[totals - scale.min_score]
+
+
+def _score_batch_python(scale, answer_matrix):
+    """Pure-Python version of score_batch() used when NumPy is missing."""
+    option_scores = scale.option_scores
+    table = _interpretation_indices(scale)
+
+    totals = []
+    interpretation_indices = []
+    for answers in answer_matrix:
+        if len(answers) != len(option_scores):
+            raise ValueError(f"Expected answer vectors of length {len(option_scores)}")
+
+        total = 0
+        for scores, answer in zip(option_scores, answers):
+            if not 0 <= answer < len(scores):
+                raise ValueError("Answer index out of range")
+            total += scores[answer]
+
+        totals.append(total)
+        interpretation_indices.append(table[total - scale.min_score])
+
+    return totals, interpretation_indices
@@ -1,5 +1,4 @@
 import os
-import shutil
 from datetime import datetime
 
 from kivy.uix.filechooser import FileChooserListView
@@ -13,6 +12,9 @@ from kivymd.uix.pickers import MDModalDatePicker
 from kivymd.uix.screen import MDScreen
 
 import database
+from managers.image_store import image_store
+from managers.thumbnail_manager import thumbnail_manager
+from utils.async_image import PRIORITY_VISIBLE, image_loader
 
 
 class AddAnimalScreen(MDScreen):
@@ -248,7 +250,7 @@ class AddAnimalScreen(MDScreen):
         self.selected_image_path = selected_file
 
         # Update the image preview
-        self.ids.photo_preview.source = selected_file
+        image_loader.load(self.ids.photo_preview, selected_file, PRIORITY_VISIBLE)
 
         # Close the file dialog
         if self.file_dialog:
@@ -268,7 +270,7 @@ class AddAnimalScreen(MDScreen):
 
         # Update with the new image
         self.selected_image_path = filename
-        self.ids.photo_preview.source = filename
+        image_loader.load(self.ids.photo_preview, filename, PRIORITY_VISIBLE)
 
         # Close the camera
         self.camera_dialog.dismiss()
@@ -298,13 +300,17 @@ class AddAnimalScreen(MDScreen):
             self.show_error("Weight must be a valid number!")
             return
 
-        # Save image in app directory
+        # Save image in the content-addressed image store
         image_save_path = ""
         if self.selected_image_path:
-            image_dir = "animal_images"
-            os.makedirs(image_dir, exist_ok=True)
-            image_save_path = os.path.join(image_dir, os.path.basename(self.selected_image_path))
-            shutil.copy(self.selected_image_path, image_save_path)
+            try:
+                image_save_path = image_store.add(self.selected_image_path)
+            except OSError as e:
+                self.show_error(f"Could not save image: {e}")
+                return
+
+            # Build the list/detail renditions while the user moves on
+            thumbnail_manager.generate_async(image_save_path)
 
         animal_id = database.add_animal(name, species, breed, birthday, sex, castrated, weight_in_kg, image_save_path)
 
@@ -332,7 +338,7 @@ class AddAnimalScreen(MDScreen):
         ]:
             self.ids[field].text = ""
         self.ids.animal_castrated.active = False
-        self.ids.photo_preview.source = ""
+        image_loader.load(self.ids.photo_preview, "")
         self.selected_image_path = ""
         self.selected_species = None
         self.selected_sex = None
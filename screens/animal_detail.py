@@ -1,12 +1,10 @@
-import json
 import os
 from datetime import datetime
 
-from kivy.graphics import Color, Ellipse
 from kivy.metrics import dp
 from kivy.properties import NumericProperty, StringProperty
 from kivy.utils import get_color_from_hex
-from kivy_garden.graph import Graph, MeshLinePlot
+from kivy_garden.graph import Graph, MeshLinePlot, ScatterPlot
 from kivymd.app import MDApp
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.button import MDButton, MDButtonText, MDIconButton
@@ -15,9 +13,13 @@ from kivymd.uix.label import MDLabel
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.textfield import MDTextField
 
-from managers.export_manager import ExportManager
+from managers.export_queue import export_queue
+from managers.thumbnail_manager import thumbnail_manager
 
 import database
+from result_codec import load_result
+from utils.async_image import PLACEHOLDER_IMAGE, PRIORITY_VISIBLE, image_loader
+from utils.downsample import downsample_series, format_day, time_axis
 
 
 class AnimalDetailScreen(MDScreen):
@@ -36,6 +38,7 @@ class AnimalDetailScreen(MDScreen):
         self.graph = None
         self.plot = None
         self.target_dialog = None
+        self.loading_dialog = None
         self.target_weight = None
         self.target_date = ""
 
@@ -81,12 +84,8 @@ class AnimalDetailScreen(MDScreen):
         self.ids.animal_castrated.text = f"Castrated: {animal[5] or 'No'}"
         self.ids.animal_weight.text = f"Current Weight: {animal[6]} kg"
 
-        # Set image if available
-        if animal[7] and os.path.exists(animal[7]):
-            self.ids.animal_image.source = animal[7]
-        else:
-            # Set a default image
-            self.ids.animal_image.source = "assets/images/animal_placeholder.png"
+        # Set image if available, using the detail-sized rendition
+        self.show_animal_image(animal[7])
 
         # Load target weight if available
         if animal[8] and animal[9]:
@@ -101,6 +100,22 @@ class AnimalDetailScreen(MDScreen):
 
         return
 
+    def show_animal_image(self, image_path):
+        """Show the detail rendition of the animal's image without blocking the frame."""
+        if not image_path or not os.path.exists(image_path):
+            image_loader.load(self.ids.animal_image, PLACEHOLDER_IMAGE, PRIORITY_VISIBLE)
+            return
+
+        animal_id = self.animal_id
+
+        def on_ready(path):
+            # Ignore late results for an animal that is no longer shown
+            if self.animal_id == animal_id:
+                image_loader.load(self.ids.animal_image, path, PRIORITY_VISIBLE)
+
+        path = thumbnail_manager.request(image_path, "detail", on_ready)
+        image_loader.load(self.ids.animal_image, path or PLACEHOLDER_IMAGE, PRIORITY_VISIBLE)
+
     def load_weight_history(self):
         """Load and display weight history."""
         self.ids.weight_history_container.clear_widgets()
@@ -136,9 +151,6 @@ class AnimalDetailScreen(MDScreen):
 
             return
 
-        # Process weight data for the graph
-        dates = []
-        weights_values = []
         prev_weight = None
 
         # Add title for weight history
@@ -164,8 +176,6 @@ class AnimalDetailScreen(MDScreen):
         for weight_id, date, weight in weights:
             # Add to the graph data
             self.weight_data.append((date, weight))
-            dates.append(date)
-            weights_values.append(weight)
 
             # Create UI entry
             entry = MDBoxLayout(
@@ -224,7 +234,7 @@ class AnimalDetailScreen(MDScreen):
                 self.ids.weight_graph_container.clear_widgets()
 
             # Create a graph
-            self.create_weight_graph(dates, weights_values)
+            self.create_weight_graph(self.weight_data)
 
         # Update target weight UI
         self.update_target_ui()
@@ -313,21 +323,19 @@ class AnimalDetailScreen(MDScreen):
                 height=dp(40)  # Fixed height for visibility
             ))
 
-    def format_date_for_display(self, date_str):
-        """Convert YYYY-MM-DD to DD.MM for display on graph axis."""
-        try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            return date_obj.strftime("%d.%m.%y")
-        except ValueError:
-            # Try other date formats
-            try:
-                date_obj = datetime.strptime(date_str, "%d.%m.%Y")
-                return date_obj.strftime("%d.%m")
-            except ValueError:
-                return date_str  # Return original if parsing fails
+    def create_weight_graph(self, weight_data):
+        """
+        Create a line graph showing weight over time with dates on x-axis.
+
+        The x axis is scaled in days and long histories are downsampled, so
+        the number of points drawn does not grow with the history.
+        """
+        points = downsample_series(weight_data)
+        if len(points) < 2:
+            return
+
+        weights = [weight for _, weight in points]
 
-    def create_weight_graph(self, dates, weights):
-        """Create a line graph showing weight over time with dates on x-axis."""
         # Calculate min/max values for better scaling
         min_weight = min(weights)
         max_weight = max(weights)
@@ -343,19 +351,21 @@ class AnimalDetailScreen(MDScreen):
             y_min = min(y_min, self.target_weight - padding)
             y_max = max(y_max, self.target_weight + padding)
 
+        x_min, x_max, x_step = time_axis(points)
+
         # Create the graph widget
         graph = Graph(
             xlabel='Date',
             ylabel='Weight (kg)',
-            x_ticks_major=1,
+            x_ticks_major=x_step,
             y_ticks_major=(y_max - y_min) / 5,
             y_grid_label=True,
-            x_grid_label=True,
+            x_grid_label=False,  # Dates are shown in the label row below
             padding=5,
             x_grid=True,
             y_grid=True,
-            xmin=0,
-            xmax=len(dates) - 1,
+            xmin=x_min,
+            xmax=x_max,
             ymin=y_min,
             ymax=y_max,
             size_hint_y=None,
@@ -364,24 +374,19 @@ class AnimalDetailScreen(MDScreen):
 
         # Create the main weight plot
         plot = MeshLinePlot(color=get_color_from_hex('#4f46e5'))
-        plot.points = [(i, weights[i]) for i in range(len(weights))]
+        plot.points = points
         plot.line_width = 4  # Thicker line
         graph.add_plot(plot)
 
-        # Add data points:
-        # Add dots for data points
-        for i, y in enumerate(weights):
-            with graph.canvas.after:
-                Color(rgba=get_color_from_hex('#4f46e5'))
-                d = dp(6)  # diameter
-                x_px = graph.x + graph.width * ((i - graph.xmin) / (graph.xmax - graph.xmin))
-                y_px = graph.y + graph.height * ((y - graph.ymin) / (graph.ymax - graph.ymin))
-                Ellipse(pos=(x_px - d / 2, y_px - d / 2), size=(d, d))
+        # Add dots for data points, drawn as one batch
+        dots = ScatterPlot(color=get_color_from_hex('#4f46e5'), point_size=dp(3))
+        dots.points = points
+        graph.add_plot(dots)
 
         # Add target weight line if available
         if self.target_weight:
             target_plot = MeshLinePlot(color=get_color_from_hex('#4CAF50'))
-            target_plot.points = [(0, self.target_weight), (len(dates) - 1, self.target_weight)]
+            target_plot.points = [(x_min, self.target_weight), (x_max, self.target_weight)]
             target_plot.line_width = 4  # Thicker line
             graph.add_plot(target_plot)
 
@@ -417,26 +422,14 @@ class AnimalDetailScreen(MDScreen):
             padding=("0dp", "0dp", "0dp", "0dp")
         )
 
-        formatted_dates = [self.format_date_for_display(date) for date in dates]
-
-        displayed_dates = []
-        if len(formatted_dates) <= 5:
-            displayed_dates = formatted_dates
-        else:
-            step = max(1, len(formatted_dates) // 5)
-            indices = list(range(0, len(formatted_dates), step))
-            if len(formatted_dates) - 1 not in indices:
-                indices.append(len(formatted_dates) - 1)
-
-            displayed_dates = [""] * len(formatted_dates)
-            for idx in indices:
-                displayed_dates[idx] = formatted_dates[idx]
-
-        for date_text in displayed_dates:
+        # Label the middle of equal slots with the date at that point in time
+        label_count = 5
+        for index in range(label_count):
+            x = x_min + (x_max - x_min) * (index + 0.5) / label_count
             date_label = MDLabel(
-                text=date_text,
+                text=format_day(x),
                 halign="center",
-                size_hint_x=1.0 / len(displayed_dates),
+                size_hint_x=1.0 / label_count,
                 font_style="Body",
                 role="small"
             )
@@ -656,12 +649,12 @@ class AnimalDetailScreen(MDScreen):
 
         for index, (assessment_id, date, scale, result) in enumerate(assessments):
             try:
-                result_data = json.loads(result)
+                result_data = load_result(result)
                 if isinstance(result_data, dict) and "score" in result_data and "interpretation" in result_data:
                     result_display = f"{result_data['score']} - {result_data['interpretation']}"
                 else:
                     result_display = result
-            except (json.JSONDecodeError, TypeError):
+            except (ValueError, TypeError):
                 result_display = result
 
             bg_color = get_color_from_hex("#f0f0f0") if index % 2 == 0 else get_color_from_hex("#ffffff")
@@ -895,54 +888,40 @@ class AnimalDetailScreen(MDScreen):
         self.export_dialog.open()
 
     def export_animal(self, format_type):
-        """Export animal data in the selected format."""
+        """Queue an export of the animal's data in the selected format."""
         self.export_dialog.dismiss()
 
+        job_id = export_queue.submit(format_type, [self.animal_id], listener=self.on_export_progress)
+        if job_id is None:
+            self.show_error_dialog("Failed to export animal data")
+            return
+
         # Show loading indicator
-        self.show_loading_dialog("Exporting...")
+        self.show_loading_dialog("Exporting...", job_id)
 
-        # Run export in a separate thread to keep UI responsive
-        def export_thread():
-            export_manager = ExportManager()
+    def on_export_progress(self, progress):
+        """Receive job progress from a worker thread and forward it to the UI thread."""
+        from kivy.clock import Clock
+        Clock.schedule_once(lambda dt: self.update_export_progress(progress), 0)
 
-            try:
-                if format_type == "pdf":
-                    filename = export_manager.export_animal_to_pdf(self.animal_id)
-                    # Use Clock.schedule_once to update UI from the main thread
-                    from kivy.clock import Clock
-                    if filename:
-                        Clock.schedule_once(
-                            lambda dt: self.show_success_dialog(f"Exported to PDF:\n{os.path.basename(filename)}"), 0
-                        )
-                    else:
-                        Clock.schedule_once(
-                            lambda dt: self.show_error_dialog("Failed to export animal data"), 0
-                        )
-                elif format_type == "csv":
-                    filenames = export_manager.export_animal_to_csv(self.animal_id)
-                    from kivy.clock import Clock
-                    if filenames:
-                        Clock.schedule_once(
-                            lambda dt: self.show_success_dialog(
-                                f"Exported to CSV files:\n{', '.join([os.path.basename(f) for f in filenames])}"), 0
-                        )
-                    else:
-                        Clock.schedule_once(
-                            lambda dt: self.show_error_dialog("Failed to export animal data"), 0
-                        )
-            finally:
-                # Dismiss loading dialog
-                from kivy.clock import Clock
-                Clock.schedule_once(lambda dt: self.loading_dialog.dismiss(), 0.5)
-
-        # Start the export thread
-        from threading import Thread
-        thread = Thread(target=export_thread)
-        thread.daemon = True
-        thread.start()
-
-    def show_loading_dialog(self, message):
-        """Show a loading dialog."""
+    def update_export_progress(self, progress):
+        """Show the outcome of an export job once it has ended."""
+        if not progress or progress["status"] in ("queued", "running"):
+            return
+
+        if self.loading_dialog:
+            self.loading_dialog.dismiss()
+
+        if progress["status"] == "done":
+            self.show_success_dialog(
+                f"Exported to:\n{', '.join(os.path.basename(f) for f in progress['outputs'])}")
+        elif progress["status"] == "cancelled":
+            self.show_success_dialog("Export cancelled.")
+        else:
+            self.show_error_dialog("Failed to export animal data")
+
+    def show_loading_dialog(self, message, job_id=None):
+        """Show a loading dialog, with a cancel button for export jobs."""
         from kivymd.uix.progressindicator import MDCircularProgressIndicator
         from kivymd.uix.dialog import MDDialog, MDDialogHeadlineText, MDDialogContentContainer
 
@@ -970,10 +949,21 @@ class AnimalDetailScreen(MDScreen):
             adaptive_height=True
         ))
 
+        buttons = []
+        if job_id is not None:
+            buttons.append(MDDialogButtonContainer(
+                MDButton(
+                    MDButtonText(text="Cancel"),
+                    style="text",
+                    on_release=lambda x: export_queue.cancel(job_id)
+                )
+            ))
+
         # Create the dialog with proper structure
         self.loading_dialog = MDDialog(
             MDDialogHeadlineText(text="Please Wait"),
             MDDialogContentContainer(content),
+            *buttons,
             auto_dismiss=False
         )
-        self.loading_dialog.open()
\ No newline at end of file
+        self.loading_dialog.open()
@@ -1,5 +1,4 @@
 from kivy.uix.scrollview import ScrollView
-import json
 from datetime import datetime
 from functools import partial
 
@@ -7,17 +6,25 @@ from kivy.metrics import dp
 from kivy.uix.scrollview import ScrollView
 from kivy.utils import get_color_from_hex
 from kivymd.uix.boxlayout import MDBoxLayout
-from kivymd.uix.button import MDButton, MDButtonText
+from kivymd.uix.button import MDButton, MDButtonText, MDIconButton
 from kivymd.uix.card import MDCard
 from kivymd.uix.dialog import MDDialog, MDDialogHeadlineText, MDDialogContentContainer, MDDialogButtonContainer
 from kivymd.uix.label import MDLabel
 from kivymd.uix.list import MDListItem, MDListItemHeadlineText, MDListItemSupportingText
 from kivymd.uix.menu import MDDropdownMenu
 from kivymd.uix.screen import MDScreen
+from kivymd.uix.selectioncontrol import MDCheckbox
 from kivymd.uix.textfield import MDTextField
 
 import database
-from assessment_scales import ASSESSMENT_SCALES
+from managers.assessment_session import AssessmentSession
+from result_codec import load_result, parse_compact
+from scale_registry import registry
+from screens.detailed_assessment import draft_write_key
+from utils.async_writer import db_writer
+
+# Assessments loaded into the list at a time
+ASSESSMENT_PAGE_SIZE = 100
 
 
 class AssessmentsScreen(MDScreen):
@@ -41,10 +48,104 @@ class AssessmentsScreen(MDScreen):
         self.animal_field = None
         self.scale_field = None
 
+        # Newest change to the listed tables the list reflects; None to reload
+        self.list_seq = None
+
+        # Keyset paging of the list: filter of the loaded query and (date, id) of its last row
+        self.list_conditions = []
+        self.list_params = []
+        self.last_key = None
+        self.has_more = False
+
+        # Batch session being set up, see show_batch_session_dialog()
+        self.session_dialog = None
+        self.session_species = None
+        self.session_scale = None
+        self.session_animals = {}
+        self.session_species_field = None
+        self.session_scale_field = None
+        self.session_animals_box = None
+
     def on_enter(self):
         """Refresh assessments when entering the screen."""
         self.load_species_list()
-        self.load_assessments()
+        self.load_drafts()
+
+        # Results saved on other screens are added as they are written, so
+        # the list is only reloaded if anything else changed meanwhile
+        if self.list_seq is None or self.list_seq != database.get_latest_change_seq(database.ASSESSMENT_LIST_TABLES):
+            self.load_assessments()
+
+    def load_drafts(self):
+        """
+        Show unfinished assessments above the list so they can be resumed.
+
+        Drafts are read through the background writer, after any draft
+        writes still queued, so the list includes the latest answers.
+        """
+        db_writer.submit(database.get_assessment_drafts, key="load_drafts", callback=self.show_drafts)
+
+    def show_drafts(self, drafts):
+        """Fill the unfinished assessments section."""
+        box = self.ids.drafts_box
+        box.clear_widgets()
+
+        if not drafts:
+            return
+
+        box.add_widget(MDLabel(
+            text="Unfinished Assessments",
+            font_style="Title",
+            role="small",
+            adaptive_height=True,
+            padding=[dp(8), dp(8), dp(8), dp(4)]
+        ))
+
+        for animal_id, name, species, scale, answers, question_index, updated_at in drafts:
+            try:
+                answered = sum(answer is not None for answer in parse_compact(answers)[2])
+                progress = f"{answered} answered"
+            except ValueError:
+                progress = "Unreadable draft"
+
+            row = MDBoxLayout(orientation="horizontal", adaptive_height=True)
+            item = MDListItem(
+                on_release=partial(self.resume_draft, animal_id, name, species, scale, answers, question_index)
+            )
+            item.add_widget(MDListItemHeadlineText(text=f"{name} ({species}) - {scale}"))
+            item.add_widget(MDListItemSupportingText(text=f"{progress}, last saved {updated_at.replace('T', ' ')}"))
+            row.add_widget(item)
+            row.add_widget(MDIconButton(
+                icon="delete",
+                pos_hint={"center_y": 0.5},
+                on_release=partial(self.discard_draft, animal_id, scale)
+            ))
+            box.add_widget(row)
+
+    def resume_draft(self, animal_id, animal_name, species, scale, answers, question_index, *args):
+        """Continue an unfinished assessment where it was left."""
+        from kivymd.app import MDApp
+        app = MDApp.get_running_app()
+
+        detailed_screen = app.screen_manager.get_screen('detailed_assessment')
+        try:
+            detailed_screen.set_assessment_params(
+                animal_id, animal_name, species, scale, draft=(answers, question_index)
+            )
+        except ValueError:
+            self.show_error_dialog("This draft cannot be resumed.")
+            return
+
+        app.screen_manager.current = 'detailed_assessment'
+
+    def discard_draft(self, animal_id, scale, *args):
+        """Delete an unfinished assessment."""
+        # Same key as the draft's own writes, so a pending save cannot revive it
+        db_writer.submit(
+            database.delete_assessment_draft, animal_id, scale,
+            key=draft_write_key(animal_id, scale),
+            callback=lambda result: self.load_drafts()
+        )
 
     def load_species_list(self):
         """Load list of species for filtering."""
@@ -91,9 +192,6 @@ class AssessmentsScreen(MDScreen):
         species_filter = self.ids.species_filter.text
 
         # Build query conditions
-        query = """SELECT a.id, a.date, a.scale_used, a.result, n.name, n.species, a.animal_id
-                   FROM assessments a
-                   JOIN animals n ON a.animal_id = n.id"""
         params = []
         conditions = []
 
@@ -105,61 +203,135 @@ class AssessmentsScreen(MDScreen):
             conditions.append("n.species = ?")
             params.append(species_filter)
 
-        # Add WHERE clause if there are conditions
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        query += " ORDER BY a.date DESC"
+        self.list_conditions = conditions
+        self.list_params = params
+        self.last_key = None
+        self.has_more = True
+        self.list_seq = database.get_latest_change_seq(database.ASSESSMENT_LIST_TABLES)
 
-        # Execute query with parameters
-        assessments = database.execute_query(query, params, fetch_mode='all') or []
+        self.ids.assessments_list.data = []
+        self.ids.assessments_list.scroll_y = 1
+        self.load_next_page()
 
-        # Update the UI with filtered results
-        self.update_assessments_list(assessments)
+    def load_next_page(self):
+        """Append the next page of filtered assessments to the list, newest first."""
+        if not self.has_more:
+            return
 
-    def update_assessments_list(self, assessments):
-        """Update the list display with filtered assessments."""
-        self.ids.assessments_list.clear_widgets()
+        conditions = list(self.list_conditions)
+        params = list(self.list_params)
+        if self.last_key:
+            # Keyset paging: continue after the last loaded row using the (date, id) index
+            conditions.append("(a.date, a.id) < (?, ?)")
+            params.extend(self.last_key)
+
+        # Stored results are only needed for rows without a score column value
+        query = """SELECT a.id, a.date, a.scale_used, a.score, a.interpretation,
+                          CASE WHEN a.score IS NULL THEN a.result END,
+                          n.name, n.species, a.animal_id
+                   FROM assessments a
+                   JOIN animals n ON a.animal_id = n.id"""
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY a.date DESC, a.id DESC LIMIT ?"
+        params.append(ASSESSMENT_PAGE_SIZE)
 
-        if not assessments:
-            # Show empty state
-            empty_item = MDListItem()
-            empty_item.add_widget(MDListItemHeadlineText(text="No assessments match the filter criteria"))
-            self.ids.assessments_list.add_widget(empty_item)
-            return
+        rows = database.execute_query(query, params, fetch_mode='all') or []
+        self.has_more = len(rows) == ASSESSMENT_PAGE_SIZE
+        if rows:
+            self.last_key = (rows[-1][1], rows[-1][0])
+            self.ids.assessments_list.data.extend(self.assessment_row(*row) for row in rows)
 
-        # Add assessments to the list - same code as in load_assessments but using filtered data
-        for assessment in assessments:
-            a_id = assessment[0]
-            animal_id = assessment[6]
-            result_text = assessment[3]
+        self.update_empty_state()
 
-            # Try to parse JSON result for richer display
+    def on_list_scroll(self, recycle_view):
+        """Load the next page once the list is scrolled to within a screen of its end."""
+        if not self.has_more or not recycle_view.children:
+            return
+        hidden_height = recycle_view.children[0].height - recycle_view.height
+        if recycle_view.scroll_y * max(hidden_height, 0) < recycle_view.height:
+            self.load_next_page()
+
+    def update_empty_state(self):
+        """Show a message instead of the list when no assessment matches."""
+        empty = not self.ids.assessments_list.data
+        self.ids.empty_label.text = "No assessments match the filter criteria" if empty else ""
+
+    def assessment_row(self, assessment_id, date, scale_used, score, interpretation, result,
+                       animal_name, species, animal_id):
+        """
+        Return the list data of an assessment.
+
+        Args:
+            result: Stored result, only needed if score is None
+
+        Returns:
+            dict: Properties of an AssessmentListItem
+        """
+        if score is not None:
+            result_display = f"{scale_used}: {score} - {interpretation}"
+        else:
+            # Results saved without a score, e.g. free text
             try:
-                result_data = json.loads(result_text)
+                result_data = load_result(result)
                 if isinstance(result_data, dict) and "score" in result_data and "interpretation" in result_data:
-                    result_display = f"{assessment[2]}: {result_data['score']} - {result_data['interpretation']}"
+                    result_display = f"{scale_used}: {result_data['score']} - {result_data['interpretation']}"
                 else:
-                    result_display = f"{assessment[2]}: {result_text}"
-            except (json.JSONDecodeError, TypeError):
+                    result_display = f"{scale_used}: {result}"
+            except (ValueError, TypeError):
                 # Not JSON or parsing failed, use raw text
-                result_display = f"{assessment[2]}: {result_text}"
-
-            item = MDListItem(
-                on_release=partial(self.on_assessment_item_click, a_id, animal_id)
-            )
+                result_display = f"{scale_used}: {result}"
+
+        return {
+            "assessment_id": assessment_id,
+            "animal_id": animal_id,
+            "date_text": date,
+            "animal_text": f"{animal_name} ({species})",
+            "result_text": result_display,
+        }
+
+    def add_saved_assessment(self, assessment, seq_before, seq):
+        """
+        Add a newly saved assessment to the list without reloading it.
+
+        Args:
+            assessment: (id, date, scale_used, score, interpretation, result,
+                animal name, species, animal_id) row
+            seq_before: Newest change to the listed tables before it was saved
+            seq: change_log sequence number of the insert
+        """
+        if self.list_seq is None or self.list_seq >= seq:
+            # Not loaded yet, or loaded after the insert and already listed
+            return
+        if self.list_seq != seq_before:
+            # Something else changed too; reload when the screen is entered
+            self.list_seq = None
+            return
 
-            # Add headline text (date)
-            item.add_widget(MDListItemHeadlineText(text=assessment[1]))  # Date
+        self.list_seq = seq
+        assessment_id, date = assessment[0], assessment[1]
+        if not self.matches_filters(assessment[6], assessment[7], assessment[8]):
+            return
+        if self.has_more and (date, assessment_id) < self.last_key:
+            # Beyond the loaded pages; it is loaded with them
+            return
 
-            # Add animal info
-            item.add_widget(
-                MDListItemHeadlineText(text=f"{assessment[4]} ({assessment[5]})"))  # Animal name and species
+        # Keep the newest-first order; new assessments are dated today, so this stops at the top
+        data = self.ids.assessments_list.data
+        position = 0
+        while position < len(data) and (data[position]["date_text"], data[position]["assessment_id"]) > (date, assessment_id):
+            position += 1
+        data.insert(position, self.assessment_row(*assessment))
+        self.update_empty_state()
 
-            # Add result info
-            item.add_widget(MDListItemSupportingText(text=result_display))
+    def matches_filters(self, animal_name, species, animal_id):
+        """Return True if an assessment passes the search and species filters."""
+        search_text = self.ids.search_field.text.strip().lower()
+        species_filter = self.ids.species_filter.text
 
-            self.ids.assessments_list.add_widget(item)
+        if search_text and search_text not in animal_name.lower() and search_text not in str(animal_id):
+            return False
+        return not species_filter or species_filter == "All Species" or species == species_filter
 
     def load_assessments(self):
         """Load all assessments into the list."""
@@ -169,17 +341,7 @@ class AssessmentsScreen(MDScreen):
         if hasattr(self.ids, 'species_filter'):
             self.ids.species_filter.text = ""
 
-        assessments = database.execute_query(
-            """
-            SELECT a.id, a.date, a.scale_used, a.result, n.name, n.species, a.animal_id
-            FROM assessments a
-            JOIN animals n ON a.animal_id = n.id
-            ORDER BY a.date DESC
-            """,
-            fetch_mode='all'
-        )
-
-        self.update_assessments_list(assessments)
+        self.filter_assessments()
 
     # In both screens/my_animals.py and screens/assessments.py
     def clear_filters(self):
@@ -307,11 +469,8 @@ class AssessmentsScreen(MDScreen):
 
         self.dialog.dismiss()
 
-        # Get assessment scales for the selected species
-        if self.selected_animal_species in ASSESSMENT_SCALES:
-            scales = list(ASSESSMENT_SCALES[self.selected_animal_species].keys())
-        else:
-            scales = ["General Assessment"]
+        # Get assessment scales for the selected species; only its data file is loaded
+        scales = registry.scale_names(self.selected_animal_species) or ["General Assessment"]
 
         # Create dialog for scale selection
         content = MDBoxLayout(
@@ -404,6 +563,152 @@ class AssessmentsScreen(MDScreen):
         # Switch to the detailed assessment screen
         app.screen_manager.current = 'detailed_assessment'
 
+    def show_batch_session_dialog(self):
+        """Show a dialog to assess several animals of one species with the same scale."""
+        self.session_species = None
+        self.session_scale = None
+        self.session_animals = {}
+
+        content = MDBoxLayout(
+            orientation="vertical",
+            spacing="12dp",
+            padding=["20dp", "20dp", "20dp", "20dp"],
+            adaptive_height=True
+        )
+
+        self.session_species_field = MDTextField(hint_text="Select Species", mode="outlined")
+        self.session_species_field.bind(focus=self.show_session_species_menu)
+        content.add_widget(self.session_species_field)
+
+        self.session_scale_field = MDTextField(hint_text="Select Assessment Scale", mode="outlined")
+        self.session_scale_field.bind(focus=self.show_session_scale_menu)
+        content.add_widget(self.session_scale_field)
+
+        # Animals of the selected species, filled by select_session_species()
+        self.session_animals_box = MDBoxLayout(orientation="vertical", adaptive_height=True)
+        scroll = ScrollView(size_hint_y=None, height=dp(240))
+        scroll.add_widget(self.session_animals_box)
+        content.add_widget(scroll)
+
+        self.session_dialog = MDDialog(
+            MDDialogHeadlineText(text="Batch Assessment"),
+            MDDialogContentContainer(content),
+            MDDialogButtonContainer(
+                MDButton(
+                    MDButtonText(text="Cancel"),
+                    style="text",
+                    on_release=lambda x: self.session_dialog.dismiss()
+                ),
+                MDButton(
+                    MDButtonText(text="Start Session"),
+                    style="elevated",
+                    on_release=lambda x: self.start_batch_session()
+                ),
+                spacing="8dp"
+            ),
+            auto_dismiss=False
+        )
+        self.session_dialog.open()
+
+    def show_session_species_menu(self, field_widget, focus):
+        """Show dropdown menu for the species of a batch session."""
+        if not focus:
+            return
+
+        menu_items = [
+            {"text": species, "on_release": partial(self.select_session_species, species)}
+            for species in registry.species_names()
+        ]
+        self.menu = MDDropdownMenu(
+            caller=field_widget,
+            items=menu_items,
+            width_mult=4,
+            position="bottom"
+        )
+        self.menu.open()
+
+    def select_session_species(self, species, *args):
+        """Select the species of a batch session and list its animals, all selected."""
+        self.session_species = species
+        self.session_species_field.text = species
+        self.session_scale = None
+        self.session_scale_field.text = ""
+        if self.menu:
+            self.menu.dismiss()
+
+        animals = database.get_animals_by_species(species)
+        self.session_animals = {animal_id: name for animal_id, name, _ in animals}
+
+        self.session_animals_box.clear_widgets()
+        for animal_id, name, _ in animals:
+            row = MDBoxLayout(orientation="horizontal", size_hint_y=None, height=dp(48))
+            checkbox = MDCheckbox(
+                size_hint=(None, None),
+                size=("48dp", "48dp"),
+                pos_hint={"center_y": 0.5},
+                active=True
+            )
+            checkbox.bind(active=lambda cb, value, aid=animal_id, n=name: self.on_session_animal_select(aid, n, value))
+            row.add_widget(checkbox)
+            row.add_widget(MDLabel(text=name, pos_hint={"center_y": 0.5}))
+            self.session_animals_box.add_widget(row)
+
+    def on_session_animal_select(self, animal_id, name, value):
+        """Add an animal to or remove it from the batch session."""
+        if value:
+            self.session_animals[animal_id] = name
+        else:
+            self.session_animals.pop(animal_id, None)
+
+    def show_session_scale_menu(self, field_widget, focus):
+        """Show dropdown menu for the scale of a batch session."""
+        if not focus or not self.session_species:
+            return
+
+        menu_items = [
+            {"text": scale, "on_release": partial(self.select_session_scale, scale)}
+            for scale in registry.scale_names(self.session_species)
+        ]
+        self.scale_menu = MDDropdownMenu(
+            caller=field_widget,
+            items=menu_items,
+            width_mult=4,
+            position="bottom"
+        )
+        self.scale_menu.open()
+
+    def select_session_scale(self, scale, *args):
+        """Select the scale of a batch session."""
+        self.session_scale = scale
+        self.session_scale_field.text = scale
+        if self.scale_menu:
+            self.scale_menu.dismiss()
+
+    def start_batch_session(self):
+        """Start assessing the selected animals one after the other."""
+        if not self.session_species or not self.session_scale or not self.session_animals:
+            return
+
+        try:
+            # Animals are assessed in the order they are listed
+            session = AssessmentSession(
+                sorted(self.session_animals.items(), key=lambda animal: animal[1]),
+                self.session_species,
+                self.session_scale
+            )
+        except KeyError:
+            self.show_error_dialog(f"Scale '{self.session_scale}' not found for {self.session_species}")
+            return
+
+        self.session_dialog.dismiss()
+
+        from kivymd.app import MDApp
+        app = MDApp.get_running_app()
+
+        detailed_screen = app.screen_manager.get_screen('detailed_assessment')
+        detailed_screen.start_session(session)
+        app.screen_manager.current = 'detailed_assessment'
+
     def save_assessment(self, scale, result):
         """Save the assessment to the database."""
         if not scale or not result:
@@ -435,7 +740,7 @@ class AssessmentsScreen(MDScreen):
         try:
             # DEBUG
             print(f"trying to parse: {result_text}")
-            result_data = json.loads(result_text)
+            result_data = load_result(result_text)
             print(f"Parsed data: {result_data}")
 
             if isinstance(result_data, dict):
@@ -445,7 +750,7 @@ class AssessmentsScreen(MDScreen):
             else:
                 # Fall back to simple display
                 content = self.create_simple_assessment_content(assessment)
-        except (json.JSONDecodeError, TypeError):
+        except (ValueError, TypeError):
             # Not JSON or parsing failed, use simple display
             content = self.create_simple_assessment_content(assessment)
 
@@ -1,7 +1,8 @@
 from kivymd.uix.screen import MDScreen
-import json
 from datetime import datetime
+from functools import partial
 
+from kivy.clock import Clock
 from kivy.metrics import dp
 from kivy.properties import StringProperty, NumericProperty, ListProperty
 from kivy.utils import get_color_from_hex
@@ -12,8 +13,151 @@ from kivymd.uix.label import MDLabel
 from kivymd.uix.screen import MDScreen
 
 import database
-# Import the assessment scales
-from assessment_scales import ASSESSMENT_SCALES
+from managers.report_fragments import report_fragments
+from result_codec import dump_result, encode_result, parse_compact
+from scale_registry import get_compiled_scale
+from scoring import score_compiled
+from utils.async_writer import db_writer
+
+
+# Delay between selecting an answer and moving on to the next question
+ADVANCE_DELAY = 0.3
+
+
+def draft_write_key(animal_id, scale_name):
+    """Key under which the background writes of one assessment draft are coalesced."""
+    return ("assessment_draft", animal_id, scale_name)
+
+
+def save_assessment_result(assessment):
+    """
+    Write a finished assessment; runs on the background writer.
+
+    The assessment's draft is deleted once the result is saved, and the
+    report fragments are prepared.
+
+    Args:
+        assessment: (animal_id, date, scale_used, result, scale_version,
+            score, interpretation) tuple
+
+    Returns:
+        tuple: (assessment, assessment ID, change seq before, change seq of
+        the insert), see database.add_assessment_logged(), or None on failure
+    """
+    saved = database.add_assessment_logged(assessment, database.ASSESSMENT_LIST_TABLES)
+    if not saved:
+        return None
+
+    assessment_id, seq_before, seq = saved
+    animal_id, date, scale_used, result = assessment[:4]
+    database.delete_assessment_draft(animal_id, scale_used)
+
+    # Prepare the report content now instead of at export time
+    report_fragments.on_assessment_saved(assessment_id, animal_id, date, scale_used, result)
+    return assessment, assessment_id, seq_before, seq
+
+
+class QuestionView:
+    """
+    The widgets showing one question and its answer options.
+
+    Widgets are created once and rebound to other questions by changing
+    their text; option buttons are kept in a pool that only grows when a
+    question has more options than any before it. Selecting an answer only
+    changes the style of the affected buttons.
+    """
+
+    def __init__(self, on_select):
+        """
+        Create the view's widgets.
+
+        Args:
+            on_select: Function called with the option index when an option is tapped
+        """
+        self.on_select = on_select
+        self.question_index = None
+        self.selected = None
+
+        self.question_box = MDBoxLayout(
+            orientation="vertical",
+            adaptive_height=True,
+            padding=dp(16),
+            spacing=dp(8)
+        )
+        self.question_label = MDLabel(
+            font_style="Title",
+            role="medium",
+            adaptive_height=True
+        )
+        self.guidance_label = MDLabel(
+            theme_text_color="Secondary",
+            font_style="Body",
+            role="small",
+            adaptive_height=True
+        )
+        self.question_box.add_widget(self.question_label)
+
+        self.options_box = MDBoxLayout(
+            orientation="vertical",
+            adaptive_height=True,
+            spacing=dp(8)
+        )
+        self.option_buttons = []
+        self.option_labels = []
+
+    def _add_option_button(self):
+        """Grow the option button pool by one button."""
+        position = len(self.option_buttons)
+        label = MDButtonText(padding=dp(16))
+        button = MDButton(
+            label,
+            style="outlined",
+            on_release=lambda x: self.on_select(position)
+        )
+        self.option_buttons.append(button)
+        self.option_labels.append(label)
+
+    def bind(self, question_index, question, selected):
+        """
+        Show a question in this view.
+
+        Args:
+            question_index: Position of the question in the scale
+            question: CompiledQuestion to show
+            selected: Index of the selected option, or None
+        """
+        self.question_index = question_index
+        self.question_label.text = question.question
+
+        if question.guidance:
+            self.guidance_label.text = f"Guidance: {question.guidance}"
+            if self.guidance_label.parent is None:
+                self.question_box.add_widget(self.guidance_label)
+        elif self.guidance_label.parent is not None:
+            self.question_box.remove_widget(self.guidance_label)
+
+        option_count = len(question.option_texts)
+        while len(self.option_buttons) < option_count:
+            self._add_option_button()
+
+        # Shown buttons are always a prefix of the pool, so their order is kept
+        for position, button in enumerate(self.option_buttons):
+            if position < option_count:
+                self.option_labels[position].text = question.option_texts[position]
+                button.style = "elevated" if position == selected else "outlined"
+                if button.parent is None:
+                    self.options_box.add_widget(button)
+            elif button.parent is not None:
+                self.options_box.remove_widget(button)
+
+        self.selected = selected
+
+    def set_selected(self, selected):
+        """Highlight the selected option, restyling only the buttons that change."""
+        for position in (self.selected, selected):
+            if position is not None and position < len(self.option_buttons):
+                self.option_buttons[position].style = "elevated" if position == selected else "outlined"
+        self.selected = selected
 
 
 class DetailedAssessmentScreen(MDScreen):
@@ -43,7 +187,15 @@ class DetailedAssessmentScreen(MDScreen):
 
         self.dialog = None
         self.result_dialog = None
-        self.scale_data = None
+        self.compiled_scale = None
+
+        # Batch session in progress, see start_session()
+        self.session = None
+
+        # Two question views: the one shown and one prepared with the next question
+        self.question_views = []
+        self.shown_view = None
+        self._advance_event = None
 
         super().__init__(**kwargs)
 
@@ -52,34 +204,85 @@ class DetailedAssessmentScreen(MDScreen):
         # Update the UI after kv processing
         self.update_ui()
 
-    def set_assessment_params(self, animal_id, animal_name, animal_species, scale_name):
-        """Set up the assessment parameters and load the scale."""
+    def set_assessment_params(self, animal_id, animal_name, animal_species, scale_name, draft=None):
+        """
+        Set up the assessment parameters and load the scale.
+
+        Args:
+            draft: Optional (answers, question_index) of a saved draft to
+                resume; answers are in the compact result format and select
+                the scale version the draft was started with
+        """
+        self.end_session()
         self.animal_id = animal_id
         self.animal_name = animal_name
         self.animal_species = animal_species
         self.selected_scale = scale_name
 
-        # Reset assessment state
-        self.current_question_idx = 0
-        self.answers = []
-
-        # Load the scale data
-        if animal_species in ASSESSMENT_SCALES and scale_name in ASSESSMENT_SCALES[animal_species]:
-            self.scale_data = ASSESSMENT_SCALES[animal_species][scale_name]
-            self.questions = self.scale_data["questions"]
-            self.total_questions = len(self.questions)
-
-            # Pre-initialize answers array
-            self.answers = [None] * self.total_questions
+        draft_answers = None
+        if draft:
+            _, version, draft_answers = parse_compact(draft[0])
+            compiled_scale = get_compiled_scale(animal_species, scale_name, version)
+        else:
+            # New assessments use the current version of the scale
+            compiled_scale = get_compiled_scale(animal_species, scale_name)
 
-            # Update the UI
-            self.update_ui()
+        if compiled_scale:
+            self.start_questions(compiled_scale, draft_answers, draft[1] if draft else 0)
         else:
+            self.compiled_scale = None
             self.show_error_dialog(f"Scale '{scale_name}' not found for {animal_species}")
 
+    def start_session(self, session):
+        """
+        Assess the animals of a batch session one after the other.
+
+        Args:
+            session: AssessmentSession holding the animals, the scale and the
+                results recorded so far
+        """
+        self.end_session()
+        self.session = session
+        self.animal_species = session.species
+        self.selected_scale = session.scale.name
+        self.show_session_animal()
+
+    def show_session_animal(self):
+        """Start the questions for the session's current animal."""
+        self.animal_id, self.animal_name = self.session.current_animal
+        self.start_questions(self.session.scale)
+
+    def start_questions(self, compiled_scale, answers=None, question_index=0):
+        """
+        Reset the assessment state and show the first question to answer.
+
+        Args:
+            compiled_scale: CompiledScale to assess with
+            answers: Optional answers to resume with, one option index (or
+                None) per question
+            question_index: Question to resume at when answers are given
+        """
+        self._cancel_advance()
+        for view in self.question_views:
+            view.question_index = None
+
+        self.compiled_scale = compiled_scale
+        self.questions = list(compiled_scale.questions)
+        self.total_questions = len(self.questions)
+        self.current_question_idx = 0
+
+        # Pre-initialize answers array
+        self.answers = [None] * self.total_questions
+        if answers and len(answers) == self.total_questions:
+            self.answers = answers
+            self.current_question_idx = min(question_index, self.total_questions - 1)
+
+        # Update the UI
+        self.update_ui()
+
     def on_enter(self):
         """Called when screen is entered."""
-        if self.scale_data:
+        if self.compiled_scale:
             self.update_ui()
 
     def update_ui(self):
@@ -87,61 +290,57 @@ class DetailedAssessmentScreen(MDScreen):
         if not hasattr(self, 'ids') or not self.ids:
             return
 
-        if not self.scale_data or self.current_question_idx >= self.total_questions:
+        if not self.compiled_scale or self.current_question_idx >= self.total_questions:
             return
 
-        # Clear previous content
-        self.ids.question_container.clear_widgets()
-        self.ids.options_container.clear_widgets()
-
         # Update header and progress information
-        self.ids.assessment_title.text = self.scale_data["title"]
+        self.ids.assessment_title.text = self.compiled_scale.title
         self.ids.animal_info.text = f"{self.animal_name} ({self.animal_species})"
+        if self.session:
+            self.ids.animal_info.text += (
+                f" - Animal {self.session.position + 1} of {len(self.session.animals)}"
+            )
         self.ids.progress_text.text = f"Question {self.current_question_idx + 1} of {self.total_questions}"
         self.ids.progress_bar.value = ((self.current_question_idx + 1) / self.total_questions) * 100
 
-        # Get current question
-        question_data = self.questions[self.current_question_idx]
+        self.show_question(self.current_question_idx)
 
-        # Add question text
-        question_box = MDBoxLayout(
-            orientation="vertical",
-            adaptive_height=True,
-            padding=dp(16),
-            spacing=dp(8)
-        )
+    def show_question(self, index):
+        """
+        Show a question, using the prepared view if it already holds it.
 
-        question_box.add_widget(MDLabel(
-            text=question_data["question"],
-            font_style="Title",
-            role="medium",
-            adaptive_height=True
-        ))
+        The other view is then rebound to the following question in the next
+        frame, so moving on only swaps the two views.
+        """
+        if not self.question_views:
+            self.question_views = [QuestionView(self.select_answer), QuestionView(self.select_answer)]
 
-        # Add guidance if available
-        if "guidance" in question_data:
-            guidance_label = MDLabel(
-                text=f"Guidance: {question_data['guidance']}",
-                theme_text_color="Secondary",
-                font_style="Body",
-                role="small",
-                adaptive_height=True
-            )
-            question_box.add_widget(guidance_label)
+        view = next((view for view in self.question_views if view.question_index == index), None)
+        if view is None:
+            view = self.spare_view()
+            view.bind(index, self.questions[index], self.answers[index])
+        else:
+            view.set_selected(self.answers[index])
 
-        self.ids.question_container.add_widget(question_box)
+        if view is not self.shown_view:
+            self.ids.question_container.clear_widgets()
+            self.ids.options_container.clear_widgets()
+            self.ids.question_container.add_widget(view.question_box)
+            self.ids.options_container.add_widget(view.options_box)
+            self.shown_view = view
 
-        # Add option buttons
-        for i, option in enumerate(question_data["options"]):
-            option_button = MDButton(
-                style="outlined" if self.answers[self.current_question_idx] != i else "elevated",
-                on_release=lambda x, idx=i: self.select_answer(idx)
-            )
-            option_button.add_widget(MDButtonText(
-                text=option["text"],
-                padding=dp(16)
-            ))
-            self.ids.options_container.add_widget(option_button)
+        Clock.schedule_once(lambda dt: self.prepare_question(index + 1), 0)
+
+    def spare_view(self):
+        """Return the question view that is not shown."""
+        return next(view for view in self.question_views if view is not self.shown_view)
+
+    def prepare_question(self, index):
+        """Bind the spare view to a question ahead of time."""
+        if not self.compiled_scale or index >= self.total_questions:
+            return
+        if all(view.question_index != index for view in self.question_views):
+            self.spare_view().bind(index, self.questions[index], self.answers[index])
 
     def select_answer(self, option_index):
         """Handle selection of an answer option."""
@@ -149,15 +348,35 @@ class DetailedAssessmentScreen(MDScreen):
             # Save the answer (store the option index)
             self.answers[self.current_question_idx] = option_index
 
-            # Update UI to show selected option
-            self.update_ui()
+            # Only the highlighted option changes
+            self.shown_view.set_selected(option_index)
+            self.save_draft()
 
             # After a short delay, move to next question or finish
-            from kivy.clock import Clock
-            Clock.schedule_once(lambda dt: self.next_question(), 0.3)
+            self._cancel_advance()
+            self._advance_event = Clock.schedule_once(lambda dt: self.next_question(), ADVANCE_DELAY)
+
+    def save_draft(self):
+        """Store the answers so far in the background so the assessment can be resumed."""
+        answers = encode_result(self.compiled_scale, self.answers)
+        if answers is None:
+            return
+        resume_at = min(self.current_question_idx + 1, self.total_questions - 1)
+        db_writer.submit(
+            database.save_assessment_draft,
+            self.animal_id, self.selected_scale, answers, resume_at,
+            key=draft_write_key(self.animal_id, self.selected_scale)
+        )
+
+    def _cancel_advance(self):
+        """Cancel a pending move to the next question."""
+        if self._advance_event:
+            self._advance_event.cancel()
+            self._advance_event = None
 
     def next_question(self):
         """Move to the next question or finish the assessment."""
+        self._cancel_advance()
         if self.current_question_idx < self.total_questions - 1:
             # Move to next question
             self.current_question_idx += 1
@@ -168,42 +387,21 @@ class DetailedAssessmentScreen(MDScreen):
 
     def prev_question(self):
         """Move to the previous question."""
+        self._cancel_advance()
         if self.current_question_idx > 0:
             self.current_question_idx -= 1
             self.update_ui()
 
     def calculate_score(self):
         """Calculate the total score based on answers."""
-        total_score = 0
-        score_details = []
-
-        for i, answer_idx in enumerate(self.answers):
-            if answer_idx is not None:
-                question = self.questions[i]
-                score = question["options"][answer_idx]["score"]
-                total_score += score
-                score_details.append({
-                    "question": question["question"],
-                    "answer": question["options"][answer_idx]["text"],
-                    "score": score
-                })
-
-        # Find the interpretation based on score
-        interpretation = {"text": "No interpretation available", "color": "blue"}
-
-        for interp in self.scale_data["interpretation"]:
-            if interp["range"][0] <= total_score <= interp["range"][1]:
-                interpretation = interp
-                break
-
-        return {
-            "total_score": total_score,
-            "details": score_details,
-            "interpretation": interpretation
-        }
+        return score_compiled(self.compiled_scale, self.answers)
 
     def show_results(self):
         """Display assessment results and save to database."""
+        if self.session:
+            self.record_session_result()
+            return
+
         result = self.calculate_score()
 
         # Create results display
@@ -285,21 +483,21 @@ class DetailedAssessmentScreen(MDScreen):
 
             content.add_widget(detail_box)
 
-        # Save result to database as JSON string
-        result_data = {
-            "score": result["total_score"],
-            "interpretation": result["interpretation"]["text"],
-            "details": result["details"]
-        }
-
-        result_json = json.dumps(result_data)
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        database.add_assessment(
+        # Save the answers compactly; texts are resolved from the scale when read
+        assessment = (
             self.animal_id,
-            today,
+            datetime.now().strftime("%Y-%m-%d"),
             self.selected_scale,
-            result_json
+            dump_result(self.compiled_scale, self.answers, result),
+            self.compiled_scale.version,
+            result["total_score"],
+            result["interpretation"]["text"]
+        )
+
+        # Written in the background; the results are shown without waiting for it
+        db_writer.submit(
+            save_assessment_result, assessment,
+            callback=partial(self.on_result_saved, self.animal_name, self.animal_species)
         )
 
         # Show results dialog
@@ -316,6 +514,118 @@ class DetailedAssessmentScreen(MDScreen):
         )
         self.result_dialog.open()
 
+    def on_result_saved(self, animal_name, animal_species, saved):
+        """
+        Add a saved result to the assessments list, or report that saving failed.
+
+        Args:
+            saved: Return value of save_assessment_result()
+        """
+        if not saved:
+            self.show_save_error()
+            return
+
+        assessment, assessment_id, seq_before, seq = saved
+        from kivymd.app import MDApp
+        assessments_screen = MDApp.get_running_app().screen_manager.get_screen('assessments')
+        assessments_screen.add_saved_assessment(
+            (assessment_id, assessment[1], assessment[2], assessment[5], assessment[6], assessment[3],
+             animal_name, animal_species, assessment[0]),
+            seq_before,
+            seq
+        )
+
+    def show_save_error(self):
+        """Tell the user that a result could not be saved; its answers stay a draft."""
+        self.dialog = MDDialog(
+            MDDialogHeadlineText(text="Error"),
+            MDDialogContentContainer(MDLabel(
+                text="The assessment could not be saved. Its answers are kept as an "
+                     "unfinished assessment on the Assessments screen."
+            )),
+            MDDialogButtonContainer(
+                MDButton(
+                    MDButtonText(text="OK"),
+                    style="text",
+                    on_release=lambda x: self.dialog.dismiss()
+                )
+            )
+        )
+        self.dialog.open()
+
+    def record_session_result(self):
+        """
+        Keep the current animal's result in the session and move on to the next animal.
+
+        The draft stays until the session writes the result, see AssessmentSession.
+        """
+        self.session.record(self.answers)
+
+        if self.session.finished:
+            session = self.session
+            self.session = None
+            session.finish(callback=self.show_session_summary)
+        else:
+            self.show_session_animal()
+
+    def end_session(self):
+        """Write the results of an unfinished session, e.g. when the screen is left."""
+        if self.session:
+            session, self.session = self.session, None
+            session.finish()
+
+    def checkpoint_session(self):
+        """Write the results recorded so far, e.g. before the app is paused."""
+        if self.session:
+            self.session.checkpoint()
+
+    def show_session_summary(self, session):
+        """Show the scores of a finished session once its results are written."""
+        content = MDBoxLayout(
+            orientation="vertical",
+            spacing=dp(8),
+            padding=dp(16),
+            adaptive_height=True
+        )
+
+        for _, name, result in session.results:
+            content.add_widget(MDLabel(
+                text=f"{name}: {result['total_score']} - {result['interpretation']['text']}",
+                font_style="Body",
+                role="medium",
+                theme_text_color="Custom",
+                text_color=self.get_color_from_name(result["interpretation"]["color"]),
+                adaptive_height=True
+            ))
+
+        status = f"{session.saved} assessments saved"
+        if session.failed:
+            status += f", {session.failed} could not be saved and are kept as drafts"
+        content.add_widget(MDLabel(
+            text=status,
+            font_style="Body",
+            role="small",
+            theme_text_color="Secondary",
+            adaptive_height=True
+        ))
+
+        self.result_dialog = MDDialog(
+            MDDialogHeadlineText(text=f"{session.scale.title}: Session Results"),
+            MDDialogContentContainer(content),
+            MDDialogButtonContainer(
+                MDButton(
+                    MDButtonText(text="Done"),
+                    style="text",
+                    on_release=lambda x: self.finish_assessment()
+                )
+            )
+        )
+        self.result_dialog.open()
+
+    def on_leave(self):
+        """Called when the screen is left; results of an unfinished session are kept."""
+        self.end_session()
+
     def finish_assessment(self):
         """Return to previous screen after completing assessment."""
         if self.result_dialog:
@@ -325,13 +635,9 @@ class DetailedAssessmentScreen(MDScreen):
         from kivymd.app import MDApp
         app = MDApp.get_running_app()
 
-        # Go back to assessments screen
+        # Go back to assessments screen; saved results are added to its list as they are written
         app.switch_screen('assessments')
 
-        # Refresh assessments list
-        assessments_screen = app.screen_manager.get_screen('assessments')
-        assessments_screen.load_assessments()
-
     def show_error_dialog(self, message):
         """Show error dialog with message."""
         self.dialog = MDDialog(
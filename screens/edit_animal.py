@@ -1,5 +1,4 @@
 import os
-import shutil
 from datetime import datetime
 from functools import partial
 
@@ -14,6 +13,9 @@ from kivymd.uix.pickers import MDModalDatePicker
 from kivymd.uix.screen import MDScreen
 
 import database
+from managers.image_store import image_store
+from managers.thumbnail_manager import thumbnail_manager
+from utils.async_image import PLACEHOLDER_IMAGE, PRIORITY_VISIBLE, image_loader
 
 
 class EditAnimalScreen(MDScreen):
@@ -87,13 +89,21 @@ class EditAnimalScreen(MDScreen):
         # Handle weight
         self.ids.animal_weight.text = str(animal[6])
 
-        # Handle image
+        # Handle image, previewing the detail-sized rendition
         if animal[7] and os.path.exists(animal[7]):
             self.original_image_path = animal[7]
-            self.ids.photo_preview.source = animal[7]
+            preview = thumbnail_manager.request(animal[7], "detail", partial(self.on_preview_ready, animal[7]))
+            image_loader.load(self.ids.photo_preview, preview or PLACEHOLDER_IMAGE, PRIORITY_VISIBLE)
         else:
             self.original_image_path = ""
-            self.ids.photo_preview.source = "assets/images/animal_placeholder.png"
+            image_loader.load(self.ids.photo_preview, PLACEHOLDER_IMAGE, PRIORITY_VISIBLE)
+
+    def on_preview_ready(self, image_path, path):
+        """Show a rendition that finished building in the background."""
+        # Don't overwrite a photo the user picked in the meantime, or show
+        # a late rendition of an animal that is no longer being edited
+        if not self.selected_image_path and self.original_image_path == image_path:
+            image_loader.load(self.ids.photo_preview, path, PRIORITY_VISIBLE)
 
     def show_species_menu(self):
         """Dropdown for selecting species."""
@@ -241,7 +251,7 @@ class EditAnimalScreen(MDScreen):
         self.selected_image_path = selected_file
 
         # Update the image preview
-        self.ids.photo_preview.source = selected_file
+        image_loader.load(self.ids.photo_preview, selected_file, PRIORITY_VISIBLE)
 
         # Close the file dialog
         if self.file_dialog:
@@ -327,7 +337,7 @@ class EditAnimalScreen(MDScreen):
 
         # Update with the new image
         self.selected_image_path = filename
-        self.ids.photo_preview.source = filename
+        image_loader.load(self.ids.photo_preview, filename, PRIORITY_VISIBLE)
 
         # Close the camera
         self.camera_dialog.dismiss()
@@ -360,20 +370,13 @@ class EditAnimalScreen(MDScreen):
         # Handle image updating
         image_save_path = self.original_image_path
         if self.selected_image_path and self.selected_image_path != self.original_image_path:
-            # Save new image in app directory
-            image_dir = "animal_images"
-            os.makedirs(image_dir, exist_ok=True)
-            image_save_path = os.path.join(image_dir, os.path.basename(self.selected_image_path))
-
-            # Delete old image if it exists and is not the default
-            if self.original_image_path and os.path.exists(self.original_image_path):
-                try:
-                    os.remove(self.original_image_path)
-                except OSError:
-                    pass  # Ignore errors when deleting old image
-
-            # Copy new image
-            shutil.copy(self.selected_image_path, image_save_path)
+            # Save new image in the content-addressed image store. The old
+            # image is collected later if no other animal still uses it.
+            try:
+                image_save_path = image_store.add(self.selected_image_path)
+            except OSError as e:
+                self.show_error(f"Could not save image: {e}")
+                return
 
         # Update the animal in database
         success = database.update_animal(
@@ -382,6 +385,10 @@ class EditAnimalScreen(MDScreen):
         )
 
         if success:
+            if image_save_path != self.original_image_path:
+                thumbnail_manager.generate_async(image_save_path)
+                image_store.collect_garbage_async()
+
             self.show_confirmation("Animal updated successfully!")
 
             # Get the app instance
@@ -6,17 +6,11 @@ from kivymd.uix.fitimage import FitImage
 from kivymd.uix.label import MDLabel
 from kivymd.uix.screen import MDScreen
 
+from scale_registry import registry
+from utils.async_image import image_loader
 
-class HomeScreen(MDScreen):
-    species_list = [
-        {"name": "Rat", "image": "assets/images/rat.png"},
-        {"name": "Mouse", "image": "assets/images/mouse.png"},
-        {"name": "Rabbit", "image": "assets/images/rabbit.png"},
-        {"name": "Goat", "image": "assets/images/goat.png"},
-        {"name": "Sheep", "image": "assets/images/sheep.png"},
-        {"name": "Pig", "image": "assets/images/pig.png"},
-    ]
 
+class HomeScreen(MDScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -25,7 +19,8 @@ class HomeScreen(MDScreen):
         grid = self.ids.species_grid
         grid.clear_widgets()
 
-        for species in self.species_list:
+        # Only the species index is read here; scale definitions load on first use
+        for species in registry.index().values():
             card = self.create_species_card(species["name"], species["image"])
             grid.add_widget(card)
 
@@ -40,19 +35,14 @@ class HomeScreen(MDScreen):
 
         box = MDBoxLayout(orientation="vertical")
 
-        try:
-            img = FitImage(
-                source=image,
-                size_hint_y=0.7,
-                # Update deprecated properties
-                fit_mode="contain"  # Instead of allow_stretch and keep_ratio
-            )
-        except Exception:
-            # Use a generic icon if the image file doesn't exist
-            img = MDBoxLayout(
-                size_hint_y=0.7,
-                md_bg_color=(0.8, 0.8, 0.8, 1)
-            )
+        img = FitImage(
+            size_hint_y=0.7,
+            # Update deprecated properties
+            fit_mode="contain"  # Instead of allow_stretch and keep_ratio
+        )
+        # Decode off the UI thread; visible cards are loaded first, and a
+        # missing file keeps the placeholder
+        image_loader.load(img, image)
         label = MDLabel(text=name, halign="center", size_hint_y=0.3)
 
         box.add_widget(img)
@@ -4,15 +4,32 @@ from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.button import MDButton, MDButtonText
 from kivymd.uix.dialog import MDDialog, MDDialogHeadlineText, MDDialogContentContainer, MDDialogButtonContainer
 from kivymd.uix.label import MDLabel
-from kivymd.uix.list import MDListItem, MDListItemHeadlineText, MDListItemSupportingText
+from kivymd.uix.list import (
+    MDList, MDListItem, MDListItemHeadlineText, MDListItemLeadingAvatar, MDListItemSupportingText
+)
 from kivymd.uix.menu import MDDropdownMenu
 from kivymd.uix.screen import MDScreen
+from kivymd.uix.scrollview import MDScrollView
 from kivymd.uix.selectioncontrol import MDCheckbox
 
-from managers.export_manager import ExportManager
+from managers.export_queue import export_queue
+from managers.image_store import image_store
+from managers.thumbnail_manager import thumbnail_manager
 import database
+from utils.async_image import PLACEHOLDER_IMAGE, image_loader
 from utils.long_press import LongPressDetector
 
+# Formats offered for exporting a selection: (format, title, description)
+EXPORT_FORMATS = (
+    ("pdf", "PDF", "One report per animal"),
+    ("csv", "CSV", "Details, weights and assessments per animal"),
+    ("csv_combined", "Combined CSV", "One file per table for all animals"),
+    ("zip", "ZIP", "PDFs and CSV tables in one bundle"),
+    ("ndjson", "NDJSON", "One JSON record per animal, gzip-compressed"),
+    ("sqlite", "SQLite", "Standalone database including images"),
+    ("cohort", "Cohort Report", "Summary statistics of the selected animals"),
+)
+
 class MyAnimalsScreen(MDScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -21,6 +38,7 @@ class MyAnimalsScreen(MDScreen):
         self.is_selection_mode = False
         self.export_dialog = None
         self.loading_dialog = None
+        self.loading_label = None
 
     def on_enter(self):
         self.load_species_list()
@@ -36,7 +54,7 @@ class MyAnimalsScreen(MDScreen):
 
         # Use the database query execution function with 'all' fetch mode
         animals = database.execute_query(
-            "SELECT id, name, species, breed FROM animals ORDER BY name",
+            "SELECT id, name, species, breed, image_path FROM animals ORDER BY name",
             fetch_mode='all'
         )
 
@@ -83,6 +101,8 @@ class MyAnimalsScreen(MDScreen):
         self.dialog.dismiss()
 
         if success:
+            # Remove the animal's image if nothing else references it
+            image_store.collect_garbage_async()
             self.load_animals()
             self.show_success_dialog("Animal deleted successfully!")
         else:
@@ -181,22 +201,27 @@ class MyAnimalsScreen(MDScreen):
             self.show_error_dialog("No animals selected.")
             return
 
+        # The formats are listed in the content, which scrolls on small screens;
+        # a row of buttons would not fit the dialog's width
+        formats = MDList()
+        for format_type, title, description in EXPORT_FORMATS:
+            formats.add_widget(MDListItem(
+                MDListItemHeadlineText(text=title),
+                MDListItemSupportingText(text=description),
+                on_release=lambda x, f=format_type: self.export_animals(f)
+            ))
+        format_view = MDScrollView(size_hint_y=None, height="320dp")
+        format_view.add_widget(formats)
+
         self.export_dialog = MDDialog(
             MDDialogHeadlineText(text="Export Options"),
             MDDialogContentContainer(
-                MDLabel(text=f"Export {len(self.selected_animals)} selected animal(s):")
+                MDLabel(text=f"Export {len(self.selected_animals)} selected animal(s):", adaptive_height=True),
+                format_view,
+                orientation="vertical",
+                spacing="8dp"
             ),
             MDDialogButtonContainer(
-                MDButton(
-                    MDButtonText(text="PDF"),
-                    style="text",
-                    on_release=lambda x: self.export_animals("pdf")
-                ),
-                MDButton(
-                    MDButtonText(text="CSV"),
-                    style="text",
-                    on_release=lambda x: self.export_animals("csv")
-                ),
                 MDButton(
                     MDButtonText(text="Cancel"),
                     style="text",
@@ -209,69 +234,63 @@ class MyAnimalsScreen(MDScreen):
         self.export_dialog.open()
 
     def export_animals(self, format_type):
-        """Export selected animals data in the selected format."""
+        """Queue an export of the selected animals in the selected format."""
         self.export_dialog.dismiss()
+        self.start_export_job(format_type, list(self.selected_animals),
+                              f"Exporting {len(self.selected_animals)} animals...")
+
+        # Exit selection mode; the job keeps running in the background
+        self.toggle_selection_mode()
+
+    def start_export_job(self, format_type, animal_ids, message):
+        """Submit an export job and show its progress."""
+        job_id = export_queue.submit(format_type, animal_ids, listener=self.on_export_progress)
+        if job_id is None:
+            self.show_error_dialog("Failed to start export")
+            return
+
+        self.show_loading_dialog(message, job_id)
+
+    def on_export_progress(self, progress):
+        """Receive job progress from a worker thread and forward it to the UI thread."""
+        from kivy.clock import Clock
+        Clock.schedule_once(lambda dt: self.update_export_progress(progress), 0)
+
+    def update_export_progress(self, progress):
+        """Show the progress or outcome of an export job."""
+        if not progress:
+            return
 
-        # Show loading indicator
-        self.show_loading_dialog(f"Exporting {len(self.selected_animals)} animals...")
-
-        # Run export in a separate thread to keep UI responsive
-        def export_thread():
-            export_manager = ExportManager()
-
-            try:
-                from kivy.clock import Clock
-                if format_type == "pdf":
-                    filenames = export_manager.export_multiple_animals_to_pdf(self.selected_animals)
-                    if filenames:
-                        # Limit the displayed filenames to 5 if there are more
-                        if len(filenames) > 5:
-                            displayed_files = [os.path.basename(f) for f in filenames[:5]]
-                            displayed_files.append(f"... and {len(filenames) - 5} more")
-                        else:
-                            displayed_files = [os.path.basename(f) for f in filenames]
-
-                        Clock.schedule_once(
-                            lambda dt: self.show_success_dialog(
-                                f"Exported {len(filenames)} animals to PDF:\n{', '.join(displayed_files)}"), 0
-                        )
-                    else:
-                        Clock.schedule_once(
-                            lambda dt: self.show_error_dialog("Failed to export animal data"), 0
-                        )
-                elif format_type == "csv":
-                    filenames = export_manager.export_multiple_animals_to_csv(self.selected_animals)
-                    if filenames:
-                        # Limit the displayed filenames to 5 if there are more
-                        if len(filenames) > 5:
-                            displayed_files = [os.path.basename(f) for f in filenames[:5]]
-                            displayed_files.append(f"... and {len(filenames) - 5} more")
-                        else:
-                            displayed_files = [os.path.basename(f) for f in filenames]
-
-                        Clock.schedule_once(
-                            lambda dt: self.show_success_dialog(
-                                f"Exported to {len(filenames)} CSV files:\n{', '.join(displayed_files)}"), 0
-                        )
-                    else:
-                        Clock.schedule_once(
-                            lambda dt: self.show_error_dialog("Failed to export animal data"), 0
-                        )
-
-                # Exit selection mode after export - must also be scheduled
-                Clock.schedule_once(lambda dt: self.toggle_selection_mode(), 0.6)
-            finally:
-                # Dismiss loading dialog
-                Clock.schedule_once(lambda dt: self.loading_dialog.dismiss(), 0.5)
-
-        # Start the export thread
-        from threading import Thread
-        thread = Thread(target=export_thread)
-        thread.daemon = True
-        thread.start()
-
-    def show_loading_dialog(self, message):
-        """Show a loading dialog."""
+        if progress["status"] in ("queued", "running"):
+            if self.loading_label:
+                self.loading_label.text = f"Exporting... {progress['done']} of {progress['total']} done"
+            return
+
+        if self.loading_dialog:
+            self.loading_dialog.dismiss()
+
+        outputs = progress["outputs"]
+        # Limit the displayed filenames to 5 if there are more
+        displayed_files = [os.path.basename(f) for f in outputs[:5]]
+        if len(outputs) > 5:
+            displayed_files.append(f"... and {len(outputs) - 5} more")
+
+        if progress["status"] == "done":
+            self.show_success_dialog(f"Exported to {len(outputs)} file(s):\n{', '.join(displayed_files)}")
+        elif progress["status"] == "cancelled":
+            self.show_success_dialog(
+                f"Export cancelled after {progress['done']} of {progress['total']} animals.")
+        else:
+            self.show_error_dialog("Failed to export animal data")
+
+    def cancel_export(self, job_id):
+        """Cancel a running export job."""
+        export_queue.cancel(job_id)
+        if self.loading_label:
+            self.loading_label.text = "Cancelling..."
+
+    def show_loading_dialog(self, message, job_id=None):
+        """Show a loading dialog, with a cancel button for export jobs."""
         from kivymd.uix.progressindicator import MDCircularProgressIndicator
         from kivymd.uix.dialog import MDDialog, MDDialogHeadlineText, MDDialogContentContainer
 
@@ -293,16 +312,28 @@ class MyAnimalsScreen(MDScreen):
         content.add_widget(spinner_box)
 
         # Add message
-        content.add_widget(MDLabel(
+        self.loading_label = MDLabel(
             text=message,
             halign="center",
             adaptive_height=True
-        ))
+        )
+        content.add_widget(self.loading_label)
+
+        buttons = []
+        if job_id is not None:
+            buttons.append(MDDialogButtonContainer(
+                MDButton(
+                    MDButtonText(text="Cancel"),
+                    style="text",
+                    on_release=lambda x: self.cancel_export(job_id)
+                )
+            ))
 
         # Create the dialog with proper structure
         self.loading_dialog = MDDialog(
             MDDialogHeadlineText(text="Please Wait"),
             MDDialogContentContainer(content),
+            *buttons,
             auto_dismiss=False
         )
         self.loading_dialog.open()
@@ -390,46 +421,7 @@ class MyAnimalsScreen(MDScreen):
         if hasattr(self, 'animal_options_dialog') and self.animal_options_dialog:
             self.animal_options_dialog.dismiss()
 
-        # Show loading indicator
-        self.show_loading_dialog("Exporting...")
-
-        # Run export in a separate thread to keep UI responsive
-        def export_thread():
-            export_manager = ExportManager()
-
-            try:
-                from kivy.clock import Clock
-                if format_type == "pdf":
-                    filename = export_manager.export_animal_to_pdf(animal_id)
-                    if filename:
-                        # Schedule UI update on main thread
-                        Clock.schedule_once(
-                            lambda dt: self.show_success_dialog(f"Exported to PDF:\n{os.path.basename(filename)}"), 0
-                        )
-                    else:
-                        Clock.schedule_once(
-                            lambda dt: self.show_error_dialog("Failed to export animal data"), 0
-                        )
-                elif format_type == "csv":
-                    filenames = export_manager.export_animal_to_csv(animal_id)
-                    if filenames:
-                        Clock.schedule_once(
-                            lambda dt: self.show_success_dialog(
-                                f"Exported to CSV files:\n{', '.join([os.path.basename(f) for f in filenames])}"), 0
-                        )
-                    else:
-                        Clock.schedule_once(
-                            lambda dt: self.show_error_dialog("Failed to export animal data"), 0
-                        )
-            finally:
-                # Dismiss loading dialog
-                Clock.schedule_once(lambda dt: self.loading_dialog.dismiss(), 0.5)
-
-        # Start the export thread
-        from threading import Thread
-        thread = Thread(target=export_thread)
-        thread.daemon = True
-        thread.start()
+        self.start_export_job(format_type, [animal_id], "Exporting...")
 
     def load_species_list(self):
         """Load list of species for filtering."""
@@ -474,7 +466,7 @@ class MyAnimalsScreen(MDScreen):
         species_filter = self.ids.species_filter.text
 
         # Build query conditions
-        query = "SELECT id, name, species, breed FROM animals"
+        query = "SELECT id, name, species, breed, image_path FROM animals"
         params = []
         conditions = []
 
@@ -505,6 +497,15 @@ class MyAnimalsScreen(MDScreen):
         self.ids.species_filter.text = ""
         self.load_animals()  # or self.load_assessments() for the assessments screen
 
+    def show_animal_icon(self, avatar, image_path):
+        """Show the icon rendition of an animal's photo, building it in the background if needed."""
+        if not image_path or not os.path.exists(image_path):
+            image_loader.load(avatar, PLACEHOLDER_IMAGE)
+            return
+
+        path = thumbnail_manager.request(image_path, "icon", lambda ready: image_loader.load(avatar, ready))
+        image_loader.load(avatar, path or PLACEHOLDER_IMAGE)
+
     def update_animals_list(self, animals):
         """Update the list display with filtered animals."""
         self.ids.animals_list.clear_widgets()
@@ -536,6 +537,11 @@ class MyAnimalsScreen(MDScreen):
                 checkbox.bind(active=lambda cb, value, aid=animal_id: self.on_animal_select(aid, value))
                 item.add_widget(checkbox)
 
+            # Photo as a small icon; only the icon rendition is decoded
+            avatar = MDListItemLeadingAvatar()
+            item.add_widget(avatar)
+            self.show_animal_icon(avatar, animal[4])
+
             # Add headline text (name and species)
             item.add_widget(MDListItemHeadlineText(text=f"{animal[1]} ({animal[2]})"))
 
@@ -5,154 +5,11 @@ from kivymd.uix.card import MDCard
 from kivymd.uix.label import MDLabel
 from kivymd.uix.screen import MDScreen
 
+from scale_registry import registry
+from utils.async_image import PLACEHOLDER_IMAGE, PRIORITY_VISIBLE, image_loader
 
-class SpeciesDetailScreen(MDScreen):
-    species_data = {
-        "Rat": {
-            "image": "assets/images/rat.png",
-            "assessment_scales": [
-                {
-                    "name": "Body Condition Score",
-                    "description": "Evaluates body fat and muscle mass on a 1-5 scale"
-                },
-                {
-                    "name": "Grimace Scale",
-                    "description": "Assesses pain by evaluating facial expressions"
-                },
-                {
-                    "name": "Activity Score",
-                    "description": "Evaluates general activity level and behavior"
-                }
-            ],
-            "manuals": [
-                {"title": "Rat Housing and Care Guide", "link": "https://www.nc3rs.org.uk/rat-housing-and-husbandry"},
-                {"title": "Rat Grimace Scale Manual", "link": "https://www.nc3rs.org.uk/rat-grimace-scale"}
-            ],
-            "videos": [
-                {"title": "Proper Rat Handling", "url": "https://www.youtube.com/watch?v=jIGKgZPMYxI"},
-                {"title": "Rat Grimace Scale Guide", "url": "https://youtu.be/r7-XqOsAROE"}
-            ],
-        },
-        "Mouse": {
-            "image": "assets/images/mouse.png",
-            "assessment_scales": [
-                {
-                    "name": "Mouse Grimace Scale",
-                    "description": "Assesses pain by facial expressions on a 0-2 scale for each feature"
-                },
-                {
-                    "name": "Body Condition Score",
-                    "description": "Evaluates body fat and muscle mass on a 1-5 scale"
-                },
-                {
-                    "name": "Activity Level",
-                    "description": "Evaluates general behavior and activity patterns"
-                }
-            ],
-            "manuals": [
-                {"title": "Mouse Housing Guide", "link": "https://www.nc3rs.org.uk/mouse-housing-and-husbandry"},
-                {"title": "Mouse Grimace Scale Manual", "link": "https://www.nc3rs.org.uk/mouse-grimace-scale"}
-            ],
-            "videos": [
-                {"title": "Mouse Handling Techniques", "url": "https://youtu.be/PIkjMmXE3bg"},
-                {"title": "Mouse Grimace Scale Demonstration", "url": "https://youtu.be/LvTWnBo62Sk"}
-            ],
-        },
-        "Rabbit": {
-            "image": "assets/images/rabbit.png",
-            "assessment_scales": [
-                {
-                    "name": "Rabbit Grimace Scale",
-                    "description": "Assesses pain by facial expressions on a 0-2 scale for each feature"
-                },
-                {
-                    "name": "Body Condition Score",
-                    "description": "Evaluates body fat and muscle mass on a 1-5 scale"
-                },
-                {
-                    "name": "Wellness Score",
-                    "description": "Evaluates general health and wellness"
-                }
-            ],
-            "manuals": [
-                {"title": "Rabbit Housing Guide", "link": "https://www.nc3rs.org.uk/rabbit-housing-and-husbandry"},
-                {"title": "Rabbit Grimace Scale Manual", "link": "https://www.nc3rs.org.uk/rabbit-grimace-scale"}
-            ],
-            "videos": [
-                {"title": "Rabbit Handling Techniques", "url": "https://youtu.be/example-rabbit"}
-            ],
-        },
-        "Goat": {
-            "image": "assets/images/goat.png",
-            "assessment_scales": [
-                {
-                    "name": "FAMACHA Score",
-                    "description": "Evaluates anemia based on lower eyelid membrane color"
-                },
-                {
-                    "name": "Body Condition Score",
-                    "description": "Evaluates fat cover and muscle mass on a 1-5 scale"
-                },
-                {
-                    "name": "Pain Scale",
-                    "description": "Assesses pain through behavioral indicators"
-                }
-            ],
-            "manuals": [
-                {"title": "Goat Care Guide", "link": "https://www.example.com/goat-care"}
-            ],
-            "videos": [
-                {"title": "Goat Health Assessment", "url": "https://youtu.be/example-goat"}
-            ],
-        },
-        "Sheep": {
-            "image": "assets/images/sheep.png",
-            "assessment_scales": [
-                {
-                    "name": "FAMACHA Score",
-                    "description": "Evaluates anemia based on lower eyelid membrane color"
-                },
-                {
-                    "name": "Body Condition Score",
-                    "description": "Evaluates fat cover and muscle mass on a 1-5 scale"
-                },
-                {
-                    "name": "Lameness Score",
-                    "description": "Evaluates degree of lameness on a 0-3 scale"
-                }
-            ],
-            "manuals": [
-                {"title": "Sheep Care Guide", "link": "https://www.example.com/sheep-care"}
-            ],
-            "videos": [
-                {"title": "Sheep Health Assessment", "url": "https://youtu.be/example-sheep"}
-            ],
-        },
-        "Pig": {
-            "image": "assets/images/pig.png",
-            "assessment_scales": [
-                {
-                    "name": "Body Condition Score",
-                    "description": "Evaluates fat cover and condition on a 1-5 scale"
-                },
-                {
-                    "name": "Lameness Score",
-                    "description": "Evaluates mobility on a 0-5 scale"
-                },
-                {
-                    "name": "Welfare Assessment",
-                    "description": "Evaluates overall welfare status"
-                }
-            ],
-            "manuals": [
-                {"title": "Pig Care Guide", "link": "https://www.example.com/pig-care"}
-            ],
-            "videos": [
-                {"title": "Pig Health Assessment", "url": "https://youtu.be/example-pig"}
-            ],
-        },
-    }
 
+class SpeciesDetailScreen(MDScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.dialog = None
@@ -167,20 +24,14 @@ class SpeciesDetailScreen(MDScreen):
         self.ids.species_title.text = str(species_name)
 
         # Provide default empty lists if species is missing
-        data = self.species_data.get(species_name, {
+        data = registry.species_info(species_name) or {
             "image": "assets/images/animal_placeholder.png",
-            "assessment_scales": [],
             "manuals": [],
             "videos": []
-        })
+        }
 
-        # Set species image with safe image loading
-        try:
-            self.ids.species_image.source = data.get("image", "assets/images/animal_placeholder.png")
-        except Exception as e:
-            # Log the error and fallback to placeholder
-            print(f"Error loading image for {species_name}: {e}")
-            self.ids.species_image.source = "assets/images/animal_placeholder.png"
+        # Set species image, decoded off the UI thread
+        image_loader.load(self.ids.species_image, data.get("image", PLACEHOLDER_IMAGE), PRIORITY_VISIBLE)
 
         # Clear existing widgets before adding new ones
         self.ids.assessment_list.clear_widgets()
@@ -188,7 +39,9 @@ class SpeciesDetailScreen(MDScreen):
         self.ids.video_list.clear_widgets()
 
         # Add assessment scales
-        self._add_assessment_scales(data["assessment_scales"])
+        self._add_assessment_scales([
+            registry.get_scale(species_name, name) for name in registry.scale_names(species_name)
+        ])
 
         # Add manuals
         self._add_manuals(data["manuals"])
@@ -228,7 +81,7 @@ class SpeciesDetailScreen(MDScreen):
             )
 
             title_label = MDLabel(
-                text=scale["name"],
+                text=scale.name,
                 font_style="Title",
                 role="small",
                 bold=True,
@@ -248,7 +101,7 @@ class SpeciesDetailScreen(MDScreen):
             )
 
             desc_label = MDLabel(
-                text=scale["description"],
+                text=scale.description,
                 font_style="Body",
                 role="small",
                 halign="center",
@@ -0,0 +1,240 @@
+"""
+Asynchronous image loading for list and detail screens.
+
+Image files are decoded by background worker threads taking requests from a
+priority queue, with images of widgets on screen ahead of the rest. Decoded
+images are uploaded as textures on the main thread, as GL calls must happen
+there, and kept in a least-recently-used cache with a memory budget, so
+scrolling back to an image does not decode it again.
+"""
+from collections import OrderedDict
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition, Thread
+from weakref import WeakKeyDictionary, WeakSet
+
+from kivy.clock import Clock
+from kivy.core.image import Image as CoreImage, ImageLoader
+from kivy.logger import Logger
+from kivy.uix.scrollview import ScrollView
+
+PLACEHOLDER_IMAGE = "assets/images/animal_placeholder.png"
+
+# Lower numbers are decoded first
+PRIORITY_VISIBLE = 0
+PRIORITY_NORMAL = 1
+PRIORITY_PREFETCH = 2
+
+
+class TextureCache:
+    """Least-recently-used cache of decoded textures with a memory budget."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """
+        Initialize the texture cache.
+
+        Args:
+            max_bytes: Approximate GPU memory budget for cached textures
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.textures = OrderedDict()
+
+    @staticmethod
+    def texture_size(texture):
+        """Approximate memory used by a texture, assuming 4 bytes per pixel."""
+        return texture.width * texture.height * 4
+
+    def get(self, source):
+        """Return the cached texture for a source and mark it recently used."""
+        texture = self.textures.get(source)
+        if texture is not None:
+            self.textures.move_to_end(source)
+        return texture
+
+    def put(self, source, texture):
+        """Add a texture, evicting the least recently used ones over budget."""
+        if source in self.textures:
+            self.current_bytes -= self.texture_size(self.textures.pop(source))
+
+        self.textures[source] = texture
+        self.current_bytes += self.texture_size(texture)
+
+        # Always keep the newest texture, even if it alone exceeds the budget
+        while self.current_bytes > self.max_bytes and len(self.textures) > 1:
+            _, evicted = self.textures.popitem(last=False)
+            self.current_bytes -= self.texture_size(evicted)
+
+    def discard(self, source):
+        """Remove a texture from the cache."""
+        texture = self.textures.pop(source, None)
+        if texture is not None:
+            self.current_bytes -= self.texture_size(texture)
+
+
+class AsyncImageLoader:
+    """
+    Decodes images off the UI thread and swaps them into Image widgets.
+
+    A widget first shows the placeholder texture; once its image has been
+    decoded in a worker thread the texture is uploaded on the main thread and
+    assigned to the widget. Pending requests for widgets that are currently
+    on screen are decoded before everything else; priorities are updated
+    again whenever a scroll view holding a waiting widget scrolls.
+    """
+
+    def __init__(self, cache=None, placeholder=PLACEHOLDER_IMAGE, num_workers=2):
+        """
+        Initialize the loader.
+
+        Args:
+            cache: Shared TextureCache, created if not given
+            placeholder: Image shown while the real image is loading
+            num_workers: Number of decoding threads
+        """
+        self.cache = cache or TextureCache()
+        self.placeholder = placeholder
+        self.placeholder_texture = None
+        self.num_workers = num_workers
+
+        # Widget -> source it should end up showing
+        self.targets = WeakKeyDictionary()
+        # Source -> current priority of its queued decode job
+        self.queued = {}
+        self.queue = []
+        self.sequence = count()
+        self.condition = Condition()
+        self.workers = []
+
+        # Scroll views whose scrolling re-runs update_priorities()
+        self.watched_scroll_views = WeakSet()
+        self.trigger_reprioritize = Clock.create_trigger(self.update_priorities)
+
+    def load(self, widget, source, priority=PRIORITY_NORMAL):
+        """
+        Show an image in a widget without blocking the frame.
+
+        Args:
+            widget: Kivy Image (or FitImage) that should display the image
+            source: Path of the image file; empty clears the widget
+            priority: Decode priority; visible widgets are promoted automatically
+        """
+        if not source:
+            self.targets.pop(widget, None)
+            self.set_texture(widget, None)
+            return
+
+        self.targets[widget] = source
+
+        texture = self.cache.get(source)
+        if texture is not None:
+            self.set_texture(widget, texture)
+            return
+
+        self.set_texture(widget, self.get_placeholder_texture())
+        self.enqueue(source, priority)
+        self.trigger_reprioritize()
+
+    def get_placeholder_texture(self):
+        """Return the placeholder texture, loading it once."""
+        if self.placeholder_texture is None and self.placeholder:
+            try:
+                self.placeholder_texture = CoreImage(self.placeholder).texture
+            except Exception as e:
+                Logger.warning(f"AsyncImageLoader: could not load placeholder: {e}")
+        return self.placeholder_texture
+
+    @staticmethod
+    def set_texture(widget, texture):
+        """Assign a texture directly, bypassing the widget's own loading."""
+        if widget.source:
+            widget.source = ""
+        widget.texture = texture
+
+    def is_visible(self, widget):
+        """Check whether a widget is attached to the window and on screen."""
+        from kivy.core.window import Window
+
+        if widget.get_parent_window() is None:
+            return False
+        x, y = widget.to_window(widget.x, widget.y)
+        return x < Window.width and y < Window.height and x + widget.width > 0 and y + widget.height > 0
+
+    def update_priorities(self, *args):
+        """Promote queued images whose widgets are currently visible."""
+        for widget, source in list(self.targets.items()):
+            if source in self.queued and self.queued[source] > PRIORITY_VISIBLE:
+                self.watch_scrolling(widget)
+                if self.is_visible(widget):
+                    self.enqueue(source, PRIORITY_VISIBLE)
+
+    def watch_scrolling(self, widget):
+        """Re-run update_priorities() when a scroll view containing the widget scrolls."""
+        parent = widget.parent
+        while parent is not None:
+            if isinstance(parent, ScrollView) and parent not in self.watched_scroll_views:
+                parent.bind(scroll_x=self.trigger_reprioritize, scroll_y=self.trigger_reprioritize)
+                self.watched_scroll_views.add(parent)
+            parent = parent.parent
+
+    def enqueue(self, source, priority):
+        """Queue a decode job, or raise the priority of an existing one."""
+        with self.condition:
+            current = self.queued.get(source)
+            if current is not None and current <= priority:
+                return
+
+            # Superseded heap entries are skipped when popped
+            self.queued[source] = priority
+            heappush(self.queue, (priority, next(self.sequence), source))
+            self.condition.notify()
+
+        self.start_workers()
+
+    def start_workers(self):
+        """Start the decoding threads on first use."""
+        if self.workers:
+            return
+        for i in range(self.num_workers):
+            worker = Thread(target=self.run_worker, name=f"image-loader-{i}")
+            worker.daemon = True
+            worker.start()
+            self.workers.append(worker)
+
+    def next_job(self):
+        """Block until a decode job is available and return its source."""
+        with self.condition:
+            while True:
+                while not self.queue:
+                    self.condition.wait()
+                priority, _, source = heappop(self.queue)
+                if self.queued.get(source) == priority:
+                    del self.queued[source]
+                    return source
+
+    def run_worker(self):
+        """Decode queued images and hand them to the main thread."""
+        while True:
+            source = self.next_job()
+            try:
+                image = ImageLoader.load(source, keep_data=True, nocache=True)
+            except Exception as e:
+                Logger.warning(f"AsyncImageLoader: failed to load {source}: {e}")
+                continue
+            Clock.schedule_once(lambda dt, s=source, img=image: self.deliver(s, img), 0)
+
+    def deliver(self, source, image):
+        """Upload a decoded image and swap it into every widget waiting for it."""
+        # Creating the texture must happen on the main (GL) thread
+        texture = image.texture
+        if texture is None:
+            return
+
+        self.cache.put(source, texture)
+        for widget, wanted in list(self.targets.items()):
+            if wanted == source:
+                self.set_texture(widget, texture)
+
+
+# Shared loader so all screens use the same texture cache
+image_loader = AsyncImageLoader()
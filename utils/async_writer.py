@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from itertools import count
+from threading import Condition, Thread
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+
+class AsyncWriter:
+    """
+    Runs database writes on a single background thread, in submission order.
+
+    Writes submitted with a key replace a queued write with the same key that
+    has not started yet, so a record updated many times in quick succession
+    (e.g. a draft saved on every answer) is written once with its latest
+    state. Completion callbacks run on the main thread.
+    """
+
+    def __init__(self):
+        # Key -> (function, args, callback) of writes that have not started
+        self.pending = OrderedDict()
+        self.sequence = count()
+        self.condition = Condition()
+        self.busy = False
+        self.worker = None
+
+    def submit(self, func, *args, key=None, callback=None):
+        """
+        Queue a write.
+
+        Args:
+            func: Function performing the write, e.g. a database helper
+            *args: Arguments passed to func
+            key: Optional key; a queued write with the same key is dropped
+                and this one is run in its place, after earlier writes
+            callback: Optional function called on the main thread with the
+                return value of func, or None if it raised
+        """
+        with self.condition:
+            if key is None:
+                key = ("write", next(self.sequence))
+            self.pending.pop(key, None)
+            self.pending[key] = (func, args, callback)
+            self.condition.notify_all()
+
+        self.start_worker()
+
+    def start_worker(self):
+        """Start the writer thread on first use."""
+        if self.worker:
+            return
+        self.worker = Thread(target=self.run_worker, name="async-writer")
+        self.worker.daemon = True
+        self.worker.start()
+
+    def run_worker(self):
+        """Run queued writes one at a time."""
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.busy = False
+                    self.condition.notify_all()
+                    self.condition.wait()
+                _, (func, args, callback) = self.pending.popitem(last=False)
+                self.busy = True
+
+            try:
+                result = func(*args)
+            except Exception as e:
+                Logger.error(f"AsyncWriter: write failed: {e}")
+                result = None
+
+            if callback:
+                Clock.schedule_once(lambda dt, cb=callback, r=result: cb(r), 0)
+
+    def flush(self, timeout=None):
+        """
+        Wait until all queued writes have finished.
+
+        Returns:
+            bool: True if the queue drained, False if the timeout expired
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.pending and not self.busy, timeout)
+
+
+# Shared writer used by the screens
+db_writer = AsyncWriter()
@@ -0,0 +1,146 @@
+"""
+Series reduction for weight charts.
+
+Charts plot weights against a real time axis (days since 0001-01-01, as
+returned by date.toordinal()) and reduce long histories with the
+Largest-Triangle-Three-Buckets algorithm, which keeps the visual shape of
+the series (peaks and dips) while drawing a fixed number of points. Both the
+PDF export and the Kivy graph use these helpers so they show the same data.
+"""
+from datetime import date, datetime
+
+# Formats dates are stored in: ISO for history rows, DD.MM.YYYY for older input
+DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y")
+
+# Points drawn per series; enough to look continuous at chart sizes
+DEFAULT_MAX_POINTS = 500
+
+
+def parse_date(value):
+    """
+    Parse a stored date string.
+
+    Returns:
+        date: The parsed date, or None if the value is not a known format
+    """
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def day_number(value):
+    """Return the x coordinate of a stored date string, or None if unparsable."""
+    parsed = parse_date(value)
+    return parsed.toordinal() if parsed else None
+
+
+def format_day(x, date_format="%d.%m.%y"):
+    """Format an x coordinate produced by day_number() as a date label."""
+    return date.fromordinal(int(round(x))).strftime(date_format)
+
+
+def time_series(rows):
+    """
+    Convert (date, value) rows into (day, value) points.
+
+    Rows whose date cannot be parsed are skipped. Rows may be any iterable,
+    e.g. a streaming database cursor, and should be in date order.
+
+    Returns:
+        list: (x, y) tuples with x from day_number()
+    """
+    points = []
+    for date_text, value in rows:
+        x = day_number(date_text)
+        if x is not None and value is not None:
+            points.append((x, float(value)))
+    return points
+
+
+def lttb(points, threshold):
+    """
+    Downsample a series with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The points in between are
+    split into threshold - 2 buckets, and from each bucket the point forming
+    the largest triangle with the previously kept point and the average of
+    the next bucket is kept. Runs in linear time.
+
+    Args:
+        points: (x, y) tuples ordered by x
+        threshold: Maximum number of points to return
+
+    Returns:
+        list: At most `threshold` points from the input, in order
+    """
+    count = len(points)
+    if threshold >= count or threshold < 3:
+        return list(points)
+
+    sampled = [points[0]]
+    bucket_size = (count - 2) / (threshold - 2)
+    previous = 0
+
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        # Average of the next bucket; the last bucket looks at the final point
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        next_points = points[next_start:next_end] or points[-1:]
+        avg_x = sum(x for x, _ in next_points) / len(next_points)
+        avg_y = sum(y for _, y in next_points) / len(next_points)
+
+        prev_x, prev_y = points[previous]
+        best_area = -1.0
+        best_index = start
+        for index in range(start, end):
+            x, y = points[index]
+            area = abs((prev_x - avg_x) * (y - prev_y) - (prev_x - x) * (avg_y - prev_y))
+            if area > best_area:
+                best_area = area
+                best_index = index
+
+        sampled.append(points[best_index])
+        previous = best_index
+
+    sampled.append(points[-1])
+    return sampled
+
+
+def downsample_series(rows, max_points=DEFAULT_MAX_POINTS):
+    """
+    Turn (date, value) rows into at most `max_points` time-scaled points.
+
+    Args:
+        rows: Iterable of (date string, value) in date order
+        max_points: Maximum number of points to return
+
+    Returns:
+        list: (x, y) tuples with x from day_number()
+    """
+    return lttb(time_series(rows), max_points)
+
+
+def time_axis(points, ticks=5):
+    """
+    Compute the x range and tick spacing for a time-scaled chart.
+
+    Args:
+        points: (x, y) tuples as returned by downsample_series()
+        ticks: Approximate number of intervals between major ticks
+
+    Returns:
+        tuple: (xmin, xmax, step) with xmax > xmin and step of at least one day
+    """
+    xmin = min(x for x, _ in points)
+    xmax = max(x for x, _ in points)
+    if xmax <= xmin:
+        # A single day still needs a non-empty axis
+        xmax = xmin + 1
+    step = max(1, round((xmax - xmin) / ticks))
+    return xmin, xmax, step